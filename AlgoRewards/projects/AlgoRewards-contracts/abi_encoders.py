@@ -0,0 +1,398 @@
+"""
+Precompiled ABI encoders for AlgoRewardsContract methods.
+
+The typed client encodes every call dynamically. It converts the args
+(dataclasses.asdict), looks the method up by signature in the ARC-56
+spec, parses its ABI types and hashes the signature into a selector.
+On the minter and backend hot path that reflection repeats for every
+claim.
+
+`python -m smart_contracts build` calls write_encoders to generate
+<contract>_encoders.py next to the generated client. It holds one
+function per method that returns the app args directly: the 4-byte
+selector is a constant, and strings, integers, addresses and arrays are
+packed with plain bytes operations. Only types without a fixed layout
+fall back to algosdk's ABI codec. Return values are decoded the same
+way from the call's last log.
+
+    args = encode_claim_badge(session_id, recipient)
+    algorand.send.app_call(AppCallParams(app_id=..., sender=..., args=args, ...))
+
+Usage:
+    python abi_encoders.py generate [--spec PATH] [--out PATH]
+    python abi_encoders.py bench [--spec PATH] [--iterations N]
+"""
+
+import argparse
+import hashlib
+import json
+import keyword
+import re
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+APP_SPEC = (
+    Path(__file__).parent / "smart_contracts" / "artifacts" / "algo_rewards_contract"
+    / "AlgoRewardsContract.arc56.json"
+)
+
+# ARC-4: arguments past the 15th are packed into one tuple; not generated
+MAX_APP_ARGS = 15
+REFERENCE_TYPES = ("account", "asset", "application")
+TRANSACTION_TYPES = ("txn", "pay", "keyreg", "acfg", "axfer", "afrz", "appl")
+
+_UINT = re.compile(r"^uint(\d+)$")
+_STATIC_ARRAY = re.compile(r"^(.+)\[(\d+)\]$")
+
+_HEADER = '''# This file was generated from {spec} by abi_encoders.py
+# during `python -m smart_contracts build`. DO NOT MODIFY IT BY HAND.
+"""Precompiled ABI encoders for {name}: app args per method, no runtime method lookup"""
+
+import functools
+import hashlib
+
+from algosdk.encoding import decode_address, encode_address
+
+# ARC-4 prefix of a method's return value log
+RETURN_PREFIX = b"\\x15\\x1f\\x7c\\x75"
+
+# RFC 4648 base32 alphabet -> int(..., 32) digits
+_BASE32_DIGITS = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", "0123456789abcdefghijklmnopqrstuv")
+
+
+def _string(value: str) -> bytes:
+    data = value.encode()
+    return len(data).to_bytes(2, "big") + data
+
+
+def _address(value: str | bytes) -> bytes:
+    if isinstance(value, bytes) and len(value) == 32:
+        return value
+    # 58 base32 characters are 290 bits: public key, 4-byte checksum, 2 zero bits
+    try:
+        if len(value) == 58:
+            decoded = (int(value.translate(_BASE32_DIGITS), 32) >> 2).to_bytes(36, "big")
+            if hashlib.new("sha512_256", decoded[:32]).digest()[-4:] == decoded[32:]:
+                return decoded[:32]
+    except ValueError:
+        pass
+    # Malformed, or no sha512_256 in this OpenSSL: algosdk decodes or raises as usual
+    return decode_address(value)
+
+
+def _fixed(value: bytes, length: int) -> bytes:
+    if len(value) != length:
+        raise ValueError(f"Expected {{length}} bytes, got {{len(value)}}")
+    return bytes(value)
+
+
+@functools.cache
+def _abi_type(type_string: str):
+    from algosdk import abi
+
+    return abi.ABIType.from_string(type_string)
+
+
+def _returned(log: bytes) -> bytes:
+    if not log.startswith(RETURN_PREFIX):
+        raise ValueError("Log is not an ARC-4 return value")
+    return log[4:]
+'''
+
+
+# --------------------------- ABI types --------------------------- #
+
+def method_signature(method: Dict[str, Any]) -> str:
+    """ABI signature of an ARC-56 method entry"""
+    arg_types = ",".join(arg["type"] for arg in method["args"])
+    return f"{method['name']}({arg_types}){method['returns']['type']}"
+
+
+def method_selector(signature: str) -> bytes:
+    """First 4 bytes of sha512/256 over the signature"""
+    return hashlib.new("sha512_256", signature.encode()).digest()[:4]
+
+
+def split_tuple(type_string: str) -> List[str]:
+    """Component types of "(a,b,(c,d))" -> ["a", "b", "(c,d)"]"""
+    inner, parts, depth, start = type_string[1:-1], [], 0, 0
+    for index, char in enumerate(inner):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(inner[start:index])
+            start = index + 1
+    if inner:
+        parts.append(inner[start:])
+    return parts
+
+
+def is_tuple(type_string: str) -> bool:
+    return type_string.startswith("(") and type_string.endswith(")")
+
+
+def static_size(type_string: str) -> Optional[int]:
+    """
+    Encoded size of a type without dynamic parts, None otherwise
+
+    bool is left out: consecutive bools share a byte inside tuples and
+    arrays, which the generated code does not reproduce.
+    """
+    uint = _UINT.match(type_string)
+    if uint:
+        return int(uint[1]) // 8
+    if type_string == "byte":
+        return 1
+    if type_string == "address":
+        return 32
+    array = _STATIC_ARRAY.match(type_string)
+    if array:
+        element = static_size(array[1])
+        return element * int(array[2]) if element is not None else None
+    if is_tuple(type_string):
+        sizes = [static_size(part) for part in split_tuple(type_string)]
+        return sum(sizes) if sizes and None not in sizes else None
+    return None
+
+
+# --------------------------- Code generation --------------------------- #
+
+def encode_expr(type_string: str, value: str) -> str:
+    """Python expression packing `value` as type_string"""
+    if type_string == "string":
+        return f"_string({value})"
+    if type_string == "bool":
+        return f'(b"\\x80" if {value} else b"\\x00")'
+    if type_string == "byte":
+        return f"bytes(({value},))"
+    if type_string == "address":
+        return f"_address({value})"
+    if type_string in REFERENCE_TYPES:
+        # Index into the call's foreign accounts/assets/apps array
+        return f"{value}.to_bytes(1, 'big')"
+    uint = _UINT.match(type_string)
+    if uint:
+        return f"{value}.to_bytes({int(uint[1]) // 8}, 'big')"
+
+    array = _STATIC_ARRAY.match(type_string)
+    if array and array[1] == "byte":
+        return f"_fixed({value}, {array[2]})"
+    if type_string.endswith("[]") and "item" not in value:
+        element = type_string[:-2]
+        if static_size(element) is not None:
+            return (f"len({value}).to_bytes(2, 'big') + "
+                    f"b\"\".join({encode_expr(element, 'item')} for item in {value})")
+    if is_tuple(type_string) and static_size(type_string) is not None:
+        fields = [encode_expr(part, f"{value}[{index}]") for index, part in enumerate(split_tuple(type_string))]
+        return "b\"\".join((" + ", ".join(fields) + ",))"
+    return f"_abi_type({type_string!r}).encode({value})"
+
+
+def decode_expr(type_string: str, data: str) -> str:
+    """Python expression decoding `data` (bytes of exactly type_string) into a value"""
+    if type_string == "string":
+        return f"{data}[2:].decode()"
+    if type_string == "bool":
+        return f"bool({data}[0] & 0x80)"
+    if type_string == "byte":
+        return f"{data}[0]"
+    if type_string == "address":
+        return f"encode_address({data})"
+    if _UINT.match(type_string):
+        return f"int.from_bytes({data}, 'big')"
+
+    array = _STATIC_ARRAY.match(type_string)
+    if array and array[1] == "byte":
+        return f"bytes({data})"
+    if type_string.endswith("[]"):
+        size = static_size(type_string[:-2])
+        if size is not None and "item" not in data:
+            element = decode_expr(type_string[:-2], f"{data}[2 + {size} * item:2 + {size} * (item + 1)]")
+            return f"[{element} for item in range(int.from_bytes({data}[:2], 'big'))]"
+    if is_tuple(type_string) and static_size(type_string) is not None:
+        fields, offset = [], 0
+        for part in split_tuple(type_string):
+            size = static_size(part)
+            fields.append(decode_expr(part, f"{data}[{offset}:{offset + size}]"))
+            offset += size
+        return "(" + ", ".join(fields) + ",)"
+    return f"_abi_type({type_string!r}).decode({data})"
+
+
+def _identifier(name: str, taken: set) -> str:
+    """Valid, unique Python parameter name for an ABI argument"""
+    name = re.sub(r"\W", "_", name) or "arg"
+    if name[0].isdigit() or keyword.iskeyword(name):
+        name = f"{name}_"
+    while name in taken:
+        name = f"{name}_"
+    taken.add(name)
+    return name
+
+
+def has_encoder(method: Dict[str, Any]) -> bool:
+    """Whether a method's args are plain app args (no transactions, no tuple packing)"""
+    return (len(method["args"]) <= MAX_APP_ARGS
+            and not any(arg["type"] in TRANSACTION_TYPES for arg in method["args"]))
+
+
+def render_method(method: Dict[str, Any]) -> str:
+    """Selector constant, encoder and return decoder for one method"""
+    signature = method_signature(method)
+    name = method["name"]
+    constant = f"{name.upper()}_SELECTOR"
+    lines = [f"{constant} = bytes.fromhex({method_selector(signature).hex()!r})", "", ""]
+
+    if not has_encoder(method):
+        lines.append(f"# {signature}: no precompiled encoder (transaction or more than "
+                     f"{MAX_APP_ARGS} arguments); use the typed client")
+        return "\n".join(lines) + "\n"
+
+    taken: set = set()
+    params = [(_identifier(arg["name"] or f"arg{index}", taken), arg["type"])
+              for index, arg in enumerate(method["args"])]
+    parts = [constant] + [encode_expr(type_string, param) for param, type_string in params]
+    lines += [
+        f"def encode_{name}({', '.join(param for param, _ in params)}) -> list[bytes]:",
+        f'    """App args for {signature}"""',
+        f"    return [{', '.join(parts)}]",
+    ]
+
+    returns = method["returns"]["type"]
+    if returns != "void":
+        lines += [
+            "", "",
+            f"def decode_{name}_return(log: bytes):",
+            f'    """Return value ({returns}) from the call\'s last log"""',
+            "    data = _returned(log)",
+            f"    return {decode_expr(returns, 'data')}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def render_encoders(app_spec: Dict[str, Any], spec_name: str = "the ARC-56 spec") -> str:
+    """Source of the encoder module for an ARC-56 spec"""
+    sections = [_HEADER.format(spec=spec_name, name=app_spec["name"])]
+    sections += [render_method(method) for method in app_spec["methods"]]
+    table = "".join(
+        f"    {m['name']!r}: ({m['name'].upper()}_SELECTOR, encode_{m['name']}),\n"
+        for m in app_spec["methods"] if has_encoder(m)
+    )
+    sections.append(f"# method name -> (selector, encoder)\nENCODERS = {{\n{table}}}\n")
+    return "\n\n".join(sections)
+
+
+def write_encoders(app_spec_path: Path, output_path: Path) -> Path:
+    """Generate the encoder module for an ARC-56 spec file"""
+    app_spec = json.loads(app_spec_path.read_text())
+    output_path.write_text(render_encoders(app_spec, app_spec_path.name))
+    return output_path
+
+
+def load_encoders(app_spec_path: Path = APP_SPEC) -> types.ModuleType:
+    """Generate the encoder module in memory (no build needed)"""
+    module = types.ModuleType("abi_encoders_generated")
+    exec(compile(render_encoders(json.loads(app_spec_path.read_text()), app_spec_path.name),
+                 module.__name__, "exec"), module.__dict__)
+    return module
+
+
+# --------------------------- Benchmark --------------------------- #
+
+SAMPLE_ADDRESS = "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ"
+
+
+def sample_value(type_string: str) -> Any:
+    """Representative argument for a type (claim-sized strings, 8-element arrays)"""
+    if type_string == "string":
+        return "AlgoRewards Badge #0042"
+    if type_string == "bool":
+        return True
+    if type_string == "address":
+        return SAMPLE_ADDRESS
+    if type_string in ("byte", *REFERENCE_TYPES) or _UINT.match(type_string):
+        return 1
+    array = _STATIC_ARRAY.match(type_string)
+    if array:
+        if array[1] == "byte":
+            return bytes(int(array[2]))
+        return [sample_value(array[1])] * int(array[2])
+    if type_string.endswith("[]"):
+        return [sample_value(type_string[:-2])] * 8
+    if is_tuple(type_string):
+        return tuple(sample_value(part) for part in split_tuple(type_string))
+    raise ValueError(f"No sample for {type_string}")
+
+
+def dynamic_encode(signature: str, args: List[Any]) -> List[bytes]:
+    """The per-call work of the dynamic path: signature lookup, type parsing, encoding"""
+    from algosdk import abi
+
+    method = abi.Method.from_signature(signature)
+    return [method.get_selector()] + [arg.type.encode(value) for arg, value in zip(method.args, args)]
+
+
+def benchmark(app_spec_path: Path = APP_SPEC, iterations: int = 20_000) -> List[Tuple[str, float, float]]:
+    """
+    Time precompiled against dynamic encoding for every method
+
+    Both paths must produce identical app args; a mismatch raises.
+
+    Returns:
+        (method, precompiled us/call, dynamic us/call) per method
+    """
+    app_spec = json.loads(app_spec_path.read_text())
+    encoders = load_encoders(app_spec_path)
+    results = []
+    for method in app_spec["methods"]:
+        if not has_encoder(method):
+            continue
+        signature = method_signature(method)
+        args = [sample_value(arg["type"]) for arg in method["args"]]
+        encode = encoders.ENCODERS[method["name"]][1]
+        if encode(*args) != dynamic_encode(signature, args):
+            raise AssertionError(f"Precompiled encoding of {signature} differs from algosdk")
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            encode(*args)
+        precompiled = (time.perf_counter() - start) / iterations * 1e6
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            dynamic_encode(signature, args)
+        dynamic = (time.perf_counter() - start) / iterations * 1e6
+        results.append((method["name"], precompiled, dynamic))
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Generate or benchmark precompiled ABI encoders")
+    parser.add_argument("action", choices=["generate", "bench"])
+    parser.add_argument("--spec", type=Path, default=APP_SPEC, help="ARC-56 spec (defaults to the built contract)")
+    parser.add_argument("--out", type=Path, help="generated module path (generate; defaults to stdout)")
+    parser.add_argument("--iterations", type=int, default=20_000, help="calls timed per method (bench)")
+    args = parser.parse_args(argv)
+
+    if args.action == "generate":
+        if args.out:
+            write_encoders(args.spec, args.out)
+            print(f"✅ Wrote {args.out}", file=sys.stderr)
+        else:
+            print(render_encoders(json.loads(args.spec.read_text()), args.spec.name))
+        return
+
+    print(f"⏱️  ABI encoding, {args.iterations} calls per method ({args.spec.name})")
+    print(f"   {'method':<24}{'precompiled':>14}{'dynamic':>12}{'speedup':>10}")
+    for name, precompiled, dynamic in benchmark(args.spec, args.iterations):
+        print(f"   {name:<24}{precompiled:>11.2f} us{dynamic:>9.2f} us{dynamic / precompiled:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
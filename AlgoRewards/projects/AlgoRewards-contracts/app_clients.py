@@ -0,0 +1,143 @@
+"""
+Long-lived AlgoRewardsContract clients shared across operations.
+
+Building an AlgorandClient, loading the DEPLOYER account and parsing the
+ARC-56 spec into a factory all happen once per network. App clients are
+then cached by network, app ID and sender. Scripts that create sessions
+and claim badges in a loop reuse the same algod client, signer and
+parsed spec instead of re-initializing for every call.
+
+Readonly methods (get_session, check_claim_status, ...) go through a
+ReadonlyCallCache kept next to each app client, so they are simulated
+fee-free and answered from memory within a round.
+"""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import algokit_utils
+
+from readonly_calls import ReadonlyCallCache
+from smart_contracts.artifacts.algo_rewards_contract.algo_rewards_contract_client import (
+    AlgoRewardsContractClient,
+    AlgoRewardsContractFactory,
+)
+
+
+def network_key() -> str:
+    """Identify the algod the environment points at (localnet when unset)"""
+    server = os.getenv("ALGOD_SERVER")
+    if not server:
+        return "localnet"
+    return f"{server}:{os.getenv('ALGOD_PORT', '')}"
+
+
+class AppClientRegistry:
+    """Thread-safe cache of Algorand clients, signers, factories and app clients"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._algorand: Dict[str, algokit_utils.AlgorandClient] = {}
+        self._deployers: Dict[str, str] = {}
+        self._factories: Dict[Tuple[str, str], AlgoRewardsContractFactory] = {}
+        self._clients: Dict[Tuple[str, int, str], AlgoRewardsContractClient] = {}
+        self._readonly: Dict[Tuple[str, int, str], ReadonlyCallCache] = {}
+
+    def algorand(self, network: Optional[str] = None) -> algokit_utils.AlgorandClient:
+        """AlgorandClient for a network, created from the environment on first use"""
+        network = network or network_key()
+        with self._lock:
+            if network not in self._algorand:
+                self._algorand[network] = algokit_utils.AlgorandClient.from_environment()
+            return self._algorand[network]
+
+    def deployer(self, network: Optional[str] = None) -> str:
+        """Address of the DEPLOYER account; its signer is registered with the AlgorandClient"""
+        network = network or network_key()
+        with self._lock:
+            if network not in self._deployers:
+                account = self.algorand(network).account.from_environment("DEPLOYER")
+                self._deployers[network] = account.address
+            return self._deployers[network]
+
+    def factory(self, sender: Optional[str] = None, network: Optional[str] = None) -> AlgoRewardsContractFactory:
+        """Factory (with the parsed app spec) for a default sender"""
+        network = network or network_key()
+        with self._lock:
+            sender = sender or self.deployer(network)
+            key = (network, sender)
+            if key not in self._factories:
+                self._factories[key] = AlgoRewardsContractFactory(
+                    algorand=self.algorand(network), default_sender=sender
+                )
+            return self._factories[key]
+
+    def get(self, app_id: int, sender: Optional[str] = None, network: Optional[str] = None) -> AlgoRewardsContractClient:
+        """
+        App client for a deployed app
+
+        Args:
+            app_id: Application ID
+            sender: Default sender (defaults to the DEPLOYER account)
+            network: Network key (defaults to the environment's algod)
+
+        Returns:
+            A cached AlgoRewardsContractClient
+        """
+        network = network or network_key()
+        with self._lock:
+            sender = sender or self.deployer(network)
+            key = (network, app_id, sender)
+            if key not in self._clients:
+                self._clients[key] = self.factory(sender, network).get_app_client_by_id(app_id=app_id)
+            return self._clients[key]
+
+    def readonly(self, app_id: int, sender: Optional[str] = None, network: Optional[str] = None) -> ReadonlyCallCache:
+        """
+        Readonly call cache over the app client for the same app and sender
+
+        Use this instead of app_client.send for readonly methods, e.g.
+        registry.readonly(app_id).call("check_claim_status", [session_id, address]).
+        """
+        network = network or network_key()
+        with self._lock:
+            sender = sender or self.deployer(network)
+            key = (network, app_id, sender)
+            if key not in self._readonly:
+                self._readonly[key] = ReadonlyCallCache(self.get(app_id, sender, network))
+            return self._readonly[key]
+
+    def warm_up(self, app_id: int, sender: Optional[str] = None, network: Optional[str] = None) -> AlgoRewardsContractClient:
+        """
+        Build the app client and prefetch suggested params
+
+        Call once at startup so the first real transaction does not pay
+        for client construction and the params request.
+        """
+        app_client = self.get(app_id, sender, network)
+        app_client.algorand.get_suggested_params()
+        return app_client
+
+    def clear(self):
+        """Forget every cached client, e.g. after the environment changes"""
+        with self._lock:
+            self._algorand.clear()
+            self._deployers.clear()
+            self._factories.clear()
+            self._clients.clear()
+            self._readonly.clear()
+
+
+# Process-wide registry
+registry = AppClientRegistry()
+
+
+def get_app_client(app_id: Optional[int] = None, sender: Optional[str] = None) -> AlgoRewardsContractClient:
+    """Cached app client for app_id (defaults to $APP_ID)"""
+    return registry.get(app_id or int(os.environ["APP_ID"]), sender)
+
+
+def get_readonly(app_id: Optional[int] = None, sender: Optional[str] = None) -> ReadonlyCallCache:
+    """Cached readonly calls for app_id (defaults to $APP_ID)"""
+    return registry.readonly(app_id or int(os.environ["APP_ID"]), sender)
@@ -0,0 +1,151 @@
+"""
+Batched badge claims for AlgoRewardsContract.
+
+Splits a roster into the largest atomic groups of claim_badges_batch calls
+the protocol allows. Each claim touches one claim box, and box references
+count against the 8 foreign references an app call may carry. A group of 16
+calls therefore reaches 128 references: the session box plus 127 claim
+boxes.
+
+References are not the only limit. Measured on the AVM, a call costs about
+155 opcodes plus 132 per badge, so a full group needs about 19,700 against
+the 11,200 pooled from its 16 calls. The contract tops up the difference
+with ensure_budget op-up inner calls paid from the group's fee credit, and
+claim_badges_batch adds their fees to the group's first call. 127 asset
+creates plus 13-14 op-ups stay under the 256 inner-transaction limit.
+"""
+
+import math
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+from algokit_utils import AlgoAmount, AppClientBareCallParams, BoxReference
+
+from claim_registry import claim_box_name, get_claimed_badges, last_log
+from session_registry import session_box_name
+from smart_contracts.artifacts.algo_rewards_contract.algo_rewards_contract_encoders import (
+    decode_claim_badges_batch_return,
+    encode_claim_badges_batch,
+)
+
+
+MAX_GROUP_SIZE = 16
+MAX_REFERENCES_PER_CALL = 8
+MAX_INNER_TXNS_PER_GROUP = 256
+MIN_FEE = 1000
+
+# Opcode budget, mirroring contract.py's ensure_budget request (+10 buffer)
+OPCODE_BUDGET_PER_CALL = 700
+BATCH_CALL_OPCODES = 160 + 10
+BATCH_BADGE_OPCODES = 135
+# Budget one op-up call adds, net of the opcodes spent issuing it
+OP_UP_NET_OPCODES = 650
+
+# One reference per group goes to the session box
+MAX_BADGES_PER_GROUP = min(
+    MAX_GROUP_SIZE * MAX_REFERENCES_PER_CALL - 1, MAX_INNER_TXNS_PER_GROUP
+)
+
+
+def plan_claim_groups(
+    recipient_addresses: Iterable[str],
+    badges_per_group: int = MAX_BADGES_PER_GROUP
+) -> Iterator[List[List[str]]]:
+    """
+    Lay recipients out as groups of claim_badges_batch calls
+
+    The first call of a group carries the session box reference and so
+    fits one recipient fewer than the rest.
+
+    Args:
+        recipient_addresses: Recipients in roster order (duplicates dropped)
+        badges_per_group: Cap on badges per group, e.g. to spend fewer
+            op-up fees per group
+
+    Yields:
+        Per group, the recipient list of each app call
+    """
+    if not 1 <= badges_per_group <= MAX_BADGES_PER_GROUP:
+        raise ValueError(f"badges_per_group must be between 1 and {MAX_BADGES_PER_GROUP}")
+
+    recipients = list(dict.fromkeys(recipient_addresses))
+    for start in range(0, len(recipients), badges_per_group):
+        chunk = recipients[start:start + badges_per_group]
+        calls = [chunk[:MAX_REFERENCES_PER_CALL - 1]]
+        for offset in range(MAX_REFERENCES_PER_CALL - 1, len(chunk), MAX_REFERENCES_PER_CALL):
+            calls.append(chunk[offset:offset + MAX_REFERENCES_PER_CALL])
+        yield calls
+
+
+def op_up_calls(calls: Sequence[Sequence[str]]) -> int:
+    """
+    Op-up inner calls the contract issues for one group
+
+    An upper bound: every call asks for its worst-case cost, and unused
+    budget carries over to the next call in the group.
+
+    Args:
+        calls: Recipient list of each claim_badges_batch call in the group
+    """
+    required = sum(BATCH_CALL_OPCODES + BATCH_BADGE_OPCODES * len(call) for call in calls)
+    shortfall = required - OPCODE_BUDGET_PER_CALL * len(calls)
+    return max(0, math.ceil(shortfall / OP_UP_NET_OPCODES))
+
+
+def claim_badges_batch(
+    app_client,
+    session_id: str,
+    recipient_addresses: Iterable[str],
+    badges_per_group: int = MAX_BADGES_PER_GROUP,
+    skip_claimed: bool = True
+) -> Dict[str, int]:
+    """
+    Mint badges for a whole roster with as few groups as possible
+
+    Must be sent by the app creator. The app account must hold enough
+    ALGO for 0.1 ALGO per badge plus each claim box's minimum balance. Each
+    group's fee also covers its op-up calls (see op_up_calls).
+
+    Args:
+        app_client: AlgoRewardsContractClient
+        session_id: Session being claimed
+        recipient_addresses: Recipients in roster order
+        badges_per_group: Cap on badges per group
+        skip_claimed: Read the claim boxes first and skip recipients who
+            already have a badge (one would otherwise fail its whole group)
+
+    Returns:
+        Mapping of recipient address to badge asset ID
+    """
+    recipients = list(dict.fromkeys(recipient_addresses))
+    badges: Dict[str, int] = {}
+    if skip_claimed:
+        claimed = get_claimed_badges(
+            app_client.algorand.client.algod, app_client.app_id, session_id, recipients
+        )
+        badges = {address: asset_id for address, asset_id in claimed.items() if asset_id}
+        recipients = [address for address in recipients if address not in badges]
+
+    for calls in plan_claim_groups(recipients, badges_per_group):
+        group = app_client.algorand.new_group()
+        for index, call_recipients in enumerate(calls):
+            # The outer call plus one inner asset create per badge
+            fee = MIN_FEE * (1 + len(call_recipients))
+            # Bare calls pass references to algosdk as-is; app index 0 is the called app
+            box_references = [BoxReference(0, claim_box_name(session_id, address)) for address in call_recipients]
+            if index == 0:
+                # The first call also pays for the whole group's op-ups
+                fee += MIN_FEE * op_up_calls(calls)
+                box_references.insert(0, BoxReference(0, session_box_name(session_id)))
+            # Precompiled app args: no per-call method lookup or ABI type parsing
+            group.add_app_call(
+                app_client.app_client.params.bare.call(AppClientBareCallParams(
+                    args=encode_claim_badges_batch(session_id, call_recipients),
+                    static_fee=AlgoAmount(micro_algo=fee),
+                    box_references=box_references,
+                ))
+            )
+        result = group.send({"populate_app_call_resources": False})
+        for call_recipients, confirmation in zip(calls, result.confirmations):
+            badges.update(zip(call_recipients, decode_claim_badges_batch_return(last_log(confirmation))))
+    return badges
+
@@ -0,0 +1,201 @@
+"""
+Off-chain access to AlgoRewardsContract's box-storage claim registry.
+
+Computes the same claim box names as the contract, so callers can pass box
+references to claim_badge / check_claim_status(es) and read claim records
+straight from algod (one box fetch each, no app call, no indexer scan).
+Each claim record holds the badge ASA the contract minted for it.
+
+Getting a badge into a recipient's wallet takes two confirmed groups:
+claim_badge (the app mints and holds the badge), then the recipient's
+opt-in plus deliver_badge. They cannot share one group. An opt-in has to
+name the asset ID, and the ID only exists once the claim has executed.
+The ID cannot be predicted either, because it depends on how many
+transactions the ledger has seen by then.
+"""
+
+import base64
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from algokit_utils import (
+    AlgoAmount, AppClientBareCallParams, AssetOptInParams, BoxReference, CommonAppCallParams, PaymentParams,
+)
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+
+from session_registry import session_box_name
+from smart_contracts.artifacts.algo_rewards_contract.algo_rewards_contract_encoders import (
+    decode_claim_badge_return,
+    encode_claim_badge,
+)
+
+
+# Must match AlgoRewardsContract.claims (BoxMap key_prefix) and claim_key()
+CLAIM_BOX_PREFIX = b"c"
+
+# What a recipient pays the app per claim (see the contract's assert_claim_paid):
+# the badge ASA's minimum balance plus the claims box's (name "c" + 32 bytes, uint64 value)
+ASSET_MIN_BALANCE = 100_000
+CLAIM_MIN_BALANCE = ASSET_MIN_BALANCE + 2_500 + 400 * (len(CLAIM_BOX_PREFIX) + 32 + 8)
+
+
+def claim_key(session_id: str, recipient_address: str) -> bytes:
+    """sha256(len(session_id) as uint64 || session_id || recipient public key)"""
+    session = session_id.encode("utf-8")
+    return hashlib.sha256(
+        len(session).to_bytes(8, "big") + session + encoding.decode_address(recipient_address)
+    ).digest()
+
+
+def claim_box_name(session_id: str, recipient_address: str) -> bytes:
+    """Full box name of a (session, recipient) claim record"""
+    return CLAIM_BOX_PREFIX + claim_key(session_id, recipient_address)
+
+
+def get_claimed_badge(algod_client, app_id: int, session_id: str, recipient_address: str) -> int:
+    """
+    Badge asset minted for the recipient's claim on a session
+
+    Returns:
+        The badge asset ID, or 0 if the badge has not been claimed
+    """
+    try:
+        box = algod_client.application_box_by_name(
+            app_id, claim_box_name(session_id, recipient_address)
+        )
+    except AlgodHTTPError as e:
+        if e.code == 404:
+            return 0
+        raise
+    return int.from_bytes(base64.b64decode(box["value"]), "big")
+
+
+def get_claimed_badges(
+    algod_client,
+    app_id: int,
+    session_id: str,
+    recipient_addresses: Iterable[str],
+    max_workers: int = 16
+) -> Dict[str, int]:
+    """
+    Badge assets for many recipients, fetched concurrently
+
+    Returns:
+        Mapping of recipient address to badge asset ID (0 if unclaimed)
+    """
+    recipients: List[str] = list(dict.fromkeys(recipient_addresses))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        badges = executor.map(
+            lambda address: get_claimed_badge(algod_client, app_id, session_id, address),
+            recipients,
+        )
+        return dict(zip(recipients, badges))
+
+
+def last_log(confirmation) -> bytes:
+    """An app call's last log, where ARC-4 puts the return value"""
+    return base64.b64decode(confirmation["logs"][-1])
+
+
+def deliver_badge(app_client, session_id: str, recipient_address: str, asset_id: int):
+    """
+    Opt the recipient in to their badge and have the app transfer it, as one group
+
+    This is the second of the two confirmations a claim needs (see the
+    module docstring). The recipient must be a signer known to
+    app_client.algorand; the app call fee covers the inner transfer.
+
+    Returns:
+        The group send result
+    """
+    return (
+        app_client.algorand.new_group()
+        .add_asset_opt_in(AssetOptInParams(sender=recipient_address, asset_id=asset_id))
+        .add_app_call_method_call(
+            app_client.params.deliver_badge(
+                args=(session_id, recipient_address),
+                params=CommonAppCallParams(
+                    sender=recipient_address,
+                    static_fee=AlgoAmount(micro_algo=2000),
+                    asset_references=[asset_id],
+                    account_references=[recipient_address],
+                    box_references=[claim_box_name(session_id, recipient_address)],
+                ),
+            )
+        )
+        .send()
+    )
+
+
+def send_claim(
+    app_client,
+    session_id: str,
+    recipient_address: str,
+    sender: Optional[str] = None,
+    pay: bool = False
+):
+    """
+    Send claim_badge with precompiled app args and decode its BadgeClaimed return
+
+    Skips the typed client's per-call method lookup and ABI type parsing.
+
+    Args:
+        app_client: AlgoRewardsContractClient
+        session_id: Session being claimed
+        recipient_address: Badge recipient
+        sender: The recipient or the app creator (defaults to the client's default sender)
+        pay: Precede the call with the sender's CLAIM_MIN_BALANCE payment to
+            the app, which the contract requires unless the creator claims
+
+    Returns:
+        (send result, badge asset ID, claim number)
+    """
+    call = AppClientBareCallParams(
+        args=encode_claim_badge(session_id, recipient_address),
+        sender=sender,
+        # The outer call plus the inner badge mint
+        static_fee=AlgoAmount(micro_algo=2000),
+        # Bare calls pass references to algosdk as-is; app index 0 is the called app
+        box_references=[
+            BoxReference(0, session_box_name(session_id)),
+            BoxReference(0, claim_box_name(session_id, recipient_address)),
+        ],
+    )
+    if not pay:
+        result = app_client.app_client.send.bare.call(call)
+        confirmation = result.confirmation
+    else:
+        app_call = app_client.app_client.params.bare.call(call)
+        result = (
+            app_client.algorand.new_group()
+            .add_payment(PaymentParams(
+                sender=app_call.sender,
+                receiver=app_client.app_address,
+                amount=AlgoAmount(micro_algo=CLAIM_MIN_BALANCE),
+            ))
+            .add_app_call(app_call)
+            .send()
+        )
+        confirmation = result.confirmations[-1]
+    asset_id, claim_number = decode_claim_badge_return(last_log(confirmation))
+    return result, asset_id, claim_number
+
+
+def claim_and_deliver(app_client, session_id: str, recipient_address: str) -> int:
+    """
+    Claim a badge as the recipient and deliver it to their wallet
+
+    Pays the claim's minimum balance and sends claim_badge, waits for
+    them to confirm, and then sends the
+    opt-in + deliver_badge group. That is two confirmations, the minimum
+    for a freshly minted 1-of-1 badge. The recipient must be a signer
+    known to app_client.algorand.
+
+    Returns:
+        The badge asset ID
+    """
+    _, asset_id, _ = send_claim(app_client, session_id, recipient_address, sender=recipient_address, pay=True)
+    deliver_badge(app_client, session_id, recipient_address, asset_id)
+    return asset_id
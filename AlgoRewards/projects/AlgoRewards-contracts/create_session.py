@@ -6,7 +6,10 @@ Utility script for creating AlgoRewards sessions and managing badge claims
 import os
 import sys
 from dotenv import load_dotenv
+from app_clients import get_app_client
 from ipfs_utils import IPFSMetadataManager
+from claim_registry import send_claim
+from session_registry import get_session_record, metadata_url_to_cid_bytes, session_box_name
 import algokit_utils
 
 # Load environment variables
@@ -17,9 +20,12 @@ def create_session_with_metadata(
     session_name: str,
     session_description: str,
     badge_image_url: str = None,
-    attributes: dict = None
+    attributes: dict = None,
+    start_round: int = 0,
+    end_round: int = 0,
+    max_claims: int = 0
 ):
-    """Create a session with IPFS metadata"""
+    """Create a session with IPFS metadata (round window and max claims of 0 mean unlimited)"""
     
     # Initialize IPFS manager
     ipfs_manager = IPFSMetadataManager()
@@ -37,22 +43,9 @@ def create_session_with_metadata(
         
         print(f"Metadata uploaded to IPFS: {metadata_url}")
         
-        # Initialize Algorand client
-        algorand = algokit_utils.AlgorandClient.from_environment()
-        deployer = algorand.account.from_environment("DEPLOYER")
-        
-        # Get app client
-        from smart_contracts.artifacts.algo_rewards_contract.algo_rewards_contract_client import (
-            AlgoRewardsContractFactory,
-        )
-        
-        factory = algorand.client.get_typed_app_factory(
-            AlgoRewardsContractFactory, default_sender=deployer.address
-        )
-        
-        # Get app client by ID (replace with your actual app ID)
+        # Get the shared app client (replace with your actual app ID)
         app_id = int(os.getenv('APP_ID', '743652051'))
-        app_client = factory.getAppClientById({"appId": app_id})
+        app_client = get_app_client(app_id)
         
         # Create session on blockchain
         print(f"Creating session on blockchain...")
@@ -61,13 +54,19 @@ def create_session_with_metadata(
                 "session_id": session_id,
                 "session_name": session_name,
                 "session_description": session_description,
-                "metadata_url": metadata_url
-            }
+                "metadata_cid": metadata_url_to_cid_bytes(metadata_url),
+                "start_round": start_round,
+                "end_round": end_round,
+                "max_claims": max_claims
+            },
+            params=algokit_utils.CommonAppCallParams(
+                box_references=[session_box_name(session_id)]
+            )
         )
         
         print(f"Session created successfully!")
         print(f"Session ID: {session_id}")
-        print(f"Session Number: {getattr(response, 'return', 'N/A')}")
+        print(f"Session Number: {response.abi_return.session_number}")
         print(f"Metadata URL: {metadata_url}")
         
         return metadata_url
@@ -76,69 +75,30 @@ def create_session_with_metadata(
         print(f"Error creating session: {e}")
         return None
 
-def claim_badge(
-    session_id: str,
-    recipient_address: str,
-    asset_name: str = None,
-    asset_unit: str = None,
-    metadata_url: str = None
-):
-    """Claim a badge for a session"""
+def claim_badge(session_id: str, recipient_address: str):
+    """Claim a badge for a session (the badge points at the session's registered metadata)"""
     
     try:
-        # Initialize Algorand client
-        algorand = algokit_utils.AlgorandClient.from_environment()
-        deployer = algorand.account.from_environment("DEPLOYER")
-        
-        # Get app client
-        from smart_contracts.artifacts.algo_rewards_contract.algo_rewards_contract_client import (
-            AlgoRewardsContractFactory,
-        )
-        
-        factory = algorand.client.get_typed_app_factory(
-            AlgoRewardsContractFactory, default_sender=deployer.address
-        )
-        
-        # Get app client by ID
+        # Get the shared app client
         app_id = int(os.getenv('APP_ID', '743652051'))
-        app_client = factory.getAppClientById({"appId": app_id})
-        
-        # Set default asset name and unit if not provided
-        if not asset_name:
-            asset_name = f"AlgoRewards Badge - {session_id}"
-        if not asset_unit:
-            asset_unit = f"BADGE-{session_id}"
-        
-        # If no metadata URL provided, we need to get it from the session
-        if not metadata_url:
-            # Get session info to extract metadata URL
-            session_info = app_client.send.get_session_info(
-                args={"session_id": session_id}
-            )
-            # Parse session info to get metadata URL
-            # This is a simplified approach - in production you'd parse the session data properly
-            metadata_url = "ipfs://QmYwAPJzv5CZsnA625s3Xf2nemtYgPpHdWEz79ojWnPbdG/readme.md"
+        app_client = get_app_client(app_id)
+        
+        session = get_session_record(app_client.algorand.client.algod, app_id, session_id)
+        if session is None:
+            raise ValueError(f"Session {session_id} does not exist")
         
         print(f"Claiming badge for session: {session_id}")
         print(f"Recipient: {recipient_address}")
-        print(f"Asset Name: {asset_name}")
-        print(f"Asset Unit: {asset_unit}")
+        print(f"Metadata URL: {session['metadata_url']}")
         
         # Claim the badge
-        response = app_client.send.claim_badge(
-            args={
-                "session_id": session_id,
-                "recipient_address": recipient_address,
-                "asset_name": asset_name,
-                "asset_unit": asset_unit,
-                "metadata_url": metadata_url
-            }
-        )
+        response, asset_id, claim_number = send_claim(app_client, session_id, recipient_address)
         
         print(f"Badge claimed successfully!")
-        print(f"Asset ID: {getattr(response, 'return', 'N/A')}")
+        print(f"Asset ID: {asset_id} (claim #{claim_number})")
+        print("The recipient receives the badge by opting in and calling deliver_badge")
         
-        return getattr(response, 'return', None)
+        return asset_id
         
     except Exception as e:
         print(f"Error claiming badge: {e}")
@@ -0,0 +1,128 @@
+"""
+Local stand-in for the Pinata pinning API.
+
+Serves POST /pinning/pinJSONToIPFS on 127.0.0.1 so IPFSMetadataManager can be
+exercised and benchmarked without credentials or network access.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from ipfs_cid import compute_cid, serialize_for_pinata
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Benchmarks open many connections at once; the default backlog of 5
+    # drops SYNs and shows up as one-second retransmit stalls
+    request_queue_size = 128
+
+
+class FakePinataServer:
+    """In-process HTTP server emulating Pinata's pinJSONToIPFS endpoint"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failures: Optional[List[int]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Args:
+            latency: Seconds to sleep before answering each request
+            failures: HTTP status codes returned (in order) before succeeding,
+                e.g. [429, 503] to exercise retry logic
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.latency = latency
+        self.failures = list(failures or [])
+        self.request_count = 0
+        self.pinned: Dict[str, dict] = {}
+        self.connections = set()
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                server._handle(self)
+
+        self._httpd = _Server((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to IPFSMetadataManager(pinata_url=...)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakePinataServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakePinataServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _handle(self, request: BaseHTTPRequestHandler):
+        length = int(request.headers.get("Content-Length", 0))
+        body = request.rfile.read(length)
+
+        with self._lock:
+            self.request_count += 1
+            self.connections.add(request.client_address)
+            failure = self.failures.pop(0) if self.failures else None
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if request.path != "/pinning/pinJSONToIPFS":
+            self._respond(request, 404, {"error": "Not found"})
+            return
+        if failure is not None:
+            self._respond(request, failure, {"error": f"Simulated {failure}"})
+            return
+        if not request.headers.get("pinata_api_key"):
+            self._respond(request, 401, {"error": "Invalid authentication"})
+            return
+
+        payload = json.loads(body)
+        content = payload["pinataContent"]
+        data = serialize_for_pinata(content)
+        cid_version = payload.get("pinataOptions", {}).get("cidVersion", 0)
+        ipfs_hash = compute_cid(data, version=cid_version)
+        with self._lock:
+            self.pinned[ipfs_hash] = content
+
+        self._respond(request, 200, {
+            "IpfsHash": ipfs_hash,
+            "PinSize": len(data),
+            "Timestamp": datetime.now(timezone.utc).isoformat(),
+        })
+
+    @staticmethod
+    def _respond(request: BaseHTTPRequestHandler, status: int, payload: dict):
+        data = json.dumps(payload).encode()
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
@@ -0,0 +1,178 @@
+"""
+Offline IPFS CID computation for badge metadata.
+
+Computes the CID Pinata assigns to a JSON document without uploading it, and
+converts between CIDs and ARC-19 reserve addresses. Only single-chunk files
+(up to 256 KiB, the default IPFS chunk size) are supported, which covers any
+metadata document.
+"""
+
+import base64
+import hashlib
+import json
+from typing import Any, Dict
+
+from algosdk import encoding
+
+
+# Multicodec / multihash codes
+RAW = 0x55
+DAG_PB = 0x70
+SHA2_256 = 0x12
+
+CHUNK_SIZE = 262_144
+
+_CODECS = {"raw": RAW, "dag-pb": DAG_PB}
+_CODEC_NAMES = {code: name for name, code in _CODECS.items()}
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def serialize_for_pinata(metadata: Dict[str, Any]) -> bytes:
+    """
+    Bytes Pinata pins for a pinJSONToIPFS body
+
+    Pinata stores JSON.stringify(pinataContent): insertion-ordered keys, no
+    whitespace, non-ASCII characters left unescaped.
+    """
+    return json.dumps(metadata, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def compute_cid(data: bytes, version: int = 1, codec: str = "raw") -> str:
+    """
+    CID of a file as `ipfs add` (and Pinata) would compute it
+
+    Args:
+        data: File contents
+        version: 0 for Qm... CIDs, 1 for base32 bafy.../bafkrei... CIDs
+        codec: 'raw' (CIDv1 raw leaves, Pinata's cidVersion=1 default) or
+            'dag-pb' (UnixFS node, always used for CIDv0)
+
+    Returns:
+        The CID string
+    """
+    if len(data) > CHUNK_SIZE:
+        raise ValueError(f"Files over {CHUNK_SIZE} bytes span several blocks and are not supported")
+    if version == 0:
+        codec = "dag-pb"
+    if codec not in _CODECS:
+        raise ValueError(f"Unsupported codec: {codec}")
+
+    block = data if codec == "raw" else _unixfs_file_node(data)
+    multihash = bytes([SHA2_256, 32]) + hashlib.sha256(block).digest()
+
+    if version == 0:
+        return _base58_encode(multihash)
+    return "b" + _base32(bytes([1, _CODECS[codec]]) + multihash)
+
+
+def compute_metadata_cid(metadata: Dict[str, Any], version: int = 1, codec: str = "raw") -> str:
+    """CID Pinata will return for a metadata document"""
+    return compute_cid(serialize_for_pinata(metadata), version, codec)
+
+
+def decode_cid(cid: str) -> Dict[str, Any]:
+    """
+    Split a sha2-256 CID into its parts
+
+    Returns:
+        Dict with 'version', 'codec' and 'digest' (32 raw bytes)
+    """
+    if cid.startswith("Qm"):
+        multihash = _base58_decode(cid)
+        version, codec = 0, DAG_PB
+    elif cid.startswith("b"):
+        raw = base64.b32decode(cid[1:].upper() + "=" * (-len(cid[1:]) % 8))
+        if raw[0] != 1:
+            raise ValueError(f"Unsupported CID version in {cid}")
+        version, codec, multihash = 1, raw[1], raw[2:]
+    else:
+        raise ValueError(f"Unsupported CID encoding: {cid}")
+
+    if multihash[:2] != bytes([SHA2_256, 32]) or codec not in _CODEC_NAMES:
+        raise ValueError(f"Only sha2-256 raw/dag-pb CIDs are supported: {cid}")
+    return {"version": version, "codec": _CODEC_NAMES[codec], "digest": multihash[2:]}
+
+
+def cid_from_ipfs_url(url: str) -> str:
+    """CID part of an ipfs://<cid>[/path] URL"""
+    if not url.startswith("ipfs://"):
+        raise ValueError(f"Not an ipfs:// URL: {url}")
+    return url[len("ipfs://"):].split("/", 1)[0]
+
+
+def cid_to_bytes(cid: str) -> bytes:
+    """
+    Fixed-width 36-byte binary CIDv1 (version, codec, sha2-256 multihash)
+
+    CIDv0 strings are converted to the equivalent dag-pb CIDv1.
+    """
+    parts = decode_cid(cid)
+    return bytes([1, _CODECS[parts["codec"]], SHA2_256, 32]) + parts["digest"]
+
+
+def bytes_to_cid(data: bytes) -> str:
+    """Base32 CIDv1 string for a 36-byte binary CID"""
+    if len(data) != 36 or data[0] != 1 or data[2:4] != bytes([SHA2_256, 32]):
+        raise ValueError("Expected a 36-byte binary sha2-256 CIDv1")
+    return "b" + _base32(data)
+
+
+def cid_to_reserve_address(cid: str) -> str:
+    """ARC-19 reserve address carrying the CID's sha2-256 digest"""
+    return encoding.encode_address(decode_cid(cid)["digest"])
+
+
+def reserve_address_to_cid(address: str, version: int = 1, codec: str = "raw") -> str:
+    """Rebuild the CID an ARC-19 reserve address points at"""
+    multihash = bytes([SHA2_256, 32]) + encoding.decode_address(address)
+    if version == 0:
+        return _base58_encode(multihash)
+    return "b" + _base32(bytes([1, _CODECS[codec]]) + multihash)
+
+
+def arc19_template_url(version: int = 1, codec: str = "raw") -> str:
+    """ARC-19 asset URL template resolving the CID from the reserve address"""
+    return f"template-ipfs://{{ipfscid:{version}:{codec}:reserve:sha2-256}}"
+
+
+def _unixfs_file_node(data: bytes) -> bytes:
+    """dag-pb PBNode wrapping a single-chunk UnixFS file"""
+    unixfs = b"\x08\x02"  # Type = File
+    if data:
+        unixfs += b"\x12" + _varint(len(data)) + data
+    unixfs += b"\x18" + _varint(len(data))  # filesize
+    return b"\x0a" + _varint(len(unixfs)) + unixfs
+
+
+def _varint(n: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _base32(data: bytes) -> str:
+    return base64.b32encode(data).decode("ascii").lower().rstrip("=")
+
+
+def _base58_encode(data: bytes) -> str:
+    n = int.from_bytes(data, "big")
+    out = ""
+    while n:
+        n, rem = divmod(n, 58)
+        out = _BASE58_ALPHABET[rem] + out
+    pad = len(data) - len(data.lstrip(b"\x00"))
+    return "1" * pad + out
+
+
+def _base58_decode(text: str) -> bytes:
+    n = 0
+    for char in text:
+        n = n * 58 + _BASE58_ALPHABET.index(char)
+    pad = len(text) - len(text.lstrip("1"))
+    return b"\x00" * pad + n.to_bytes((n.bit_length() + 7) // 8, "big")
@@ -1,16 +1,50 @@
 import json
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
 import os
+import time
 from datetime import datetime
+from ipfs_cid import compute_metadata_cid
+from metadata_cache import MetadataCache, content_cid
+
+
+PINATA_API_URL = 'https://api.pinata.cloud'
+
+# Pinata responses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
 
 
 class IPFSMetadataManager:
     """Utility class for creating and uploading NFT metadata to IPFS"""
     
-    def __init__(self, pinata_api_key: str = None, pinata_secret_key: str = None):
+    def __init__(
+        self,
+        pinata_api_key: str = None,
+        pinata_secret_key: str = None,
+        pinata_url: str = None,
+        max_workers: int = 8,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        timeout: float = 30.0,
+        cache: MetadataCache = None
+    ):
         self.pinata_api_key = pinata_api_key or os.getenv('PINATA_API_KEY')
         self.pinata_secret_key = pinata_secret_key or os.getenv('PINATA_SECRET_KEY')
+        self.pinata_url = (pinata_url or os.getenv('PINATA_API_URL') or PINATA_API_URL).rstrip('/')
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+
+        # One keep-alive pool shared by every upload, sized for the batch workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._background: ThreadPoolExecutor = None
     
     def create_badge_metadata(
         self,
@@ -18,7 +52,8 @@ class IPFSMetadataManager:
         session_description: str,
         session_id: str,
         badge_image_url: str = None,
-        attributes: Dict[str, Any] = None
+        attributes: Dict[str, Any] = None,
+        minted_date: str = None
     ) -> Dict[str, Any]:
         """Create ARC-19 compliant metadata for a badge NFT"""
         
@@ -43,7 +78,7 @@ class IPFSMetadataManager:
                 },
                 {
                     "trait_type": "Minted Date",
-                    "value": datetime.now().isoformat()
+                    "value": minted_date or datetime.now().isoformat()
                 },
                 {
                     "trait_type": "Non-Transferable",
@@ -63,7 +98,12 @@ class IPFSMetadataManager:
         return metadata
     
     def upload_to_ipfs(self, metadata: Dict[str, Any]) -> str:
-        """Upload metadata to IPFS using Pinata"""
+        """Upload metadata to IPFS using Pinata (skipped if already pinned)"""
+        if self.cache is not None:
+            cached_url = self.cache.get(metadata)
+            if cached_url:
+                return cached_url
+        
         if not self.pinata_api_key or not self.pinata_secret_key:
             raise ValueError("Pinata API credentials required for IPFS upload")
         
@@ -82,12 +122,16 @@ class IPFSMetadataManager:
                     'project': 'algorewards'
                 }
             },
+            'pinataOptions': {
+                # Raw-leaf CIDv1, so compute_ipfs_url() predicts the result
+                'cidVersion': 1
+            },
             'pinataContent': metadata
         }
         
         try:
-            response = requests.post(
-                'https://api.pinata.cloud/pinning/pinJSONToIPFS',
+            response = self._post_with_retry(
+                f'{self.pinata_url}/pinning/pinJSONToIPFS',
                 headers=headers,
                 json=data
             )
@@ -97,18 +141,95 @@ class IPFSMetadataManager:
             ipfs_hash = result['IpfsHash']
             
             # Return the IPFS URL
-            return f"ipfs://{ipfs_hash}"
+            ipfs_url = f"ipfs://{ipfs_hash}"
+            if self.cache is not None:
+                self.cache.put(metadata, ipfs_url)
+            return ipfs_url
             
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to upload to IPFS: {str(e)}")
     
+    def compute_ipfs_url(self, metadata: Dict[str, Any]) -> str:
+        """IPFS URL upload_to_ipfs() will return, computed locally"""
+        return f"ipfs://{compute_metadata_cid(metadata)}"
+    
+    def upload_in_background(self, metadata: Dict[str, Any]) -> Tuple[str, Future]:
+        """
+        Start an upload and return its IPFS URL without waiting for Pinata
+        
+        The URL is computed locally, so minting can start while the upload
+        is in flight. The future fails if the upload fails or Pinata
+        returns a different CID.
+        
+        Returns:
+            (predicted IPFS URL, future resolving to the uploaded URL)
+        """
+        ipfs_url = self.compute_ipfs_url(metadata)
+        if self._background is None:
+            self._background = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        def upload() -> str:
+            uploaded_url = self.upload_to_ipfs(metadata)
+            if uploaded_url != ipfs_url:
+                raise Exception(f"Pinata returned {uploaded_url}, expected {ipfs_url}")
+            return uploaded_url
+        
+        return ipfs_url, self._background.submit(upload)
+    
+    def upload_many_to_ipfs(self, metadata_list: List[Dict[str, Any]]) -> List[str]:
+        """
+        Upload several metadata documents concurrently
+        
+        Uploads share the pooled session and run on at most max_workers
+        threads. Identical documents are uploaded once. Raises the first
+        upload error, if any.
+        
+        Returns:
+            IPFS URLs in the same order as metadata_list
+        """
+        unique = {}
+        for metadata in metadata_list:
+            unique.setdefault(content_cid(metadata), metadata)
+        
+        if len(unique) <= 1:
+            urls = {cid: self.upload_to_ipfs(metadata) for cid, metadata in unique.items()}
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                urls = dict(zip(unique, executor.map(self.upload_to_ipfs, unique.values())))
+        
+        return [urls[content_cid(metadata)] for metadata in metadata_list]
+    
+    def _post_with_retry(self, url: str, **kwargs) -> requests.Response:
+        """POST with exponential backoff on 429/5xx and connection errors"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(url, timeout=self.timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+                continue
+            
+            if response.status_code not in RETRYABLE_STATUS or attempt == self.max_retries:
+                return response
+            
+            # Honour Pinata's Retry-After when rate limited
+            retry_after = response.headers.get('Retry-After')
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = self.backoff * 2 ** attempt
+            time.sleep(delay)
+        return response
+    
     def create_and_upload_badge_metadata(
         self,
         session_name: str,
         session_description: str,
         session_id: str,
         badge_image_url: str = None,
-        attributes: Dict[str, Any] = None
+        attributes: Dict[str, Any] = None,
+        minted_date: str = None
     ) -> str:
         """Create metadata and upload to IPFS in one step"""
         metadata = self.create_badge_metadata(
@@ -116,11 +237,43 @@ class IPFSMetadataManager:
             session_description=session_description,
             session_id=session_id,
             badge_image_url=badge_image_url,
-            attributes=attributes
+            attributes=attributes,
+            minted_date=minted_date
         )
         
         return self.upload_to_ipfs(metadata)
 
+    
+    def create_and_upload_badge_metadata_batch(
+        self,
+        session_name: str,
+        session_description: str,
+        session_id: str,
+        attendee_attributes: List[Dict[str, Any]],
+        badge_image_url: str = None,
+        minted_date: str = None
+    ) -> List[str]:
+        """
+        Create and upload one metadata document per attendee, in order
+
+        Pass the session's minted_date to make a re-run produce the same
+        documents (and so hit the cache); it defaults to the current time.
+        """
+        # Every attendee in the batch shares one date
+        minted_date = minted_date or datetime.now().isoformat()
+        metadata_list = [
+            self.create_badge_metadata(
+                session_name=session_name,
+                session_description=session_description,
+                session_id=session_id,
+                badge_image_url=badge_image_url,
+                attributes=attributes,
+                minted_date=minted_date
+            )
+            for attributes in attendee_attributes
+        ]
+        
+        return self.upload_many_to_ipfs(metadata_list)
 
 # Example usage
 if __name__ == "__main__":
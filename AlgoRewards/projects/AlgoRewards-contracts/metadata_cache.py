@@ -0,0 +1,127 @@
+"""
+Content-addressed cache of pinned metadata documents.
+
+Maps the CID of the exact bytes Pinata pins for a document to the IPFS
+URL it returned, so identical documents are pinned only once. Documents
+that differ only in key order serialize differently, get different CIDs
+and are cached separately. The index lives in SQLite and is trimmed
+least-recently-used first.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ipfs_cid import compute_cid, serialize_for_pinata
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pinned_cids (
+    cid TEXT PRIMARY KEY,
+    ipfs_url TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pinned_cids_lru ON pinned_cids (last_used);
+"""
+
+
+def content_cid(metadata: Dict[str, Any]) -> str:
+    """CID of the bytes Pinata pins for a document"""
+    return compute_cid(serialize_for_pinata(metadata))
+
+
+class MetadataCache:
+    """On-disk index of already-pinned metadata with LRU eviction"""
+
+    def __init__(self, path: str = "metadata_cache.db", max_entries: int = 100_000):
+        """
+        Args:
+            path: SQLite file holding the index (":memory:" for a throwaway cache)
+            max_entries: Entries kept before the least recently used are evicted
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._entries = self.conn.execute("SELECT COUNT(*) FROM pinned_cids").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def get(self, metadata: Dict[str, Any]) -> Optional[str]:
+        """IPFS URL of an identical document pinned earlier, or None"""
+        return self.get_cid(content_cid(metadata))
+
+    def get_cid(self, cid: str) -> Optional[str]:
+        """IPFS URL cached under a CID, or None"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT ipfs_url FROM pinned_cids WHERE cid = ?", (cid,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.conn.execute(
+                "UPDATE pinned_cids SET last_used = ? WHERE cid = ?",
+                (time.time(), cid),
+            )
+            return row[0]
+
+    def put(self, metadata: Dict[str, Any], ipfs_url: str) -> str:
+        """
+        Record that a document has been pinned
+
+        Returns:
+            The document's CID
+        """
+        data = serialize_for_pinata(metadata)
+        cid = compute_cid(data)
+        now = time.time()
+        with self._lock:
+            exists = self.conn.execute(
+                "SELECT 1 FROM pinned_cids WHERE cid = ?", (cid,)
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pinned_cids "
+                "(cid, ipfs_url, size, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (cid, ipfs_url, len(data), now, now),
+            )
+            if not exists:
+                self._entries += 1
+                self._evict()
+        return cid
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size of the index"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _evict(self):
+        """Drop least recently used entries beyond max_entries (lock held)"""
+        excess = self._entries - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM pinned_cids WHERE cid IN "
+                "(SELECT cid FROM pinned_cids ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            self._entries -= excess
+            self.evictions += excess
@@ -5,21 +5,24 @@ Easy tool for creating sessions and minting badges
 """
 
 import algokit_utils
-from smart_contracts.artifacts.algo_rewards_contract.algo_rewards_contract_client import AlgoRewardsContractFactory
+from app_clients import registry
+from claim_registry import deliver_badge, send_claim
+from ipfs_utils import IPFSMetadataManager
+from metadata_cache import MetadataCache
+from session_registry import get_session_record, metadata_url_to_cid_bytes, session_box_name
 import time
 import sys
 
+APP_ID = 743654314
+
 def get_app_client():
-    """Get connected app client"""
-    algorand = algokit_utils.AlgorandClient.from_environment()
-    deployer = algorand.account.from_environment('DEPLOYER')
-    
-    factory = AlgoRewardsContractFactory(
-        algorand=algorand,
-        default_sender=deployer.address
-    )
-    
-    return factory.get_app_client_by_id(app_id=743654314), deployer.address
+    """Get connected app client (built once, then reused)"""
+    return registry.get(APP_ID), registry.deployer()
+
+def get_session_metadata_url(app_client, session_id):
+    """Metadata URL stored in the session's box (None if the session does not exist)"""
+    session = get_session_record(app_client.algorand.client.algod, app_client.app_id, session_id)
+    return session["metadata_url"] if session else None
 
 def create_session(session_name, description, custom_id=None):
     """Create a new session"""
@@ -31,11 +34,22 @@ def create_session(session_name, description, custom_id=None):
     else:
         session_id = f"session-{int(time.time())}"
     
-    metadata_url = f"ipfs://QmMetadata{session_id}Hash"
+    # Pin the badge metadata (once per document) before the session points at it
+    ipfs_manager = IPFSMetadataManager(cache=MetadataCache())
+    metadata = ipfs_manager.create_badge_metadata(
+        session_name=session_name,
+        session_description=description,
+        session_id=session_id
+    )
+    metadata_url = ipfs_manager.compute_ipfs_url(metadata)
+    uploaded_url = ipfs_manager.upload_to_ipfs(metadata)
+    if uploaded_url != metadata_url:
+        raise Exception(f"Pinata returned {uploaded_url}, expected {metadata_url}")
     
     print(f"🎯 Creating Session: {session_name}")
     print(f"📝 Session ID: {session_id}")
     print(f"📝 Description: {description}")
+    print(f"📄 Metadata: {metadata_url}")
     print()
     
     # Create session
@@ -43,46 +57,53 @@ def create_session(session_name, description, custom_id=None):
         session_id,
         session_name,
         description,
-        metadata_url
+        metadata_url_to_cid_bytes(metadata_url),
+        0,  # start_round: open now
+        0,  # end_round: no end
+        0   # max_claims: unlimited
+    ), params=algokit_utils.CommonAppCallParams(
+        box_references=[session_box_name(session_id)]
     ))
     
     print("✅ SESSION CREATED!")
+    print(f"🔢 Session Number: {response.abi_return.session_number}")
     print(f"📄 Transaction: https://testnet.algoexplorer.io/tx/{response.tx_id}")
     print(f"💡 Use this Session ID to claim badges: {session_id}")
     print()
     
     return session_id
 
-def claim_badge(session_id, badge_name=None, recipient=None):
-    """Claim a badge for a session"""
+def claim_badge(session_id, recipient=None):
+    """Claim a badge for a session (name and metadata come from the session)"""
     app_client, your_address = get_app_client()
     
-    if not badge_name:
-        badge_name = f"Badge for {session_id}"
-    
     if not recipient:
         recipient = your_address
     
-    asset_unit = f"BADGE{int(time.time()) % 10000}"
-    metadata_url = f"ipfs://QmBadgeMetadata{session_id}Hash"
+    metadata_url = get_session_metadata_url(app_client, session_id)
+    if metadata_url is None:
+        print(f"❌ Session {session_id} does not exist")
+        return
     
-    print(f"🏆 Claiming Badge: {badge_name}")
+    print(f"🏆 Claiming Badge")
     print(f"🎫 Session ID: {session_id}")
     print(f"👤 Recipient: {recipient}")
+    print(f"📄 Metadata: {metadata_url}")
     print()
     
     # Claim badge
-    response = app_client.send.claim_badge(args=(
-        session_id,
-        recipient,
-        badge_name,
-        asset_unit,
-        metadata_url
-    ))
+    response, asset_id, _claim_number = send_claim(app_client, session_id, recipient)
     
     print("✅ BADGE CLAIMED!")
     print(f"📄 Transaction: https://testnet.algoexplorer.io/tx/{response.tx_id}")
-    print(f"🎉 Response: {response.abi_return}")
+    print(f"🏅 Badge Asset ID: {asset_id}")
+    
+    # The badge sits in the app until the recipient opts in; we can sign for ourselves
+    if recipient == your_address:
+        delivery = deliver_badge(app_client, session_id, recipient, asset_id)
+        print(f"📬 Badge delivered: https://testnet.algoexplorer.io/tx/{delivery.tx_ids[-1]}")
+    else:
+        print("📬 Recipient must opt in and call deliver_badge to receive it")
     print()
 
 def interactive_mode():
@@ -90,6 +111,9 @@ def interactive_mode():
     print("🎮 AlgoRewards Interactive Session Manager")
     print("=" * 50)
     
+    # Connect once up front so each create/claim starts immediately
+    registry.warm_up(APP_ID)
+    
     while True:
         print("\nWhat would you like to do?")
         print("1. Create a new session")
@@ -114,12 +138,7 @@ def interactive_mode():
             print("\n🏆 Claiming Badge")
             print("-" * 20)
             session_id = input("Session ID: ").strip()
-            badge_name = input("Badge name (optional): ").strip()
-            
-            if badge_name == "":
-                badge_name = None
-                
-            claim_badge(session_id, badge_name)
+            claim_badge(session_id)
             
         elif choice == "3":
             print("\n👋 Goodbye!")
@@ -146,12 +165,12 @@ def main():
     elif sys.argv[1] == "claim":
         # Command line badge claim
         if len(sys.argv) < 3:
-            print("Usage: python my_session_manager.py claim <session_id> [badge_name]")
+            print("Usage: python my_session_manager.py claim <session_id> [recipient]")
             return
         
         session_id = sys.argv[2]
-        badge_name = sys.argv[3] if len(sys.argv) > 3 else None
-        claim_badge(session_id, badge_name)
+        recipient = sys.argv[3] if len(sys.argv) > 3 else None
+        claim_badge(session_id, recipient)
         
     else:
         print("Commands:")
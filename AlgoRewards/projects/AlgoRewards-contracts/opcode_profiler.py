@@ -0,0 +1,299 @@
+"""
+Opcode-cost profiler for AlgoRewardsContract ABI methods.
+
+Simulates each method with execution tracing enabled and maps every
+executed program counter back to a contract.py line through the puya
+source map (AlgoRewardsContract.approval.puya.map) written by
+`algokit project run build`. Prints a per-line cost table and the
+group's remaining opcode budget for each method.
+
+Simulation never commits, so scenarios can create sessions and claims as
+setup calls in the same group as the method being profiled.
+
+Usage:
+    python opcode_profiler.py [method ...] [--top N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import algokit_utils
+from algokit_utils import AlgoAmount, AppClientMethodCallParams, PaymentParams
+from algosdk import encoding
+from algosdk.v2client.models import SimulateTraceConfig
+from dotenv import load_dotenv
+
+from batch_claims import op_up_calls
+from ipfs_cid import cid_to_bytes
+
+
+ARTIFACTS = Path(__file__).parent / "smart_contracts" / "artifacts" / "algo_rewards_contract"
+APPROVAL_MAP = ARTIFACTS / "AlgoRewardsContract.approval.puya.map"
+APP_SPEC = ARTIFACTS / "AlgoRewardsContract.arc56.json"
+
+SAMPLE_CID = "bafkreihddthm5xr6n5fhtyg3kv4vd2wwfhewgm4j3qamynwc4f4k7tiwoa"
+SAMPLE_URL = f"ipfs://{SAMPLE_CID}"
+BATCH_SIZE = 7  # Recipients one claim_badges_batch call can reference
+
+# Opcodes that do not cost 1 (AVM v10). Variable-cost opcodes are charged
+# their base cost, so simulate's app-budget-consumed is the exact total.
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "divmodw": 20,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+    "json_ref": 25,
+    "base64_decode": 1,
+}
+
+
+class LineCost(NamedTuple):
+    """Opcode cost attributed to one contract.py line"""
+    line: int
+    hits: int
+    cost: int
+    source: str
+
+
+# --------------------------- Source map --------------------------- #
+
+_BASE64 = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")}
+
+
+def _decode_vlq(segment: str) -> List[int]:
+    """Base64 VLQ fields of one source map segment"""
+    values, shift, value = [], 0, 0
+    for char in segment:
+        digit = _BASE64[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+        else:
+            values.append(-(value >> 1) if value & 1 else value >> 1)
+            shift, value = 0, 0
+    return values
+
+
+def load_pc_lines(map_path: Path = APPROVAL_MAP) -> Tuple[Dict[int, int], Dict[int, str], Path]:
+    """
+    Decode a puya source map
+
+    puya writes one mapping group per program byte, so the group index is
+    the program counter.
+
+    Returns:
+        (pc -> 1-based source line, pc -> TEAL op text, source file path)
+    """
+    source_map = json.loads(map_path.read_text())
+    pc_lines: Dict[int, int] = {}
+    source, line = 0, 0
+    for pc, group in enumerate(source_map["mappings"].split(";")):
+        for segment in filter(None, group.split(",")):
+            fields = _decode_vlq(segment)
+            if len(fields) >= 4:
+                source += fields[1]
+                line += fields[2]
+                pc_lines[pc + source_map.get("op_pc_offset", 0)] = line + 1
+
+    ops = {int(pc): event["op"] for pc, event in source_map["pc_events"].items() if "op" in event}
+    source_path = (map_path.parent / source_map["sources"][0]).resolve()
+    return pc_lines, ops, source_path
+
+
+def opcode_cost(op: str) -> int:
+    """Cost of one TEAL op line (with immediates, e.g. 'ecdsa_verify Secp256r1')"""
+    name, _, immediates = op.partition(" ")
+    if name == "ecdsa_verify" and immediates.startswith("Secp256r1"):
+        return 2500
+    if name == "ecdsa_pk_decompress" and immediates.startswith("Secp256r1"):
+        return 2400
+    return OPCODE_COSTS.get(name, 1)
+
+
+def attribute_costs(
+    trace: List[Dict[str, Any]],
+    pc_lines: Dict[int, int],
+    ops: Dict[int, str],
+    source_lines: List[str]
+) -> List[LineCost]:
+    """Sum opcode cost per source line over an approval-program trace"""
+    hits: Dict[int, int] = defaultdict(int)
+    costs: Dict[int, int] = defaultdict(int)
+    for step in trace:
+        pc = step["pc"]
+        line = pc_lines.get(pc, 0)  # 0: compiler-generated (routing, ABI decoding)
+        hits[line] += 1
+        costs[line] += opcode_cost(ops.get(pc, ""))
+    return sorted(
+        (
+            LineCost(line, hits[line], costs[line],
+                     source_lines[line - 1].strip() if 0 < line <= len(source_lines) else "<generated>")
+            for line in costs
+        ),
+        key=lambda entry: -entry.cost,
+    )
+
+
+# --------------------------- Scenarios --------------------------- #
+
+def _call(method: str, *args, fee: int = 1000) -> Callable[[str, str], AppClientMethodCallParams]:
+    """Deferred method call, bound to a session ID and sender later"""
+    def bind(session_id: str, sender: str) -> AppClientMethodCallParams:
+        resolved = [arg(session_id, sender) if callable(arg) else arg for arg in args]
+        return AppClientMethodCallParams(
+            method=method, args=resolved, sender=sender, static_fee=AlgoAmount(micro_algo=fee)
+        )
+    return bind
+
+
+def _session(session_id, _sender):
+    return session_id
+
+
+def _sender(_session_id, sender):
+    return sender
+
+
+def _sender_batch(_session_id, sender):
+    return [sender] * BATCH_SIZE
+
+
+def _new_recipients(_session_id, _sender):
+    return [encoding.encode_address(os.urandom(32)) for _ in range(BATCH_SIZE)]
+
+
+_CREATE = _call("create_session", _session, "Profiling session", "Opcode profile", cid_to_bytes(SAMPLE_CID), 0, 0, 0)
+_CLAIM = _call("claim_badge", _session, _sender, fee=2000)
+
+# method -> (setup calls, profiled call); setups run earlier in the same group
+SCENARIOS: Dict[str, Tuple[List[Callable], Callable]] = {
+    "hello": ([], _call("hello", "AlgoRewards")),
+    "get_session_info": ([_CREATE], _call("get_session_info", _session)),
+    "create_session": ([], _CREATE),
+    "get_session": ([_CREATE], _call("get_session", _session)),
+    "claim_badge": ([_CREATE], _CLAIM),
+    "claim_badges_batch": ([_CREATE], _call(
+        "claim_badges_batch", _session, _new_recipients,
+        fee=1000 * (1 + BATCH_SIZE + op_up_calls([[""] * BATCH_SIZE])),
+    )),
+    "check_claim_status": ([_CREATE, _CLAIM], _call("check_claim_status", _session, _sender)),
+    "check_claim_statuses": (
+        [_CREATE, _CLAIM], _call("check_claim_statuses", _session, _sender_batch)
+    ),
+    "mint_nft": ([], _call("mint_nft", "AlgoRewards Badge", "ARBADGE", SAMPLE_URL, _sender)),
+    "prepare_nft_creation": ([], _call("prepare_nft_creation", "AlgoRewards Badge", "ARBADGE", SAMPLE_URL)),
+}
+
+
+# --------------------------- Profiling --------------------------- #
+
+def profile_method(app_client, sender: str, method: str) -> Dict[str, Any]:
+    """
+    Simulate one scenario and return its trace and budget figures
+
+    The group starts with a payment covering the minimum balance of any
+    boxes and assets the calls create.
+    """
+    setups, call = SCENARIOS[method]
+    session_id = f"profile-{uuid.uuid4().hex[:12]}"
+
+    group = app_client.algorand.new_group().add_payment(PaymentParams(
+        sender=sender, receiver=app_client.app_address, amount=AlgoAmount(algo=1)
+    ))
+    for setup in setups:
+        group.add_app_call_method_call(app_client.params.call(setup(session_id, sender)))
+    group.add_app_call_method_call(app_client.params.call(call(session_id, sender)))
+
+    result = group.simulate(
+        skip_signatures=True,
+        allow_unnamed_resources=True,
+        exec_trace_config=SimulateTraceConfig(enable=True),
+    )
+    txn_group = result.simulate_response["txn-groups"][0]
+    profiled = txn_group["txn-results"][-1]
+    return {
+        "method": method,
+        "failure": txn_group.get("failure-message"),
+        "trace": profiled.get("exec-trace", {}).get("approval-program-trace", []),
+        "consumed": profiled.get("app-budget-consumed", 0),
+        "group_added": txn_group.get("app-budget-added", 0),
+        "group_consumed": txn_group.get("app-budget-consumed", 0),
+    }
+
+
+def print_profile(profile: Dict[str, Any], line_costs: List[LineCost], top: int):
+    """Per-line cost table for one method"""
+    headroom = profile["group_added"] - profile["group_consumed"]
+    print(f"\n⚙️  {profile['method']}: {profile['consumed']} opcode budget, "
+          f"{headroom} headroom in group ({profile['group_consumed']}/{profile['group_added']})")
+    if profile["failure"]:
+        print(f"   ❌ {profile['failure']}")
+    print(f"   {'line':>5}{'hits':>7}{'cost':>7}{'%':>7}  source")
+    for entry in line_costs[:top]:
+        share = 100 * entry.cost / profile["consumed"] if profile["consumed"] else 0.0
+        print(f"   {entry.line or '-':>5}{entry.hits:>7}{entry.cost:>7}{share:>6.1f}%  {entry.source[:70]}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Profile AlgoRewardsContract opcode costs per source line")
+    parser.add_argument("methods", nargs="*", help=f"methods to profile (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--top", type=int, default=15, help="lines shown per method")
+    parser.add_argument("--app-id", type=int, default=int(os.getenv("APP_ID", "0")),
+                        help="deployed app to simulate against (defaults to $APP_ID)")
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    if not args.app_id:
+        parser.error("--app-id or APP_ID is required")
+    unknown = set(args.methods) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"No scenario for: {', '.join(sorted(unknown))}")
+
+    pc_lines, ops, source_path = load_pc_lines()
+    source_lines = source_path.read_text().splitlines()
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer = algorand.account.from_environment("DEPLOYER")
+    app_client = algokit_utils.AppClient(algokit_utils.AppClientParams(
+        app_id=args.app_id,
+        algorand=algorand,
+        app_spec=APP_SPEC.read_text(),
+        default_sender=deployer.address,
+    ))
+
+    print(f"📊 Opcode profile of app {args.app_id} ({source_path.name})")
+    for method in args.methods or SCENARIOS:
+        try:
+            profile = profile_method(app_client, deployer.address, method)
+        except Exception as e:
+            print(f"\n⚙️  {method}: simulate failed: {e}", file=sys.stderr)
+            continue
+        print_profile(profile, attribute_costs(profile["trace"], pc_lines, ops, source_lines), args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Fee-free, cached reads of AlgoRewardsContract readonly methods.
+
+Readonly ABI methods (get_session, get_session_info, check_claim_status,
+check_claim_statuses, hello) are answered by simulating the call, so
+they cost no fee and need no block wait. Results are cached for the
+round they were simulated at. A round's state cannot change, so a
+repeated lookup within the same round is served from memory. The round
+is tracked without polling algod. Each simulate response reports its
+round, and wall-clock time estimates progress between simulates.
+
+check_claim_statuses answers whole rosters with a few simulates of
+grouped check_claim_statuses calls. Simulate resolves box references
+itself (allow_unnamed_resources), so the 8-reference limit does not
+apply. Each call instead carries as many addresses as the 2048-byte
+app-argument limit allows: 63 for session IDs of up to 24 bytes, one
+fewer per further 32 bytes. A group of 16 calls answers up to about
+1,000 lookups per simulate request. Lookups cost more than a call's
+700 opcodes, so the simulate request also grants the extra opcode
+budget the group needs.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from algokit_utils import AppClientMethodCallParams
+
+from batch_claims import MAX_GROUP_SIZE, OPCODE_BUDGET_PER_CALL
+
+
+# Average Algorand block time, used to estimate round progress between simulates
+DEFAULT_ROUND_TIME = 2.8
+
+# App arguments per transaction, in total
+MAX_APP_ARGS_BYTES = 2048
+# check_claim_statuses opcode cost, measured on the AVM (60 per call + 83 per address) and rounded up
+STATUS_CALL_OPCODES = 70
+STATUS_ADDRESS_OPCODES = 90
+
+
+def addresses_per_status_call(session_id: str) -> int:
+    """
+    Addresses one check_claim_statuses call can carry for session_id
+
+    App arguments: 4-byte selector, length-prefixed session ID and a
+    length-prefixed array of 32-byte addresses.
+    """
+    fixed = 4 + 2 + len(session_id.encode()) + 2
+    return (MAX_APP_ARGS_BYTES - fixed) // 32
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable cache key for ABI arguments (lists become tuples)"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    return value
+
+
+class ReadonlyCallCache:
+    """
+    Simulate-backed readonly calls with a per-round result cache
+
+    Thread-safe. Two callers missing the same key at once may both
+    simulate it; the results are identical.
+    """
+
+    def __init__(self, app_client, round_time: float = DEFAULT_ROUND_TIME, max_entries: int = 10_000):
+        """
+        Args:
+            app_client: AlgoRewardsContractClient (or a generic AppClient)
+            round_time: Seconds per round used to estimate round progress
+            max_entries: Cached results kept before the cache is cleared
+        """
+        self.app_client = getattr(app_client, "app_client", app_client)
+        self.round_time = round_time
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        # (app ID, sender, method, args) -> return value
+        self._results: Dict[Tuple[int, Optional[str], str, Hashable], Any] = {}
+        self._round = 0
+        self._round_seen_at = 0.0
+
+        self.hits = 0
+        self.misses = 0
+
+    def call(self, method: str, args: Sequence[Any] = (), sender: Optional[str] = None) -> Any:
+        """
+        Return value of a readonly method, simulated at most once per round
+
+        Args:
+            method: ABI method name or signature, e.g. "check_claim_status"
+            args: Method arguments in ABI order
+            sender: Account to simulate as (defaults to the client's default sender)
+
+        Returns:
+            The decoded ABI return value
+        """
+        # Results depend on the app and may depend on the sender (Txn.sender)
+        key = (self.app_client.app_id, sender, method, _freeze(args))
+        with self._lock:
+            self._expire()
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]
+            self.misses += 1
+
+        value, round_number = self._simulate(method, list(args), sender)
+
+        with self._lock:
+            self._observe_round(round_number)
+            if round_number == self._round:
+                if len(self._results) >= self.max_entries:
+                    self._results.clear()
+                self._results[key] = value
+        return value
+
+    def observe_round(self, round_number: int):
+        """Record a round seen elsewhere (e.g. a confirmation); newer rounds drop the cache"""
+        with self._lock:
+            self._observe_round(round_number)
+
+    def _observe_round(self, round_number: int):
+        """observe_round with the lock held"""
+        if round_number > self._round:
+            self._round = round_number
+            self._round_seen_at = time.monotonic()
+            self._results.clear()
+
+    def invalidate(self):
+        """Drop every cached result, e.g. after sending a state-changing call"""
+        with self._lock:
+            self._results.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the round results are cached for"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "cached_round": self._round,
+                "entries": len(self._results),
+            }
+
+    def _expire(self):
+        """Drop results once a new round has probably been produced (lock held)"""
+        if self._results and time.monotonic() - self._round_seen_at >= self.round_time:
+            self._results.clear()
+
+    def _simulate(self, method: str, args: list, sender: Optional[str]) -> Tuple[Any, int]:
+        """Simulate one call; one algod request when suggested params are cached"""
+        params = AppClientMethodCallParams(method=method, args=args, sender=sender)
+        result = (
+            self.app_client.algorand.new_group()
+            .add_app_call_method_call(self.app_client.params.call(params))
+            .simulate(skip_signatures=True, allow_unnamed_resources=True)
+        )
+        return result.returns[0].value, result.simulate_response["last-round"]
+
+
+def check_claim_statuses(
+    app_client,
+    pairs: Iterable[Tuple[str, str]],
+    max_workers: int = 8,
+    sender: Optional[str] = None
+) -> List[int]:
+    """
+    Claim status of many (session_id, address) pairs in a few simulate requests
+
+    Pairs are packed as many per check_claim_statuses call as the app
+    arguments fit (see addresses_per_status_call) and 16 calls per
+    simulated group, so each request answers up to about 1,000 lookups.
+    The groups are simulated concurrently.
+
+    Args:
+        app_client: AlgoRewardsContractClient (or a generic AppClient)
+        pairs: (session_id, recipient address) pairs
+        max_workers: Simulate requests in flight
+        sender: Account to simulate as (defaults to the client's default sender)
+
+    Returns:
+        Badge asset ID per pair, in input order (0 = unclaimed)
+    """
+    app_client = getattr(app_client, "app_client", app_client)
+    pairs = list(pairs)
+
+    # (session_id, pair indices) per app call, each call within one session
+    by_session: Dict[str, List[int]] = {}
+    for index, (session_id, _) in enumerate(pairs):
+        by_session.setdefault(session_id, []).append(index)
+    calls = [
+        (session_id, indices[start:start + per_call])
+        for session_id, indices in by_session.items()
+        for per_call in [addresses_per_status_call(session_id)]
+        for start in range(0, len(indices), per_call)
+    ]
+    groups = [calls[start:start + MAX_GROUP_SIZE] for start in range(0, len(calls), MAX_GROUP_SIZE)]
+
+    def simulate(group):
+        required = sum(STATUS_CALL_OPCODES + STATUS_ADDRESS_OPCODES * len(indices) for _, indices in group)
+        extra_budget = max(0, required - OPCODE_BUDGET_PER_CALL * len(group))
+        composer = app_client.algorand.new_group()
+        for session_id, indices in group:
+            composer.add_app_call_method_call(app_client.params.call(AppClientMethodCallParams(
+                method="check_claim_statuses",
+                args=[session_id, [pairs[index][1] for index in indices]],
+                sender=sender,
+            )))
+        return composer.simulate(
+            skip_signatures=True, allow_unnamed_resources=True, extra_opcode_budget=extra_budget
+        ).returns
+
+    statuses = [0] * len(pairs)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for group, returns in zip(groups, executor.map(simulate, groups)):
+            for (_, indices), returned in zip(group, returns):
+                for index, asset_id in zip(indices, returned.value):
+                    statuses[index] = asset_id
+    return statuses
+
+
+def claim_bitmap(statuses: Sequence[int]) -> bytes:
+    """
+    Pack claim statuses into a bitmap, most significant bit first
+
+    Bit i (byte i // 8, mask 0x80 >> i % 8) is set when pair i has claimed.
+    """
+    bitmap = bytearray((len(statuses) + 7) // 8)
+    for index, asset_id in enumerate(statuses):
+        if asset_id:
+            bitmap[index >> 3] |= 0x80 >> (index & 7)
+    return bytes(bitmap)
@@ -0,0 +1,59 @@
+"""
+Off-chain access to AlgoRewardsContract's box-storage session registry.
+
+Each session is a fixed-width 100-byte SessionRecord box, so a session can
+be read with a single box fetch from algod and decoded without an ABI call.
+"""
+
+import base64
+import hashlib
+import struct
+from typing import Any, Dict, Optional
+
+from algosdk.error import AlgodHTTPError
+
+from ipfs_cid import bytes_to_cid, cid_from_ipfs_url, cid_to_bytes
+
+
+# Must match AlgoRewardsContract.sessions (BoxMap key_prefix) and SessionRecord
+SESSION_BOX_PREFIX = b"s"
+SESSION_RECORD = struct.Struct(">32s36sQQQQ")
+
+
+def session_box_name(session_id: str) -> bytes:
+    """Box name of a session record: prefix || sha256(session_id)"""
+    return SESSION_BOX_PREFIX + hashlib.sha256(session_id.encode("utf-8")).digest()
+
+
+def metadata_url_to_cid_bytes(metadata_url: str) -> bytes:
+    """36-byte binary CID for create_session's metadata_cid argument"""
+    return cid_to_bytes(cid_from_ipfs_url(metadata_url))
+
+
+def decode_session_record(data: bytes) -> Dict[str, Any]:
+    """Decode a SessionRecord box value"""
+    id_hash, cid, start_round, end_round, max_claims, claim_count = SESSION_RECORD.unpack(data)
+    return {
+        "id_hash": id_hash,
+        "metadata_url": f"ipfs://{bytes_to_cid(cid)}",
+        "start_round": start_round,
+        "end_round": end_round,
+        "max_claims": max_claims,
+        "claim_count": claim_count,
+    }
+
+
+def get_session_record(algod_client, app_id: int, session_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a session record straight from the app's box storage
+
+    Returns:
+        Decoded record, or None if the session does not exist
+    """
+    try:
+        box = algod_client.application_box_by_name(app_id, session_box_name(session_id))
+    except AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+    return decode_session_record(base64.b64decode(box["value"]))
@@ -1,8 +1,11 @@
 import dataclasses
 import importlib
+import json
 import logging
+import re
 import subprocess
 import sys
+import tempfile
 from collections.abc import Callable
 from pathlib import Path
 from shutil import rmtree
@@ -10,6 +13,8 @@ from shutil import rmtree
 from algokit_utils.config import config
 from dotenv import load_dotenv
 
+from abi_encoders import method_selector, method_signature, write_encoders
+
 # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
 # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
 # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
@@ -86,10 +91,12 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+def build(output_dir: Path, contract_path: Path, lazy_client: bool = False) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
     If the output directory already exists, it is cleared.
+    Precompiled per-method ABI encoders are generated next to the client (see abi_encoders.py).
+    With lazy_client, the generated client is rewritten to load lazily (see make_client_lazy).
     """
     output_dir = output_dir.resolve()
     if output_dir.exists():
@@ -152,15 +159,151 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
+            if deployment_extension == "py":
+                for client_path in output_dir.glob("*_client.py"):
+                    encoders_path = client_path.with_name(
+                        client_path.name.replace("_client.py", "_encoders.py")
+                    )
+                    write_encoders(output_dir / file_name, encoders_path)
+                    logger.info(f"Generated {encoders_path.name}")
+                    if lazy_client:
+                        make_client_lazy(client_path, output_dir / file_name)
     if client_file:
         return output_dir / client_file
     return output_dir
 
 
+def check(output_dir: Path, contract_path: Path, lazy_client: bool = False) -> list[str]:
+    """
+    Rebuilds the contract in a scratch directory and compares it with the checked-in artifacts.
+    Run it before committing a contract change: the TEAL, app spec, client and encoders
+    must be regenerated in the same commit as the source.
+
+    Returns:
+        Names of artifacts that are missing, stale or no longer generated
+    """
+    # A sibling of output_dir, so relative paths in the source maps come out the same
+    with tempfile.TemporaryDirectory(dir=output_dir.parent, prefix=f".{output_dir.name}-") as scratch:
+        fresh_dir = Path(scratch)
+        build(fresh_dir, contract_path, lazy_client)
+        fresh = {file.name: file.read_bytes() for file in fresh_dir.iterdir() if file.is_file()}
+    checked_in = {
+        file.name: file.read_bytes()
+        for file in output_dir.iterdir()
+        if file.is_file() and not file.name.startswith(".")
+    } if output_dir.exists() else {}
+    return sorted(
+        name for name in fresh.keys() | checked_in.keys()
+        if fresh.get(name) != checked_in.get(name)
+    )
+
+
+# ------------------------- Lazy Client -------------------------- #
+
+# Imports only needed for annotations; deferred to type-checking time
+_ANNOTATION_ONLY_IMPORTS = {
+    "SourceMap": "from algosdk.source_map import SourceMap\n",
+    "SimulateTraceConfig": "from algosdk.v2client.models import SimulateTraceConfig\n",
+}
+_EAGER_SPEC = "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)\n"
+_LAZY_SPEC = '''_app_spec_cache: list = []
+
+def _app_spec() -> algokit_utils.Arc56Contract:
+    """Parse the app spec on first use"""
+    if not _app_spec_cache:
+        _app_spec_cache.append(algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON))
+    return _app_spec_cache[0]
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Method selectors precomputed at build time: signature -> 4-byte selector
+METHOD_SELECTORS: dict[str, bytes] = {selectors}
+'''
+
+
+def method_selectors(app_spec_path: Path) -> dict[str, bytes]:
+    """ABI method signature -> selector for every method in an ARC-56 spec"""
+    return {
+        method_signature(method): method_selector(method_signature(method))
+        for method in json.loads(app_spec_path.read_text())["methods"]
+    }
+
+
+def make_client_lazy(client_path: Path, app_spec_path: Path) -> None:
+    """
+    Rewrite a generated client so importing it stays cheap.
+
+    - The ARC-56 spec is parsed on first use instead of at import
+      (module-level APP_SPEC still works through __getattr__).
+    - Annotation-only imports (SourceMap, SimulateTraceConfig) move under
+      TYPE_CHECKING and their annotations are quoted.
+    - A METHOD_SELECTORS table is embedded so callers can route or decode
+      calls without hashing signatures at runtime.
+    """
+    source = client_path.read_text()
+    if _EAGER_SPEC not in source:
+        raise Exception(f"Unexpected client layout, cannot make {client_path.name} lazy")
+
+    deferred = []
+    for name, import_line in _ANNOTATION_ONLY_IMPORTS.items():
+        if import_line in source:
+            source = source.replace(import_line, "")
+            source = re.sub(rf"(?<![\w\"]){name} \| None", f'"{name} | None"', source)
+            deferred.append(import_line)
+    if deferred:
+        source = source.replace(
+            "# utils\n",
+            "if typing.TYPE_CHECKING:\n" + "".join(f"    {line}" for line in deferred) + "# utils\n",
+            1,
+        )
+
+    selectors = "{\n" + "".join(
+        f"    {signature!r}: {selector!r},\n"
+        for signature, selector in method_selectors(app_spec_path).items()
+    ) + "}"
+    source = source.replace(_EAGER_SPEC, _LAZY_SPEC.replace("{selectors}", selectors))
+    source = re.sub(r"(?<![\w.\"])APP_SPEC\b", "_app_spec()", source)
+    client_path.write_text(source)
+    logger.info(f"Rewrote {client_path.name} for lazy loading")
+
+
+def measure_import_time(module: str, top: int = 15) -> float:
+    """
+    Import a module in a fresh interpreter with -X importtime and log the slowest imports.
+
+    Returns:
+        Total import time of the module in milliseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root_path.parent,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode:
+        raise Exception(f"Could not import {module}:\n{result.stderr}")
+
+    timings = []  # (cumulative us, self us, package)
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \| (.*)$", line)
+        if match:
+            timings.append((int(match[2]), int(match[1]), match[3]))
+    total = next((t for t in reversed(timings) if t[2].strip() == module), max(timings))[0]
+
+    logger.info(f"Importing {module} took {total / 1000:.1f} ms; slowest imports:")
+    for cumulative, own, package in sorted(timings, reverse=True)[:top]:
+        logger.info(f"{cumulative / 1000:>9.1f} ms cumulative {own / 1000:>8.1f} ms self  {package}")
+    return total / 1000
+
+
 # --------------------------- Main Logic --------------------------- #
 
 
-def main(action: str, contract_name: str | None = None) -> None:
+def main(action: str, contract_name: str | None = None, lazy_client: bool = False) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
     # Filter contracts based on an optional specific contract name.
@@ -174,7 +317,7 @@ def main(action: str, contract_name: str | None = None) -> None:
         case "build":
             for contract in filtered_contracts:
                 logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+                build(artifact_path / contract.name, contract.path, lazy_client)
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -191,10 +334,26 @@ def main(action: str, contract_name: str | None = None) -> None:
                 if contract.deploy:
                     logger.info(f"Deploying app {contract.name}")
                     contract.deploy()
+        case "check":
+            stale = {
+                contract.name: check(artifact_path / contract.name, contract.path, lazy_client)
+                for contract in filtered_contracts
+            }
+            for name, files in stale.items():
+                if files:
+                    logger.error(f"Artifacts of {name} are out of date, rebuild them: {', '.join(files)}")
+            if any(stale.values()):
+                sys.exit(1)
+            logger.info("Artifacts match the contract sources")
+        case "importtime":
+            for contract in filtered_contracts:
+                measure_import_time(
+                    f"smart_contracts.artifacts.{contract.name}.{contract.name}_client"
+                )
         case "all":
             for contract in filtered_contracts:
                 logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+                build(artifact_path / contract.name, contract.path, lazy_client)
                 if contract.deploy:
                     logger.info(f"Deploying {contract.name}")
                     contract.deploy()
@@ -203,9 +362,12 @@ def main(action: str, contract_name: str | None = None) -> None:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
+    # --lazy-client: emit clients that parse the spec and import heavy modules on first use
+    lazy = "--lazy-client" in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--lazy-client"]
+    if len(args) > 1:
+        main(args[0], args[1], lazy)
+    elif len(args) > 0:
+        main(args[0], lazy_client=lazy)
     else:
-        main("all")
+        main("all", lazy_client=lazy)
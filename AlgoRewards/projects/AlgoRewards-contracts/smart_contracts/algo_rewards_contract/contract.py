@@ -1,45 +1,339 @@
-from algopy import ARC4Contract, String, UInt64, Asset
+import typing
+
+from algopy import (
+    ARC4Contract, Account, BoxMap, Bytes, Global, OpUpFeeSource, String, Txn, UInt64, Asset,
+    arc4, ensure_budget, gtxn, itxn, op, subroutine,
+)
 from algopy.arc4 import abimethod
 
 
+Bytes32: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+# Binary CIDv1: version, codec, sha2-256 multihash code and length, 32-byte digest
+CID: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[36]]
+
+
+class SessionRecord(arc4.Struct):
+    """Fixed-width (100 byte) session record stored in a box"""
+    id_hash: Bytes32
+    metadata_cid: CID
+    start_round: arc4.UInt64
+    end_round: arc4.UInt64  # 0 = open-ended
+    max_claims: arc4.UInt64  # 0 = unlimited
+    claim_count: arc4.UInt64
+
+
+class SessionCreated(arc4.Struct):
+    """create_session result (40 bytes)"""
+    session_number: arc4.UInt64
+    id_hash: Bytes32
+
+
+class SessionDescribed(arc4.Struct):
+    """ARC-28 event logged by create_session with the display fields the session box leaves out"""
+    session_number: arc4.UInt64
+    id_hash: Bytes32
+    name: arc4.String
+    description: arc4.String
+
+
+class BadgeClaimed(arc4.Struct):
+    """claim_badge result (16 bytes)"""
+    asset_id: arc4.UInt64
+    claim_number: arc4.UInt64  # Claims made in the session, including this one
+
+
+class NftPreparation(arc4.Struct):
+    """mint_nft / prepare_nft_creation result (7 bytes)"""
+    status: arc4.UInt8
+    name_length: arc4.UInt16
+    unit_length: arc4.UInt16
+    url_length: arc4.UInt16
+
+
+# NftPreparation status codes
+STATUS_OK = 0
+STATUS_NAME_TOO_LONG = 1
+STATUS_UNIT_TOO_LONG = 2
+STATUS_URL_TOO_LONG = 3
+
+# Asset parameter limits (bytes)
+MAX_ASSET_NAME = 32
+MAX_UNIT_NAME = 8
+MAX_ASSET_URL = 96
+
+# Badge ASA fields; the per-session title and image live in the ARC-3 metadata
+BADGE_NAME = "AlgoRewards Badge"
+BADGE_UNIT = "ARBADGE"
+
+# CID prefixes (CIDv1, multicodec, sha2-256 multihash of 32 bytes)
+CID_RAW = b"\x01\x55\x12\x20"
+CID_DAG_PB = b"\x01\x70\x12\x20"
+
+# ARC-19 URLs: wallets rebuild the metadata CID from the badge's reserve address
+ARC19_URL_RAW = "template-ipfs://{ipfscid:1:raw:reserve:sha2-256}"
+ARC19_URL_DAG_PB = "template-ipfs://{ipfscid:1:dag-pb:reserve:sha2-256}"
+
+# Minimum balance of one claims box: 2500 + 400 per byte of name ("c" + 32-byte key) and value (uint64)
+CLAIM_BOX_MIN_BALANCE = 2_500 + 400 * (1 + 32 + 8)
+
+# claim_badges_batch opcode cost, measured on the AVM (155 per call + 132 per badge) and rounded up
+BATCH_CALL_OPCODES = 160
+BATCH_BADGE_OPCODES = 135
+
+
+@subroutine
+def claim_key(session_id: String, recipient_address: arc4.Address) -> Bytes:
+    """Compact claim box key: sha256(len(session_id) || session_id || recipient public key)"""
+    return op.sha256(op.itob(session_id.bytes.length) + session_id.bytes + recipient_address.bytes)
+
+
+@subroutine
+def assert_claim_paid(count: UInt64) -> None:
+    """
+    Unless the creator is claiming, require the previous group transaction to
+    pay the app the minimum balance the claims add: each badge ASA plus its claims box
+    """
+    if Txn.sender != Global.creator_address:
+        assert Txn.group_index > 0, "Claim must follow a payment to the app"
+        payment = gtxn.PaymentTransaction(Txn.group_index - 1)
+        assert payment.sender == Txn.sender, "Claim payment must come from the claimant"
+        assert payment.receiver == Global.current_application_address, "Claim payment must go to the app"
+        assert payment.amount >= count * (
+            Global.asset_create_min_balance + CLAIM_BOX_MIN_BALANCE
+        ), "Claim payment does not cover the badge's minimum balance"
+
+
+@subroutine
+def mint_badge(metadata_cid: CID) -> Asset:
+    """
+    Create a 1-of-1 ARC-19 badge ASA held by the app (inner transaction fee pooled from the caller)
+    
+    The reserve address carries the session's metadata CID digest, so the
+    badge always points at the metadata registered with the session.
+    """
+    url = String(ARC19_URL_RAW) if op.extract(metadata_cid.bytes, 0, 4) == CID_RAW else String(ARC19_URL_DAG_PB)
+    return itxn.AssetConfig(
+        total=1,
+        decimals=0,
+        default_frozen=False,
+        asset_name=BADGE_NAME,
+        unit_name=BADGE_UNIT,
+        url=url,
+        manager=Global.current_application_address,
+        reserve=Account(op.extract(metadata_cid.bytes, 4, 32)),
+        freeze=Global.current_application_address,
+        clawback=Global.current_application_address,
+        fee=0,
+    ).submit().created_asset
+
+
+@subroutine
+def check_nft_params(asset_name: String, asset_unit: String, metadata_url: String) -> NftPreparation:
+    """Check asset parameters against the ASA field limits"""
+    status = UInt64(STATUS_OK)
+    if asset_name.bytes.length > MAX_ASSET_NAME:
+        status = UInt64(STATUS_NAME_TOO_LONG)
+    elif asset_unit.bytes.length > MAX_UNIT_NAME:
+        status = UInt64(STATUS_UNIT_TOO_LONG)
+    elif metadata_url.bytes.length > MAX_ASSET_URL:
+        status = UInt64(STATUS_URL_TOO_LONG)
+    return NftPreparation(
+        status=arc4.UInt8(status),
+        name_length=arc4.UInt16(asset_name.bytes.length),
+        unit_length=arc4.UInt16(asset_unit.bytes.length),
+        url_length=arc4.UInt16(metadata_url.bytes.length),
+    )
+
+
 class AlgoRewardsContract(ARC4Contract):
     """AlgoRewards - POAP-style NFT minting contract for event attendance - Phase 4 with Enhanced Features"""
     
-    @abimethod()
-    def create_session(self, session_id: String, session_name: String, session_description: String, metadata_url: String) -> String:
-        """Create a new session - Phase 4 enhanced version"""
-        # Return enhanced message with session details
-        return "Phase4 Session created: " + session_name + " (ID: " + session_id + ", Metadata: " + metadata_url + ")"
+    def __init__(self) -> None:
+        # Session registry: sha256(session_id) -> SessionRecord
+        self.sessions = BoxMap(Bytes, SessionRecord, key_prefix=b"s")
+        # Claim registry: claim_key(session, recipient) -> badge asset ID
+        self.claims = BoxMap(Bytes, UInt64, key_prefix=b"c")
+        # Sessions created so far; numbers sessions in creation order
+        self.session_count = UInt64(0)
     
     @abimethod()
-    def claim_badge(self, session_id: String, recipient_address: String, asset_name: String, asset_unit: String, metadata_url: String) -> String:
-        """Claim a badge for attending a session - Phase 4 enhanced version"""
-        # Return enhanced message with NFT creation details
-        return "Phase4 NFT Badge created: " + asset_name + " (" + asset_unit + ") for " + recipient_address + " with metadata: " + metadata_url + " - READY FOR REAL NFT MINTING"
+    def create_session(
+        self,
+        session_id: String,
+        session_name: String,
+        session_description: String,
+        metadata_cid: CID,
+        start_round: UInt64,
+        end_round: UInt64,
+        max_claims: UInt64,
+    ) -> SessionCreated:
+        """Create a new session and return its number (name and description are logged, not stored)"""
+        assert Txn.sender == Global.creator_address, "Only the creator can create sessions"
+        assert end_round == 0 or end_round >= start_round, "Session ends before it starts"
+        prefix = op.extract(metadata_cid.bytes, 0, 4)
+        assert prefix == CID_RAW or prefix == CID_DAG_PB, "Metadata CID must be a sha2-256 raw or dag-pb CIDv1"
+        
+        id_hash = op.sha256(session_id.bytes)
+        assert id_hash not in self.sessions, "Session already exists"
+        self.sessions[id_hash] = SessionRecord(
+            id_hash=Bytes32.from_bytes(id_hash),
+            metadata_cid=metadata_cid.copy(),
+            start_round=arc4.UInt64(start_round),
+            end_round=arc4.UInt64(end_round),
+            max_claims=arc4.UInt64(max_claims),
+            claim_count=arc4.UInt64(0),
+        )
+        
+        self.session_count += 1
+        arc4.emit(SessionDescribed(
+            session_number=arc4.UInt64(self.session_count),
+            id_hash=Bytes32.from_bytes(id_hash),
+            name=arc4.String(session_name),
+            description=arc4.String(session_description),
+        ))
+        return SessionCreated(
+            session_number=arc4.UInt64(self.session_count),
+            id_hash=Bytes32.from_bytes(id_hash),
+        )
     
     @abimethod()
-    def get_session_info(self, session_id: String) -> String:
-        """Get session information"""
-        return "Phase4 Session info for: " + session_id
+    def claim_badge(self, session_id: String, recipient_address: arc4.Address) -> BadgeClaimed:
+        """Claim a badge for attending a session: validates, mints the session's badge ASA and returns its ID"""
+        # Only the recipient (or the creator on their behalf) may claim, and a
+        # recipient pays the badge's minimum balance so fresh accounts cannot drain the app
+        assert (
+            Txn.sender == recipient_address.native or Txn.sender == Global.creator_address
+        ), "Only the recipient or the creator can claim"
+        assert_claim_paid(UInt64(1))
+        session = self.reserve_claims(session_id, UInt64(1))
+        asset_id = self.issue_badge(session_id, recipient_address, session.metadata_cid.copy())
+        return BadgeClaimed(asset_id=arc4.UInt64(asset_id), claim_number=session.claim_count)
     
     @abimethod()
-    def check_claim_status(self, session_id: String, recipient_address: String) -> UInt64:
-        """Check if address has claimed badge for session"""
-        # For Phase 4, return 0 (not claimed) - in real implementation this would check global state
-        return UInt64(0)
+    def claim_badges_batch(
+        self,
+        session_id: String,
+        recipient_addresses: arc4.DynamicArray[arc4.Address],
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Claim badges for many recipients in one call (badge asset ID per recipient)"""
+        assert Txn.sender == Global.creator_address, "Only the creator can batch claim"
+        # More than four badges overrun one call's 700 opcodes; draw on the group's
+        # pooled budget first, then op-up calls paid from the caller's fee credit
+        ensure_budget(
+            BATCH_CALL_OPCODES + BATCH_BADGE_OPCODES * recipient_addresses.length,
+            OpUpFeeSource.GroupCredit,
+        )
+        session = self.reserve_claims(session_id, recipient_addresses.length)
+        metadata_cid = session.metadata_cid.copy()
+        
+        badge_ids = arc4.DynamicArray[arc4.UInt64]()
+        for recipient_address in recipient_addresses:
+            badge_ids.append(arc4.UInt64(
+                self.issue_badge(session_id, recipient_address, metadata_cid.copy())
+            ))
+        return badge_ids
+    
+    @subroutine
+    def reserve_claims(self, session_id: String, count: UInt64) -> SessionRecord:
+        """
+        Check the session exists, is open and has count badges left, then count them as claimed
+        
+        Returns:
+            The updated session record
+        """
+        id_hash = op.sha256(session_id.bytes)
+        assert id_hash in self.sessions, "Unknown session"
+        session = self.sessions[id_hash].copy()
+        assert Global.round >= session.start_round.native, "Session not open yet"
+        assert session.end_round.native == 0 or Global.round <= session.end_round.native, "Session closed"
+        claim_count: UInt64 = session.claim_count.native
+        claim_count += count
+        assert (
+            session.max_claims.native == 0 or claim_count <= session.max_claims.native
+        ), "All badges for this session have been claimed"
+        session.claim_count = arc4.UInt64(claim_count)
+        self.sessions[id_hash] = session.copy()
+        return session
+    
+    @subroutine
+    def issue_badge(self, session_id: String, recipient_address: arc4.Address, metadata_cid: CID) -> UInt64:
+        """Mint one recipient's badge and record the claim"""
+        # Each (session, recipient) pair can claim once
+        key = claim_key(session_id, recipient_address)
+        assert key not in self.claims, "Badge already claimed"
+        
+        # Mint in this call; the app holds the badge until the recipient opts in
+        badge = mint_badge(metadata_cid)
+        self.claims[key] = badge.id
+        return badge.id
     
     @abimethod()
+    def deliver_badge(self, session_id: String, recipient_address: arc4.Address) -> UInt64:
+        """
+        Transfer a claimed badge to its recipient; group after the recipient's opt-in
+        
+        A separate call from claim_badge: the opt-in must name the badge's
+        asset ID, which only exists once the claim has been confirmed.
+        """
+        badge_id, claimed = self.claims.maybe(claim_key(session_id, recipient_address))
+        assert claimed, "No badge claimed"
+        badge = Asset(badge_id)
+        recipient = recipient_address.native
+        assert recipient.is_opted_in(badge), "Recipient has not opted in to the badge"
+        assert badge.balance(Global.current_application_address) == 1, "Badge already delivered"
+        
+        itxn.AssetTransfer(
+            xfer_asset=badge,
+            asset_receiver=recipient,
+            asset_amount=1,
+            fee=0,
+        ).submit()
+        return badge_id
+    
+    @abimethod(readonly=True)
+    def get_session_info(self, session_id: String) -> SessionRecord:
+        """Get session information (the same record as get_session, under its older name)"""
+        return self.read_session(session_id)
+    
+    @abimethod(readonly=True)
+    def get_session(self, session_id: String) -> SessionRecord:
+        """Get the full session record in one box read"""
+        return self.read_session(session_id)
+    
+    @subroutine
+    def read_session(self, session_id: String) -> SessionRecord:
+        """Read a session record, failing for unknown sessions"""
+        id_hash = op.sha256(session_id.bytes)
+        assert id_hash in self.sessions, "Unknown session"
+        return self.sessions[id_hash]
+    
+    @abimethod(readonly=True)
+    def check_claim_status(self, session_id: String, recipient_address: arc4.Address) -> UInt64:
+        """Check if address has claimed badge for session (returns the badge asset ID, 0 if unclaimed)"""
+        return self.claims.get(claim_key(session_id, recipient_address), default=UInt64(0))
+    
+    @abimethod(readonly=True)
+    def check_claim_statuses(
+        self, session_id: String, recipient_addresses: arc4.DynamicArray[arc4.Address]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Check claim status for many addresses at once (badge asset ID per address, 0 if unclaimed)"""
+        statuses = arc4.DynamicArray[arc4.UInt64]()
+        for recipient_address in recipient_addresses:
+            badge_id = self.claims.get(claim_key(session_id, recipient_address), default=UInt64(0))
+            statuses.append(arc4.UInt64(badge_id))
+        return statuses
+    
+    @abimethod(readonly=True)
     def hello(self, name: String) -> String:
-        """Keep the original hello method for compatibility"""
-        return "Hello, " + name + " - Phase 4 AlgoRewards with Enhanced Features"
+        """Connectivity check kept for existing clients: echoes the name back"""
+        return name
     
     @abimethod()
-    def mint_nft(self, asset_name: String, asset_unit: String, metadata_url: String, recipient_address: String) -> String:
-        """Direct NFT minting method for Phase 4 - PREPARES FOR REAL NFT CREATION"""
-        # This method prepares the contract for real NFT creation
-        return "Phase4 NFT Prepared: " + asset_name + " (" + asset_unit + ") for " + recipient_address + " with metadata: " + metadata_url + " - CONTRACT READY FOR REAL NFT MINTING"
+    def mint_nft(self, asset_name: String, asset_unit: String, metadata_url: String, recipient_address: arc4.Address) -> NftPreparation:
+        """Check NFT parameters for a recipient before minting (status 0 = ready)"""
+        return check_nft_params(asset_name, asset_unit, metadata_url)
     
     @abimethod()
-    def prepare_nft_creation(self, asset_name: String, asset_unit: String, metadata_url: String) -> String:
-        """Prepare NFT creation parameters - Phase 4 method"""
-        return "NFT Creation Parameters: Name=" + asset_name + ", Unit=" + asset_unit + ", Metadata=" + metadata_url + " - READY FOR ASSET CREATION"
+    def prepare_nft_creation(self, asset_name: String, asset_unit: String, metadata_url: String) -> NftPreparation:
+        """Check NFT creation parameters against the ASA limits (status 0 = ready)"""
+        return check_nft_params(asset_name, asset_unit, metadata_url)
@@ -46,26 +46,33 @@ def deploy() -> None:
         test_session_description = "Learn about Algorand smart contracts and NFTs"
         test_metadata_url = "ipfs://QmYwAPJzv5CZsnA625s3Xf2nemtYgPpHdWEz79ojWnPbdG/readme.md"
         
+        from session_registry import metadata_url_to_cid_bytes, session_box_name
+        
         response = app_client.send.create_session(
             args={
                 "session_id": test_session_id,
                 "session_name": test_session_name,
                 "session_description": test_session_description,
-                "metadata_url": test_metadata_url
-            }
+                "metadata_cid": metadata_url_to_cid_bytes(test_metadata_url),
+                "start_round": 0,
+                "end_round": 0,
+                "max_claims": 0
+            },
+            params=algokit_utils.CommonAppCallParams(
+                box_references=[session_box_name(test_session_id)]
+            )
         )
         
         logger.info(
             f"Created test session on {app_client.app_name} ({app_client.app_id}) "
-            f"with session_id={test_session_id}, session_number={getattr(response, 'return', 'N/A')}"
+            f"with session_id={test_session_id}, session_number={response.abi_return.session_number}"
         )
         
-        # Test getting session info
-        session_info = app_client.send.get_session_info(
-            args={"session_id": test_session_id}
-        )
+        # Test getting session info (readonly: simulated, no fee)
+        from readonly_calls import ReadonlyCallCache
+        session_info = ReadonlyCallCache(app_client).call("get_session_info", [test_session_id])
         
-        logger.info(f"Session info: {getattr(session_info, 'return', 'N/A')}")
+        logger.info(f"Session info: {session_info}")
         
     except Exception as e:
         logger.warning(f"Test session creation failed: {e}")
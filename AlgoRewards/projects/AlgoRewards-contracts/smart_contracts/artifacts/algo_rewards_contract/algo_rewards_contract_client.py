@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}, {"type": "string", "name": "session_name"}, {"type": "string", "name": "session_description"}, {"type": "string", "name": "metadata_url"}], "name": "create_session", "returns": {"type": "string"}, "desc": "Create a new session - Phase 4 enhanced version", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}, {"type": "string", "name": "recipient_address"}, {"type": "string", "name": "asset_name"}, {"type": "string", "name": "asset_unit"}, {"type": "string", "name": "metadata_url"}], "name": "claim_badge", "returns": {"type": "string"}, "desc": "Claim a badge for attending a session - Phase 4 enhanced version", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}], "name": "get_session_info", "returns": {"type": "string"}, "desc": "Get session information", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}, {"type": "string", "name": "recipient_address"}], "name": "check_claim_status", "returns": {"type": "uint64"}, "desc": "Check if address has claimed badge for session", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "desc": "Keep the original hello method for compatibility", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "asset_name"}, {"type": "string", "name": "asset_unit"}, {"type": "string", "name": "metadata_url"}, {"type": "string", "name": "recipient_address"}], "name": "mint_nft", "returns": {"type": "string"}, "desc": "Direct NFT minting method for Phase 4 - PREPARES FOR REAL NFT CREATION", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "asset_name"}, {"type": "string", "name": "asset_unit"}, {"type": "string", "name": "metadata_url"}], "name": "prepare_nft_creation", "returns": {"type": "string"}, "desc": "Prepare NFT creation parameters - Phase 4 method", "events": [], "readonly": false, "recommendations": {}}], "name": "AlgoRewardsContract", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiABASYEBBUffHUCICgGKSBmb3IgECB3aXRoIG1ldGFkYXRhOiAxG0EBT4IHBIYwoVgENHLoBgQVF13cBCgcmN0EAr7OEQTFUsX1BAfAMcc2GgCOBwDnALEAkwB7AF0ALQADgQBDMRkURDEYRDYaAVcCADYaAlcCADYaA1cCAIgCUEkVFlcGAkxQKExQsCJDMRkURDEYRDYaAVcCADYaAlcCADYaA1cCADYaBFcCAIgBykkVFlcGAkxQKExQsCJDMRkURDEYRDYaAVcCAIgBbEkVFlcGAkxQKExQsCJDMRkURDEYRIAMFR98dQAAAAAAAAAAsCJDMRkURDEYRDYaAVcCAIgBFEkVFlcGAkxQKExQsCJDMRkURDEYRDYaAVcCADYaAlcCADYaA1cCADYaBFcCADYaBVcCAIgAjEkVFlcGAkxQKExQsCJDMRkURDEYRDYaAVcCADYaAlcCADYaA1cCADYaBFcCAIgAGUkVFlcGAkxQKExQsCJDMRlA/uQxGBREIkOKBAGAGFBoYXNlNCBTZXNzaW9uIGNyZWF0ZWQ6IIv9UIAGIChJRDogUIv8UIAMLCBNZXRhZGF0YTogUIv/UIABKVCJigUBgBpQaGFzZTQgTkZUIEJhZGdlIGNyZWF0ZWQ6IIv9UClQi/5QKlCL/FArUIv/UIAdIC0gUkVBRFkgRk9SIFJFQUwgTkZUIE1JTlRJTkdQiYoBAYAZUGhhc2U0IFNlc3Npb24gaW5mbyBmb3I6IIv/UImKAQGAB0hlbGxvLCCL/1CALSAtIFBoYXNlIDQgQWxnb1Jld2FyZHMgd2l0aCBFbmhhbmNlZCBGZWF0dXJlc1CJigQBgBVQaGFzZTQgTkZUIFByZXBhcmVkOiCL/FApUIv9UCpQi/9QK1CL/lCAJiAtIENPTlRSQUNUIFJFQURZIEZPUiBSRUFMIE5GVCBNSU5USU5HUImKAwGAHk5GVCBDcmVhdGlvbiBQYXJhbWV0ZXJzOiBOYW1lPYv9UIAHLCBVbml0PVCL/lCACywgTWV0YWRhdGE9UIv/UIAbIC0gUkVBRFkgRk9SIEFTU0VUIENSRUFUSU9OUIk=", "clear": "CoEBQw=="}, "desc": "AlgoRewards - POAP-style NFT minting contract for event attendance - Phase 4 with Enhanced Features", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxCiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgIiAoIiAiKSBmb3IgIiAiIHdpdGggbWV0YWRhdGE6ICIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQWxnb1Jld2FyZHNDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDEyCiAgICBwdXNoYnl0ZXNzIDB4ODYzMGExNTggMHgzNDcyZTgwNiAweDE1MTc1ZGRjIDB4MjgxYzk4ZGQgMHgwMmJlY2UxMSAweGM1NTJjNWY1IDB4MDdjMDMxYzcgLy8gbWV0aG9kICJjcmVhdGVfc2Vzc2lvbihzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJjbGFpbV9iYWRnZShzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiZ2V0X3Nlc3Npb25faW5mbyhzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJjaGVja19jbGFpbV9zdGF0dXMoc3RyaW5nLHN0cmluZyl1aW50NjQiLCBtZXRob2QgImhlbGxvKHN0cmluZylzdHJpbmciLCBtZXRob2QgIm1pbnRfbmZ0KHN0cmluZyxzdHJpbmcsc3RyaW5nLHN0cmluZylzdHJpbmciLCBtZXRob2QgInByZXBhcmVfbmZ0X2NyZWF0aW9uKHN0cmluZyxzdHJpbmcsc3RyaW5nKXN0cmluZyIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX3Nlc3Npb25fcm91dGVAMyBtYWluX2NsYWltX2JhZGdlX3JvdXRlQDQgbWFpbl9nZXRfc2Vzc2lvbl9pbmZvX3JvdXRlQDUgbWFpbl9jaGVja19jbGFpbV9zdGF0dXNfcm91dGVANiBtYWluX2hlbGxvX3JvdXRlQDcgbWFpbl9taW50X25mdF9yb3V0ZUA4IG1haW5fcHJlcGFyZV9uZnRfY3JlYXRpb25fcm91dGVAOQoKbWFpbl9hZnRlcl9pZl9lbHNlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBBbGdvUmV3YXJkc0NvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICBwdXNoaW50IDAgLy8gMAogICAgcmV0dXJuCgptYWluX3ByZXBhcmVfbmZ0X2NyZWF0aW9uX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjQyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBBbGdvUmV3YXJkc0NvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjQyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcHJlcGFyZV9uZnRfY3JlYXRpb24KICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX21pbnRfbmZ0X3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjM2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBBbGdvUmV3YXJkc0NvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozNgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIG1pbnRfbmZ0CiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9oZWxsb19yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQWxnb1Jld2FyZHNDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBoZWxsbwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2hlY2tfY2xhaW1fc3RhdHVzX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwMDAwCiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3Nlc3Npb25faW5mb19yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQWxnb1Jld2FyZHNDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjAKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBnZXRfc2Vzc2lvbl9pbmZvCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9jbGFpbV9iYWRnZV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxNAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQWxnb1Jld2FyZHNDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY2xhaW1fYmFkZ2UKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9zZXNzaW9uX3JvdXRlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEFsZ29SZXdhcmRzQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjcmVhdGVfc2Vzc2lvbgogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBBbGdvUmV3YXJkc0NvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDE2CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5jcmVhdGVfc2Vzc2lvbihzZXNzaW9uX2lkOiBieXRlcywgc2Vzc2lvbl9uYW1lOiBieXRlcywgc2Vzc2lvbl9kZXNjcmlwdGlvbjogYnl0ZXMsIG1ldGFkYXRhX3VybDogYnl0ZXMpIC0+IGJ5dGVzOgpjcmVhdGVfc2Vzc2lvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6OC05CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfc2Vzc2lvbihzZWxmLCBzZXNzaW9uX2lkOiBTdHJpbmcsIHNlc3Npb25fbmFtZTogU3RyaW5nLCBzZXNzaW9uX2Rlc2NyaXB0aW9uOiBTdHJpbmcsIG1ldGFkYXRhX3VybDogU3RyaW5nKSAtPiBTdHJpbmc6CiAgICBwcm90byA0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTEtMTIKICAgIC8vICMgUmV0dXJuIGVuaGFuY2VkIG1lc3NhZ2Ugd2l0aCBzZXNzaW9uIGRldGFpbHMKICAgIC8vIHJldHVybiAiUGhhc2U0IFNlc3Npb24gY3JlYXRlZDogIiArIHNlc3Npb25fbmFtZSArICIgKElEOiAiICsgc2Vzc2lvbl9pZCArICIsIE1ldGFkYXRhOiAiICsgbWV0YWRhdGFfdXJsICsgIikiCiAgICBwdXNoYnl0ZXMgIlBoYXNlNCBTZXNzaW9uIGNyZWF0ZWQ6ICIKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgIiAoSUQ6ICIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAiLCBNZXRhZGF0YTogIgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzICIpIgogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19yZXdhcmRzX2NvbnRyYWN0LmNvbnRyYWN0LkFsZ29SZXdhcmRzQ29udHJhY3QuY2xhaW1fYmFkZ2Uoc2Vzc2lvbl9pZDogYnl0ZXMsIHJlY2lwaWVudF9hZGRyZXNzOiBieXRlcywgYXNzZXRfbmFtZTogYnl0ZXMsIGFzc2V0X3VuaXQ6IGJ5dGVzLCBtZXRhZGF0YV91cmw6IGJ5dGVzKSAtPiBieXRlczoKY2xhaW1fYmFkZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjE0LTE1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjbGFpbV9iYWRnZShzZWxmLCBzZXNzaW9uX2lkOiBTdHJpbmcsIHJlY2lwaWVudF9hZGRyZXNzOiBTdHJpbmcsIGFzc2V0X25hbWU6IFN0cmluZywgYXNzZXRfdW5pdDogU3RyaW5nLCBtZXRhZGF0YV91cmw6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gNSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjE3LTE4CiAgICAvLyAjIFJldHVybiBlbmhhbmNlZCBtZXNzYWdlIHdpdGggTkZUIGNyZWF0aW9uIGRldGFpbHMKICAgIC8vIHJldHVybiAiUGhhc2U0IE5GVCBCYWRnZSBjcmVhdGVkOiAiICsgYXNzZXRfbmFtZSArICIgKCIgKyBhc3NldF91bml0ICsgIikgZm9yICIgKyByZWNpcGllbnRfYWRkcmVzcyArICIgd2l0aCBtZXRhZGF0YTogIiArIG1ldGFkYXRhX3VybCArICIgLSBSRUFEWSBGT1IgUkVBTCBORlQgTUlOVElORyIKICAgIHB1c2hieXRlcyAiUGhhc2U0IE5GVCBCYWRnZSBjcmVhdGVkOiAiCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgYnl0ZWNfMSAvLyAiICgiCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBieXRlY18yIC8vICIpIGZvciAiCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICBieXRlY18zIC8vICIgd2l0aCBtZXRhZGF0YTogIgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzICIgLSBSRUFEWSBGT1IgUkVBTCBORlQgTUlOVElORyIKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29fcmV3YXJkc19jb250cmFjdC5jb250cmFjdC5BbGdvUmV3YXJkc0NvbnRyYWN0LmdldF9zZXNzaW9uX2luZm8oc2Vzc2lvbl9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfc2Vzc2lvbl9pbmZvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMC0yMQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZ2V0X3Nlc3Npb25faW5mbyhzZWxmLCBzZXNzaW9uX2lkOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMwogICAgLy8gcmV0dXJuICJQaGFzZTQgU2Vzc2lvbiBpbmZvIGZvcjogIiArIHNlc3Npb25faWQKICAgIHB1c2hieXRlcyAiUGhhc2U0IFNlc3Npb24gaW5mbyBmb3I6ICIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19yZXdhcmRzX2NvbnRyYWN0LmNvbnRyYWN0LkFsZ29SZXdhcmRzQ29udHJhY3QuaGVsbG8obmFtZTogYnl0ZXMpIC0+IGJ5dGVzOgpoZWxsbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MzEtMzIKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGhlbGxvKHNlbGYsIG5hbWU6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjM0CiAgICAvLyByZXR1cm4gIkhlbGxvLCAiICsgbmFtZSArICIgLSBQaGFzZSA0IEFsZ29SZXdhcmRzIHdpdGggRW5oYW5jZWQgRmVhdHVyZXMiCiAgICBwdXNoYnl0ZXMgIkhlbGxvLCAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzICIgLSBQaGFzZSA0IEFsZ29SZXdhcmRzIHdpdGggRW5oYW5jZWQgRmVhdHVyZXMiCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5taW50X25mdChhc3NldF9uYW1lOiBieXRlcywgYXNzZXRfdW5pdDogYnl0ZXMsIG1ldGFkYXRhX3VybDogYnl0ZXMsIHJlY2lwaWVudF9hZGRyZXNzOiBieXRlcykgLT4gYnl0ZXM6Cm1pbnRfbmZ0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozNi0zNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgbWludF9uZnQoc2VsZiwgYXNzZXRfbmFtZTogU3RyaW5nLCBhc3NldF91bml0OiBTdHJpbmcsIG1ldGFkYXRhX3VybDogU3RyaW5nLCByZWNpcGllbnRfYWRkcmVzczogU3RyaW5nKSAtPiBTdHJpbmc6CiAgICBwcm90byA0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MzktNDAKICAgIC8vICMgVGhpcyBtZXRob2QgcHJlcGFyZXMgdGhlIGNvbnRyYWN0IGZvciByZWFsIE5GVCBjcmVhdGlvbgogICAgLy8gcmV0dXJuICJQaGFzZTQgTkZUIFByZXBhcmVkOiAiICsgYXNzZXRfbmFtZSArICIgKCIgKyBhc3NldF91bml0ICsgIikgZm9yICIgKyByZWNpcGllbnRfYWRkcmVzcyArICIgd2l0aCBtZXRhZGF0YTogIiArIG1ldGFkYXRhX3VybCArICIgLSBDT05UUkFDVCBSRUFEWSBGT1IgUkVBTCBORlQgTUlOVElORyIKICAgIHB1c2hieXRlcyAiUGhhc2U0IE5GVCBQcmVwYXJlZDogIgogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIGJ5dGVjXzEgLy8gIiAoIgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgYnl0ZWNfMiAvLyAiKSBmb3IgIgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYnl0ZWNfMyAvLyAiIHdpdGggbWV0YWRhdGE6ICIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAiIC0gQ09OVFJBQ1QgUkVBRFkgRk9SIFJFQUwgTkZUIE1JTlRJTkciCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5wcmVwYXJlX25mdF9jcmVhdGlvbihhc3NldF9uYW1lOiBieXRlcywgYXNzZXRfdW5pdDogYnl0ZXMsIG1ldGFkYXRhX3VybDogYnl0ZXMpIC0+IGJ5dGVzOgpwcmVwYXJlX25mdF9jcmVhdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6NDItNDMKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHByZXBhcmVfbmZ0X2NyZWF0aW9uKHNlbGYsIGFzc2V0X25hbWU6IFN0cmluZywgYXNzZXRfdW5pdDogU3RyaW5nLCBtZXRhZGF0YV91cmw6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjQ1CiAgICAvLyByZXR1cm4gIk5GVCBDcmVhdGlvbiBQYXJhbWV0ZXJzOiBOYW1lPSIgKyBhc3NldF9uYW1lICsgIiwgVW5pdD0iICsgYXNzZXRfdW5pdCArICIsIE1ldGFkYXRhPSIgKyBtZXRhZGF0YV91cmwgKyAiIC0gUkVBRFkgRk9SIEFTU0VUIENSRUFUSU9OIgogICAgcHVzaGJ5dGVzICJORlQgQ3JlYXRpb24gUGFyYW1ldGVyczogTmFtZT0iCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzICIsIFVuaXQ9IgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzICIsIE1ldGFkYXRhPSIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAiIC0gUkVBRFkgRk9SIEFTU0VUIENSRUFUSU9OIgogICAgY29uY2F0CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [105, 147, 195, 225, 249, 279, 333], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [386], "errorMessage": "can only call when creating"}, {"pc": [108, 150, 198, 228, 252, 282, 336], "errorMessage": "can only call when not creating"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}, {"type": "string", "name": "session_name"}, {"type": "string", "name": "session_description"}, {"type": "byte[36]", "name": "metadata_cid"}, {"type": "uint64", "name": "start_round"}, {"type": "uint64", "name": "end_round"}, {"type": "uint64", "name": "max_claims"}], "name": "create_session", "returns": {"type": "(uint64,byte[32])", "struct": "SessionCreated"}, "desc": "Create a new session and return its number (name and description are logged, not stored)", "events": [{"args": [{"type": "uint64", "name": "session_number"}, {"type": "byte[32]", "name": "id_hash"}, {"type": "string", "name": "name"}, {"type": "string", "name": "description"}], "name": "SessionDescribed", "desc": "ARC-28 event logged by create_session with the display fields the session box leaves out"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}, {"type": "address", "name": "recipient_address"}], "name": "claim_badge", "returns": {"type": "(uint64,uint64)", "struct": "BadgeClaimed"}, "desc": "Claim a badge for attending a session: validates, mints the session's badge ASA and returns its ID", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}, {"type": "address[]", "name": "recipient_addresses"}], "name": "claim_badges_batch", "returns": {"type": "uint64[]"}, "desc": "Claim badges for many recipients in one call (badge asset ID per recipient)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}, {"type": "address", "name": "recipient_address"}], "name": "deliver_badge", "returns": {"type": "uint64"}, "desc": "Transfer a claimed badge to its recipient; group after the recipient's opt-in\nA separate call from claim_badge: the opt-in must name the badge's asset ID, which only exists once the claim has been confirmed.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}], "name": "get_session_info", "returns": {"type": "(byte[32],byte[36],uint64,uint64,uint64,uint64)", "struct": "SessionRecord"}, "desc": "Get session information (the same record as get_session, under its older name)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}], "name": "get_session", "returns": {"type": "(byte[32],byte[36],uint64,uint64,uint64,uint64)", "struct": "SessionRecord"}, "desc": "Get the full session record in one box read", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}, {"type": "address", "name": "recipient_address"}], "name": "check_claim_status", "returns": {"type": "uint64"}, "desc": "Check if address has claimed badge for session (returns the badge asset ID, 0 if unclaimed)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "session_id"}, {"type": "address[]", "name": "recipient_addresses"}], "name": "check_claim_statuses", "returns": {"type": "uint64[]"}, "desc": "Check claim status for many addresses at once (badge asset ID per address, 0 if unclaimed)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "desc": "Connectivity check kept for existing clients: echoes the name back", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "asset_name"}, {"type": "string", "name": "asset_unit"}, {"type": "string", "name": "metadata_url"}, {"type": "address", "name": "recipient_address"}], "name": "mint_nft", "returns": {"type": "(uint8,uint16,uint16,uint16)", "struct": "NftPreparation"}, "desc": "Check NFT parameters for a recipient before minting (status 0 = ready)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "asset_name"}, {"type": "string", "name": "asset_unit"}, {"type": "string", "name": "metadata_url"}], "name": "prepare_nft_creation", "returns": {"type": "(uint8,uint16,uint16,uint16)", "struct": "NftPreparation"}, "desc": "Check NFT creation parameters against the ASA limits (status 0 = ready)", "events": [], "readonly": false, "recommendations": {}}], "name": "AlgoRewardsContract", "state": {"keys": {"box": {}, "global": {"session_count": {"key": "c2Vzc2lvbl9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"sessions": {"keyType": "AVMBytes", "valueType": "SessionRecord", "prefix": "cw=="}, "claims": {"keyType": "AVMBytes", "valueType": "uint64", "prefix": "Yw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"BadgeClaimed": [{"name": "asset_id", "type": "uint64"}, {"name": "claim_number", "type": "uint64"}], "NftPreparation": [{"name": "status", "type": "uint8"}, {"name": "name_length", "type": "uint16"}, {"name": "unit_length", "type": "uint16"}, {"name": "url_length", "type": "uint16"}], "SessionCreated": [{"name": "session_number", "type": "uint64"}, {"name": "id_hash", "type": "byte[32]"}], "SessionRecord": [{"name": "id_hash", "type": "byte[32]"}, {"name": "metadata_cid", "type": "byte[36]"}, {"name": "start_round", "type": "uint64"}, {"name": "end_round", "type": "uint64"}, {"name": "max_claims", "type": "uint64"}, {"name": "claim_count", "type": "uint64"}]}, "byteCode": {"approval": "CyAEAAECICYHBBUffHUBYw1zZXNzaW9uX2NvdW50AXMEAVUSIAMGgQECAAAxGEAAAyoiZzEbQQBcMRkURDEYRIILBNBm6/4E8vdwuAR6Vd9PBP3TlcUE+MZUygQt0WReBAtOzfAE6NwsTQQCvs4RBAWedoAEfAG6HjYaAI4LAIQBcgHtAooC2QLyAwsDOAOdA7AD8AAxGRQxGBQQQ4oCAYv+FRaL/lCL/1ABiYoDASKL/RVJJQ1BAEAjjACLABZJk4EIDkRXBwFMFkmTgRAORFcGAov+FRZJk4EQDkRXBgKL/xUWSZOBEA5EVwYCTwNPA1BPAlBMUEyJi/4VgQgNQQAGJIwAQv+0i/8VgWANQf+rgQOMAEL/pCI2GgFJIlkkCEsBFRJEVwIANhoCSU4CSSJZJAhMFUlOAxJENhoDSU4DSSJZJAhMFRJENhoESRWBJBJENhoFSU4CSRWBCBJEF04GNhoGSU4CSRWBCBJEF0lOCDYaB0lOAhWBCBJEMQAyCRJEQQAISwhLCg9BAHQjREsBVwAESUUMJwQSQAAMSwqABAFwEiASQQBUI0RPBAErSwFQSb1FARREIhZLAk8FUE8GUE8FUE8EUExQvyIqZUQjCCpLAWcWTFBJgAIALFCBLE8DCBZXBgJQTwNQTwJQgATqwrWDTFCwKExQsCNDIkL/qSJC/4k2GgFJIlkkCEsBFRJEVwIANhoCRwIVJRJEMQASQAAIMQAyCRJBAFAjRDEAMgkTQQAmMRZEMRYjCUk4ECMSREk4ADEAEkRJOAcyChJEOAgyD4HUkwEID0RMSSOIAlpJVyAkTwJPA08CiAKwSBZMV1wIUChMULAjQyJC/602GgFJIlkkCEsBFRJEVwIANhoCRwIiWUlOAkklCyQITwIVEkQxADIJEkSBhwELgaoBCEkyDA1BABixgQayEIEFshknBbIeJwWyHyKyAbNC/+FISwJLAYgB41cgJE4DJwZOAiJJSwIMQQArSwJXAgBLASULJVhLBUxLB4gCIkgWTwRJIlkjCBZXBgBcAExQTgMjCEL/zkYDKExQsCNDNhoBSSJZJAhLARUSRFcCADYaAkkVJRJETEsBiP1hKUxQvkwXTERKcABFAUQyCksBcABEIxJEsSOyEkyyFEmyEYEEshAisgGzFihMULAjQzYaAUkiWSQISwEVEkRXAgCIAn4oTFCwI0M2GgFJIlkkCEsBFRJEVwIAiAJlKExQsCNDNhoBSSJZJAhLARUSRFcCADYaAkkVJRJEiPzjKUxQvkwXIkxPAk0WKExQsCNDNhoBSSJZJAhLARUSRFcCADYaAkcCIllJTgIlCyQITBUSRCcGIklLAwxBADJLA1cCAEsBJQslWEsFTIj8lClMUL5MFyJMTwJNFk8CSSJZIwgWVwYAXABMUEwjCEL/x0goTFCwI0M2GgFJIlkkCEsBFRJEKExQsCNDNhoBSSJZJAhLARUSRFcCADYaAkkiWSQISwEVEkRXAgA2GgNJIlkkCEsBFRJEVwIANhoEFSUSRIj8LihMULAjQzYaAUkiWSQISwEVEkRXAgA2GgJJIlkkCEsBFRJEVwIANhoDSSJZJAhLARUSRFcCAIj79ShMULAjQ4oCAYAAi/4BK0xQRwK9RQFEvkhJMgZLAYFEWw9EgUxbSU4DQQAIMgaLAQ5BADEjREcCgVxbi/8ITIFUW0mMAEEAB0mLAA5BABIjRBZMSwFcXE8CgVxPA7uMAIkiQv/rIkL/zIoDAov9i/6I+3MpTFBJvUUBFESL/1cABCcEEkEAiIAwdGVtcGxhdGUtaXBmczovL3tpcGZzY2lkOjE6cmF3OnJlc2VydmU6c2hhMi0yNTZ9sTIKi/9XBCBJFSUSRDIKSbIssiuyKrIpsieAB0FSQkFER0WyJYARQWxnb1Jld2FyZHMgQmFkZ2WyJiKyJCKyIyOyIoEDshAisgGztDxJFk8CTL+L/4mAM3RlbXBsYXRlLWlwZnM6Ly97aXBmc2NpZDoxOmRhZy1wYjpyZXNlcnZlOnNoYTItMjU2fUL/cooBAYv/AStMUEm9RQFEvkiJ", "clear": "C4EBQw=="}, "desc": "AlgoRewards - POAP-style NFT minting contract for event attendance - Phase 4 with Enhanced Features", "events": [{"args": [{"type": "uint64", "name": "session_number"}, {"type": "byte[32]", "name": "id_hash"}, {"type": "string", "name": "name"}, {"type": "string", "name": "description"}], "name": "SessionDescribed", "desc": "ARC-28 event logged by create_session with the display fields the session box leaves out"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMiAzMgogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1IDB4NjMgInNlc3Npb25fY291bnQiIDB4NzMgMHgwMTU1MTIyMCAweDA2ODEwMSAweDAwMDAKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTU2LTE1NwogICAgLy8gIyBTZXNzaW9ucyBjcmVhdGVkIHNvIGZhcjsgbnVtYmVycyBzZXNzaW9ucyBpbiBjcmVhdGlvbiBvcmRlcgogICAgLy8gc2VsZi5zZXNzaW9uX2NvdW50ID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJzZXNzaW9uX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTQ4CiAgICAvLyBjbGFzcyBBbGdvUmV3YXJkc0NvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAyMAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0CiAgICBwdXNoYnl0ZXNzIDB4ZDA2NmViZmUgMHhmMmY3NzBiOCAweDdhNTVkZjRmIDB4ZmRkMzk1YzUgMHhmOGM2NTRjYSAweDJkZDE2NDVlIDB4MGI0ZWNkZjAgMHhlOGRjMmM0ZCAweDAyYmVjZTExIDB4MDU5ZTc2ODAgMHg3YzAxYmExZSAvLyBtZXRob2QgImNyZWF0ZV9zZXNzaW9uKHN0cmluZyxzdHJpbmcsc3RyaW5nLGJ5dGVbMzZdLHVpbnQ2NCx1aW50NjQsdWludDY0KSh1aW50NjQsYnl0ZVszMl0pIiwgbWV0aG9kICJjbGFpbV9iYWRnZShzdHJpbmcsYWRkcmVzcykodWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImNsYWltX2JhZGdlc19iYXRjaChzdHJpbmcsYWRkcmVzc1tdKXVpbnQ2NFtdIiwgbWV0aG9kICJkZWxpdmVyX2JhZGdlKHN0cmluZyxhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3Nlc3Npb25faW5mbyhzdHJpbmcpKGJ5dGVbMzJdLGJ5dGVbMzZdLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9zZXNzaW9uKHN0cmluZykoYnl0ZVszMl0sYnl0ZVszNl0sdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiY2hlY2tfY2xhaW1fc3RhdHVzKHN0cmluZyxhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiY2hlY2tfY2xhaW1fc3RhdHVzZXMoc3RyaW5nLGFkZHJlc3NbXSl1aW50NjRbXSIsIG1ldGhvZCAiaGVsbG8oc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAibWludF9uZnQoc3RyaW5nLHN0cmluZyxzdHJpbmcsYWRkcmVzcykodWludDgsdWludDE2LHVpbnQxNix1aW50MTYpIiwgbWV0aG9kICJwcmVwYXJlX25mdF9jcmVhdGlvbihzdHJpbmcsc3RyaW5nLHN0cmluZykodWludDgsdWludDE2LHVpbnQxNix1aW50MTYpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlX3Nlc3Npb24gY2xhaW1fYmFkZ2UgY2xhaW1fYmFkZ2VzX2JhdGNoIGRlbGl2ZXJfYmFkZ2UgZ2V0X3Nlc3Npb25faW5mbyBnZXRfc2Vzc2lvbiBjaGVja19jbGFpbV9zdGF0dXMgY2hlY2tfY2xhaW1fc3RhdHVzZXMgaGVsbG8gbWludF9uZnQgcHJlcGFyZV9uZnRfY3JlYXRpb24KICAgIGVycgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAyMDoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICAmJgogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29fcmV3YXJkc19jb250cmFjdC5jb250cmFjdC5jbGFpbV9rZXkoc2Vzc2lvbl9pZDogYnl0ZXMsIHJlY2lwaWVudF9hZGRyZXNzOiBieXRlcykgLT4gYnl0ZXM6CmNsYWltX2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6ODQtODUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2xhaW1fa2V5KHNlc3Npb25faWQ6IFN0cmluZywgcmVjaXBpZW50X2FkZHJlc3M6IGFyYzQuQWRkcmVzcykgLT4gQnl0ZXM6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6ODcKICAgIC8vIHJldHVybiBvcC5zaGEyNTYob3AuaXRvYihzZXNzaW9uX2lkLmJ5dGVzLmxlbmd0aCkgKyBzZXNzaW9uX2lkLmJ5dGVzICsgcmVjaXBpZW50X2FkZHJlc3MuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgaXRvYgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuY2hlY2tfbmZ0X3BhcmFtcyhhc3NldF9uYW1lOiBieXRlcywgYXNzZXRfdW5pdDogYnl0ZXMsIG1ldGFkYXRhX3VybDogYnl0ZXMpIC0+IGJ5dGVzOgpjaGVja19uZnRfcGFyYW1zOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMzAtMTMxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNoZWNrX25mdF9wYXJhbXMoYXNzZXRfbmFtZTogU3RyaW5nLCBhc3NldF91bml0OiBTdHJpbmcsIG1ldGFkYXRhX3VybDogU3RyaW5nKSAtPiBOZnRQcmVwYXJhdGlvbjoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMzMKICAgIC8vIHN0YXR1cyA9IFVJbnQ2NChTVEFUVVNfT0spCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMzQKICAgIC8vIGlmIGFzc2V0X25hbWUuYnl0ZXMubGVuZ3RoID4gTUFYX0FTU0VUX05BTUU6CiAgICBmcmFtZV9kaWcgLTMKICAgIGxlbgogICAgZHVwCiAgICBpbnRjXzMgLy8gMzIKICAgID4KICAgIGJ6IGNoZWNrX25mdF9wYXJhbXNfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTM1CiAgICAvLyBzdGF0dXMgPSBVSW50NjQoU1RBVFVTX05BTUVfVE9PX0xPTkcpCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSAwCgpjaGVja19uZnRfcGFyYW1zX2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTQxCiAgICAvLyBzdGF0dXM9YXJjNC5VSW50OChzdGF0dXMpLAogICAgZnJhbWVfZGlnIDAKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjE0MgogICAgLy8gbmFtZV9sZW5ndGg9YXJjNC5VSW50MTYoYXNzZXRfbmFtZS5ieXRlcy5sZW5ndGgpLAogICAgc3dhcAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjE0MwogICAgLy8gdW5pdF9sZW5ndGg9YXJjNC5VSW50MTYoYXNzZXRfdW5pdC5ieXRlcy5sZW5ndGgpLAogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxNDQKICAgIC8vIHVybF9sZW5ndGg9YXJjNC5VSW50MTYobWV0YWRhdGFfdXJsLmJ5dGVzLmxlbmd0aCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjE0MC0xNDUKICAgIC8vIHJldHVybiBOZnRQcmVwYXJhdGlvbigKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50OChzdGF0dXMpLAogICAgLy8gICAgIG5hbWVfbGVuZ3RoPWFyYzQuVUludDE2KGFzc2V0X25hbWUuYnl0ZXMubGVuZ3RoKSwKICAgIC8vICAgICB1bml0X2xlbmd0aD1hcmM0LlVJbnQxNihhc3NldF91bml0LmJ5dGVzLmxlbmd0aCksCiAgICAvLyAgICAgdXJsX2xlbmd0aD1hcmM0LlVJbnQxNihtZXRhZGF0YV91cmwuYnl0ZXMubGVuZ3RoKSwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIHJldHN1YgoKY2hlY2tfbmZ0X3BhcmFtc19lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTM2CiAgICAvLyBlbGlmIGFzc2V0X3VuaXQuYnl0ZXMubGVuZ3RoID4gTUFYX1VOSVRfTkFNRToKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID4KICAgIGJ6IGNoZWNrX25mdF9wYXJhbXNfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTM3CiAgICAvLyBzdGF0dXMgPSBVSW50NjQoU1RBVFVTX1VOSVRfVE9PX0xPTkcpCiAgICBpbnRjXzIgLy8gMgogICAgZnJhbWVfYnVyeSAwCiAgICBiIGNoZWNrX25mdF9wYXJhbXNfYWZ0ZXJfaWZfZWxzZUA4CgpjaGVja19uZnRfcGFyYW1zX2Vsc2VfYm9keUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMzgKICAgIC8vIGVsaWYgbWV0YWRhdGFfdXJsLmJ5dGVzLmxlbmd0aCA+IE1BWF9BU1NFVF9VUkw6CiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgcHVzaGludCA5NgogICAgPgogICAgYnogY2hlY2tfbmZ0X3BhcmFtc19hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTM5CiAgICAvLyBzdGF0dXMgPSBVSW50NjQoU1RBVFVTX1VSTF9UT09fTE9ORykKICAgIHB1c2hpbnQgMwogICAgZnJhbWVfYnVyeSAwCiAgICBiIGNoZWNrX25mdF9wYXJhbXNfYWZ0ZXJfaWZfZWxzZUA4CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29fcmV3YXJkc19jb250cmFjdC5jb250cmFjdC5BbGdvUmV3YXJkc0NvbnRyYWN0LmNyZWF0ZV9zZXNzaW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX3Nlc3Npb246CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxNTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICBjb3ZlciAzCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgY292ZXIgMwogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzNgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzY+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBjb3ZlciA2CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDgKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjE3MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgdGhlIGNyZWF0b3IgY2FuIGNyZWF0ZSBzZXNzaW9ucyIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IHRoZSBjcmVhdG9yIGNhbiBjcmVhdGUgc2Vzc2lvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTcyCiAgICAvLyBhc3NlcnQgZW5kX3JvdW5kID09IDAgb3IgZW5kX3JvdW5kID49IHN0YXJ0X3JvdW5kLCAiU2Vzc2lvbiBlbmRzIGJlZm9yZSBpdCBzdGFydHMiCiAgICBieiBjcmVhdGVfc2Vzc2lvbl9ib29sX3RydWVAMwogICAgZGlnIDgKICAgIGRpZyAxMAogICAgPj0KICAgIGJ6IGNyZWF0ZV9zZXNzaW9uX2Jvb2xfZmFsc2VANAoKY3JlYXRlX3Nlc3Npb25fYm9vbF90cnVlQDM6CiAgICBpbnRjXzEgLy8gMQoKY3JlYXRlX3Nlc3Npb25fYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxNzIKICAgIC8vIGFzc2VydCBlbmRfcm91bmQgPT0gMCBvciBlbmRfcm91bmQgPj0gc3RhcnRfcm91bmQsICJTZXNzaW9uIGVuZHMgYmVmb3JlIGl0IHN0YXJ0cyIKICAgIGFzc2VydCAvLyBTZXNzaW9uIGVuZHMgYmVmb3JlIGl0IHN0YXJ0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxNzMKICAgIC8vIHByZWZpeCA9IG9wLmV4dHJhY3QobWV0YWRhdGFfY2lkLmJ5dGVzLCAwLCA0KQogICAgZGlnIDEKICAgIGV4dHJhY3QgMCA0CiAgICBkdXAKICAgIGJ1cnkgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTc0CiAgICAvLyBhc3NlcnQgcHJlZml4ID09IENJRF9SQVcgb3IgcHJlZml4ID09IENJRF9EQUdfUEIsICJNZXRhZGF0YSBDSUQgbXVzdCBiZSBhIHNoYTItMjU2IHJhdyBvciBkYWctcGIgQ0lEdjEiCiAgICBieXRlYyA0IC8vIDB4MDE1NTEyMjAKICAgID09CiAgICBibnogY3JlYXRlX3Nlc3Npb25fYm9vbF90cnVlQDcKICAgIGRpZyAxMAogICAgcHVzaGJ5dGVzIDB4MDE3MDEyMjAKICAgID09CiAgICBieiBjcmVhdGVfc2Vzc2lvbl9ib29sX2ZhbHNlQDgKCmNyZWF0ZV9zZXNzaW9uX2Jvb2xfdHJ1ZUA3OgogICAgaW50Y18xIC8vIDEKCmNyZWF0ZV9zZXNzaW9uX2Jvb2xfbWVyZ2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTc0CiAgICAvLyBhc3NlcnQgcHJlZml4ID09IENJRF9SQVcgb3IgcHJlZml4ID09IENJRF9EQUdfUEIsICJNZXRhZGF0YSBDSUQgbXVzdCBiZSBhIHNoYTItMjU2IHJhdyBvciBkYWctcGIgQ0lEdjEiCiAgICBhc3NlcnQgLy8gTWV0YWRhdGEgQ0lEIG11c3QgYmUgYSBzaGEyLTI1NiByYXcgb3IgZGFnLXBiIENJRHYxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjE3NgogICAgLy8gaWRfaGFzaCA9IG9wLnNoYTI1NihzZXNzaW9uX2lkLmJ5dGVzKQogICAgdW5jb3ZlciA0CiAgICBzaGEyNTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTc3CiAgICAvLyBhc3NlcnQgaWRfaGFzaCBub3QgaW4gc2VsZi5zZXNzaW9ucywgIlNlc3Npb24gYWxyZWFkeSBleGlzdHMiCiAgICBieXRlY18zIC8vIDB4NzMKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gU2Vzc2lvbiBhbHJlYWR5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxODQKICAgIC8vIGNsYWltX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTc4LTE4NQogICAgLy8gc2VsZi5zZXNzaW9uc1tpZF9oYXNoXSA9IFNlc3Npb25SZWNvcmQoCiAgICAvLyAgICAgaWRfaGFzaD1CeXRlczMyLmZyb21fYnl0ZXMoaWRfaGFzaCksCiAgICAvLyAgICAgbWV0YWRhdGFfY2lkPW1ldGFkYXRhX2NpZC5jb3B5KCksCiAgICAvLyAgICAgc3RhcnRfcm91bmQ9YXJjNC5VSW50NjQoc3RhcnRfcm91bmQpLAogICAgLy8gICAgIGVuZF9yb3VuZD1hcmM0LlVJbnQ2NChlbmRfcm91bmQpLAogICAgLy8gICAgIG1heF9jbGFpbXM9YXJjNC5VSW50NjQobWF4X2NsYWltcyksCiAgICAvLyAgICAgY2xhaW1fY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBkaWcgMgogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxODcKICAgIC8vIHNlbGYuc2Vzc2lvbl9jb3VudCArPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAic2Vzc2lvbl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zZXNzaW9uX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzIgLy8gInNlc3Npb25fY291bnQiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTg5CiAgICAvLyBzZXNzaW9uX251bWJlcj1hcmM0LlVJbnQ2NChzZWxmLnNlc3Npb25fY291bnQpLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxODgtMTkzCiAgICAvLyBhcmM0LmVtaXQoU2Vzc2lvbkRlc2NyaWJlZCgKICAgIC8vICAgICBzZXNzaW9uX251bWJlcj1hcmM0LlVJbnQ2NChzZWxmLnNlc3Npb25fY291bnQpLAogICAgLy8gICAgIGlkX2hhc2g9Qnl0ZXMzMi5mcm9tX2J5dGVzKGlkX2hhc2gpLAogICAgLy8gICAgIG5hbWU9YXJjNC5TdHJpbmcoc2Vzc2lvbl9uYW1lKSwKICAgIC8vICAgICBkZXNjcmlwdGlvbj1hcmM0LlN0cmluZyhzZXNzaW9uX2Rlc2NyaXB0aW9uKSwKICAgIC8vICkpCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgcHVzaGJ5dGVzIDB4MDAyYwogICAgY29uY2F0CiAgICBwdXNoaW50IDQ0CiAgICB1bmNvdmVyIDMKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4ZWFjMmI1ODMgLy8gbWV0aG9kICJTZXNzaW9uRGVzY3JpYmVkKHVpbnQ2NCxieXRlWzMyXSxzdHJpbmcsc3RyaW5nKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjE1OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpjcmVhdGVfc2Vzc2lvbl9ib29sX2ZhbHNlQDg6CiAgICBpbnRjXzAgLy8gMAogICAgYiBjcmVhdGVfc2Vzc2lvbl9ib29sX21lcmdlQDkKCmNyZWF0ZV9zZXNzaW9uX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIGNyZWF0ZV9zZXNzaW9uX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5jbGFpbV9iYWRnZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNsYWltX2JhZGdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxOTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMDUKICAgIC8vIFR4bi5zZW5kZXIgPT0gcmVjaXBpZW50X2FkZHJlc3MubmF0aXZlIG9yIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGJueiBjbGFpbV9iYWRnZV9ib29sX3RydWVAMwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYnogY2xhaW1fYmFkZ2VfYm9vbF9mYWxzZUA0CgpjbGFpbV9iYWRnZV9ib29sX3RydWVAMzoKICAgIGludGNfMSAvLyAxCgpjbGFpbV9iYWRnZV9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjIwMi0yMDYKICAgIC8vICMgT25seSB0aGUgcmVjaXBpZW50IChvciB0aGUgY3JlYXRvciBvbiB0aGVpciBiZWhhbGYpIG1heSBjbGFpbSwgYW5kIGEKICAgIC8vICMgcmVjaXBpZW50IHBheXMgdGhlIGJhZGdlJ3MgbWluaW11bSBiYWxhbmNlIHNvIGZyZXNoIGFjY291bnRzIGNhbm5vdCBkcmFpbiB0aGUgYXBwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gcmVjaXBpZW50X2FkZHJlc3MubmF0aXZlIG9yIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIk9ubHkgdGhlIHJlY2lwaWVudCBvciB0aGUgY3JlYXRvciBjYW4gY2xhaW0iCiAgICBhc3NlcnQgLy8gT25seSB0aGUgcmVjaXBpZW50IG9yIHRoZSBjcmVhdG9yIGNhbiBjbGFpbQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTo5NgogICAgLy8gaWYgVHhuLnNlbmRlciAhPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzOgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAhPQogICAgYnogY2xhaW1fYmFkZ2VfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBhc3NlcnQgVHhuLmdyb3VwX2luZGV4ID4gMCwgIkNsYWltIG11c3QgZm9sbG93IGEgcGF5bWVudCB0byB0aGUgYXBwIgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGFzc2VydCAvLyBDbGFpbSBtdXN0IGZvbGxvdyBhIHBheW1lbnQgdG8gdGhlIGFwcAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTo5OAogICAgLy8gcGF5bWVudCA9IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKFR4bi5ncm91cF9pbmRleCAtIDEpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6OTkKICAgIC8vIGFzc2VydCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyLCAiQ2xhaW0gcGF5bWVudCBtdXN0IGNvbWUgZnJvbSB0aGUgY2xhaW1hbnQiCiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBDbGFpbSBwYXltZW50IG11c3QgY29tZSBmcm9tIHRoZSBjbGFpbWFudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMDAKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJDbGFpbSBwYXltZW50IG11c3QgZ28gdG8gdGhlIGFwcCIKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIENsYWltIHBheW1lbnQgbXVzdCBnbyB0byB0aGUgYXBwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID49IGNvdW50ICogKAogICAgZ3R4bnMgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjEwMgogICAgLy8gR2xvYmFsLmFzc2V0X2NyZWF0ZV9taW5fYmFsYW5jZSArIENMQUlNX0JPWF9NSU5fQkFMQU5DRQogICAgZ2xvYmFsIEFzc2V0Q3JlYXRlTWluQmFsYW5jZQogICAgcHVzaGludCAxODkwMAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMDEtMTAzCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gY291bnQgKiAoCiAgICAvLyAgICAgR2xvYmFsLmFzc2V0X2NyZWF0ZV9taW5fYmFsYW5jZSArIENMQUlNX0JPWF9NSU5fQkFMQU5DRQogICAgLy8gKSwgIkNsYWltIHBheW1lbnQgZG9lcyBub3QgY292ZXIgdGhlIGJhZGdlJ3MgbWluaW11bSBiYWxhbmNlIgogICAgPj0KICAgIGFzc2VydCAvLyBDbGFpbSBwYXltZW50IGRvZXMgbm90IGNvdmVyIHRoZSBiYWRnZSdzIG1pbmltdW0gYmFsYW5jZQoKY2xhaW1fYmFkZ2VfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMDgKICAgIC8vIHNlc3Npb24gPSBzZWxmLnJlc2VydmVfY2xhaW1zKHNlc3Npb25faWQsIFVJbnQ2NCgxKSkKICAgIHN3YXAKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgIGNhbGxzdWIgcmVzZXJ2ZV9jbGFpbXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjA5CiAgICAvLyBhc3NldF9pZCA9IHNlbGYuaXNzdWVfYmFkZ2Uoc2Vzc2lvbl9pZCwgcmVjaXBpZW50X2FkZHJlc3MsIHNlc3Npb24ubWV0YWRhdGFfY2lkLmNvcHkoKSkKICAgIGR1cAogICAgZXh0cmFjdCAzMiAzNgogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBpc3N1ZV9iYWRnZQogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjIxMAogICAgLy8gcmV0dXJuIEJhZGdlQ2xhaW1lZChhc3NldF9pZD1hcmM0LlVJbnQ2NChhc3NldF9pZCksIGNsYWltX251bWJlcj1zZXNzaW9uLmNsYWltX2NvdW50KQogICAgaXRvYgogICAgc3dhcAogICAgZXh0cmFjdCA5MiA4CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTk5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmNsYWltX2JhZGdlX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIGNsYWltX2JhZGdlX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5jbGFpbV9iYWRnZXNfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgpjbGFpbV9iYWRnZXNfYmF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjIxMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMTkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IHRoZSBjcmVhdG9yIGNhbiBiYXRjaCBjbGFpbSIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IHRoZSBjcmVhdG9yIGNhbiBiYXRjaCBjbGFpbQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMjMKICAgIC8vIEJBVENIX0NBTExfT1BDT0RFUyArIEJBVENIX0JBREdFX09QQ09ERVMgKiByZWNpcGllbnRfYWRkcmVzc2VzLmxlbmd0aCwKICAgIHB1c2hpbnQgMTM1CiAgICAqCiAgICBwdXNoaW50IDE3MAogICAgKwoKY2xhaW1fYmFkZ2VzX2JhdGNoX3doaWxlX3RvcEA3OgogICAgZHVwCiAgICBnbG9iYWwgT3Bjb2RlQnVkZ2V0CiAgICA+CiAgICBieiBjbGFpbV9iYWRnZXNfYmF0Y2hfYWZ0ZXJfd2hpbGVAMTIKICAgIGl0eG5fYmVnaW4KICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgIGl0eG5fZmllbGQgT25Db21wbGV0aW9uCiAgICBieXRlYyA1IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWMgNSAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgYiBjbGFpbV9iYWRnZXNfYmF0Y2hfd2hpbGVfdG9wQDcKCmNsYWltX2JhZGdlc19iYXRjaF9hZnRlcl93aGlsZUAxMjoKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMjYKICAgIC8vIHNlc3Npb24gPSBzZWxmLnJlc2VydmVfY2xhaW1zKHNlc3Npb25faWQsIHJlY2lwaWVudF9hZGRyZXNzZXMubGVuZ3RoKQogICAgZGlnIDIKICAgIGRpZyAxCiAgICBjYWxsc3ViIHJlc2VydmVfY2xhaW1zCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gbWV0YWRhdGFfY2lkID0gc2Vzc2lvbi5tZXRhZGF0YV9jaWQuY29weSgpCiAgICBleHRyYWN0IDMyIDM2CiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjIyOQogICAgLy8gYmFkZ2VfaWRzID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKCkKICAgIGJ5dGVjIDYgLy8gMHgwMDAwCiAgICBjb3ZlciAyCiAgICBpbnRjXzAgLy8gMAoKY2xhaW1fYmFkZ2VzX2JhdGNoX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjMwCiAgICAvLyBmb3IgcmVjaXBpZW50X2FkZHJlc3MgaW4gcmVjaXBpZW50X2FkZHJlc3NlczoKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IGNsYWltX2JhZGdlc19iYXRjaF9hZnRlcl9mb3JANQogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMzIKICAgIC8vIHNlbGYuaXNzdWVfYmFkZ2Uoc2Vzc2lvbl9pZCwgcmVjaXBpZW50X2FkZHJlc3MsIG1ldGFkYXRhX2NpZC5jb3B5KCkpCiAgICBkaWcgNQogICAgc3dhcAogICAgZGlnIDcKICAgIGNhbGxzdWIgaXNzdWVfYmFkZ2UKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMzEtMjMzCiAgICAvLyBiYWRnZV9pZHMuYXBwZW5kKGFyYzQuVUludDY0KAogICAgLy8gICAgIHNlbGYuaXNzdWVfYmFkZ2Uoc2Vzc2lvbl9pZCwgcmVjaXBpZW50X2FkZHJlc3MsIG1ldGFkYXRhX2NpZC5jb3B5KCkpCiAgICAvLyApKQogICAgaXRvYgogICAgdW5jb3ZlciA0CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMzEtMjMzCiAgICAvLyBiYWRnZV9pZHMuYXBwZW5kKGFyYzQuVUludDY0KAogICAgLy8gICAgIHNlbGYuaXNzdWVfYmFkZ2Uoc2Vzc2lvbl9pZCwgcmVjaXBpZW50X2FkZHJlc3MsIG1ldGFkYXRhX2NpZC5jb3B5KCkpCiAgICAvLyApKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAwCiAgICByZXBsYWNlMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvdmVyIDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBiIGNsYWltX2JhZGdlc19iYXRjaF9mb3JfaGVhZGVyQDIKCmNsYWltX2JhZGdlc19iYXRjaF9hZnRlcl9mb3JANToKICAgIHBvcG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5kZWxpdmVyX2JhZGdlW3JvdXRpbmddKCkgLT4gdm9pZDoKZGVsaXZlcl9iYWRnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjcwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6Mjc4CiAgICAvLyBiYWRnZV9pZCwgY2xhaW1lZCA9IHNlbGYuY2xhaW1zLm1heWJlKGNsYWltX2tleShzZXNzaW9uX2lkLCByZWNpcGllbnRfYWRkcmVzcykpCiAgICBzd2FwCiAgICBkaWcgMQogICAgY2FsbHN1YiBjbGFpbV9rZXkKICAgIGJ5dGVjXzEgLy8gMHg2MwogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI3OQogICAgLy8gYXNzZXJ0IGNsYWltZWQsICJObyBiYWRnZSBjbGFpbWVkIgogICAgc3dhcAogICAgYXNzZXJ0IC8vIE5vIGJhZGdlIGNsYWltZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjgyCiAgICAvLyBhc3NlcnQgcmVjaXBpZW50LmlzX29wdGVkX2luKGJhZGdlKSwgIlJlY2lwaWVudCBoYXMgbm90IG9wdGVkIGluIHRvIHRoZSBiYWRnZSIKICAgIGR1cDIKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUmVjaXBpZW50IGhhcyBub3Qgb3B0ZWQgaW4gdG8gdGhlIGJhZGdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI4MwogICAgLy8gYXNzZXJ0IGJhZGdlLmJhbGFuY2UoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcykgPT0gMSwgIkJhZGdlIGFscmVhZHkgZGVsaXZlcmVkIgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGRpZyAxCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IG9wdGVkIGludG8gYXNzZXQKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIEJhZGdlIGFscmVhZHkgZGVsaXZlcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI4NS0yOTAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWJhZGdlLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXJlY2lwaWVudCwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6Mjg4CiAgICAvLyBhc3NldF9hbW91bnQ9MSwKICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGR1cAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6Mjg1CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6Mjg5CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyODUtMjkwCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1iYWRnZSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1yZWNpcGllbnQsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTEsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyNzAKICAgIC8vIEBhYmltZXRob2QoKQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5nZXRfc2Vzc2lvbl9pbmZvW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3Nlc3Npb25faW5mbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjkzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyOTYKICAgIC8vIHJldHVybiBzZWxmLnJlYWRfc2Vzc2lvbihzZXNzaW9uX2lkKQogICAgY2FsbHN1YiByZWFkX3Nlc3Npb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjkzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29fcmV3YXJkc19jb250cmFjdC5jb250cmFjdC5BbGdvUmV3YXJkc0NvbnRyYWN0LmdldF9zZXNzaW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3Nlc3Npb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI5OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MzAxCiAgICAvLyByZXR1cm4gc2VsZi5yZWFkX3Nlc3Npb24oc2Vzc2lvbl9pZCkKICAgIGNhbGxzdWIgcmVhZF9zZXNzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI5OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5jaGVja19jbGFpbV9zdGF0dXNbcm91dGluZ10oKSAtPiB2b2lkOgpjaGVja19jbGFpbV9zdGF0dXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjMxMAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMTMKICAgIC8vIHJldHVybiBzZWxmLmNsYWltcy5nZXQoY2xhaW1fa2V5KHNlc3Npb25faWQsIHJlY2lwaWVudF9hZGRyZXNzKSwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBjYWxsc3ViIGNsYWltX2tleQogICAgYnl0ZWNfMSAvLyAweDYzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMTAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19yZXdhcmRzX2NvbnRyYWN0LmNvbnRyYWN0LkFsZ29SZXdhcmRzQ29udHJhY3QuY2hlY2tfY2xhaW1fc3RhdHVzZXNbcm91dGluZ10oKSAtPiB2b2lkOgpjaGVja19jbGFpbV9zdGF0dXNlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MzE1CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjMyMAogICAgLy8gc3RhdHVzZXMgPSBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0oKQogICAgYnl0ZWMgNiAvLyAweDAwMDAKICAgIGludGNfMCAvLyAwCgpjaGVja19jbGFpbV9zdGF0dXNlc19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjMyMQogICAgLy8gZm9yIHJlY2lwaWVudF9hZGRyZXNzIGluIHJlY2lwaWVudF9hZGRyZXNzZXM6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBjaGVja19jbGFpbV9zdGF0dXNlc19hZnRlcl9mb3JANQogICAgZGlnIDMKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMjIKICAgIC8vIGJhZGdlX2lkID0gc2VsZi5jbGFpbXMuZ2V0KGNsYWltX2tleShzZXNzaW9uX2lkLCByZWNpcGllbnRfYWRkcmVzcyksIGRlZmF1bHQ9VUludDY0KDApKQogICAgZGlnIDUKICAgIHN3YXAKICAgIGNhbGxzdWIgY2xhaW1fa2V5CiAgICBieXRlY18xIC8vIDB4NjMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjMyMwogICAgLy8gc3RhdHVzZXMuYXBwZW5kKGFyYzQuVUludDY0KGJhZGdlX2lkKSkKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MzIzCiAgICAvLyBzdGF0dXNlcy5hcHBlbmQoYXJjNC5VSW50NjQoYmFkZ2VfaWQpKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAwCiAgICByZXBsYWNlMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBiIGNoZWNrX2NsYWltX3N0YXR1c2VzX2Zvcl9oZWFkZXJAMgoKY2hlY2tfY2xhaW1fc3RhdHVzZXNfYWZ0ZXJfZm9yQDU6CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MzE1CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29fcmV3YXJkc19jb250cmFjdC5jb250cmFjdC5BbGdvUmV3YXJkc0NvbnRyYWN0LmhlbGxvW3JvdXRpbmddKCkgLT4gdm9pZDoKaGVsbG86CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjMyNgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5taW50X25mdFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cm1pbnRfbmZ0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMzQKICAgIC8vIHJldHVybiBjaGVja19uZnRfcGFyYW1zKGFzc2V0X25hbWUsIGFzc2V0X3VuaXQsIG1ldGFkYXRhX3VybCkKICAgIGNhbGxzdWIgY2hlY2tfbmZ0X3BhcmFtcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5wcmVwYXJlX25mdF9jcmVhdGlvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnByZXBhcmVfbmZ0X2NyZWF0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMzYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMzkKICAgIC8vIHJldHVybiBjaGVja19uZnRfcGFyYW1zKGFzc2V0X25hbWUsIGFzc2V0X3VuaXQsIG1ldGFkYXRhX3VybCkKICAgIGNhbGxzdWIgY2hlY2tfbmZ0X3BhcmFtcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weTozMzYKICAgIC8vIEBhYmltZXRob2QoKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX3Jld2FyZHNfY29udHJhY3QuY29udHJhY3QuQWxnb1Jld2FyZHNDb250cmFjdC5yZXNlcnZlX2NsYWltcyhzZXNzaW9uX2lkOiBieXRlcywgY291bnQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CnJlc2VydmVfY2xhaW1zOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyMzYtMjM3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlc2VydmVfY2xhaW1zKHNlbGYsIHNlc3Npb25faWQ6IFN0cmluZywgY291bnQ6IFVJbnQ2NCkgLT4gU2Vzc2lvblJlY29yZDoKICAgIHByb3RvIDIgMQogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI0NAogICAgLy8gaWRfaGFzaCA9IG9wLnNoYTI1NihzZXNzaW9uX2lkLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0yCiAgICBzaGEyNTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjQ1CiAgICAvLyBhc3NlcnQgaWRfaGFzaCBpbiBzZWxmLnNlc3Npb25zLCAiVW5rbm93biBzZXNzaW9uIgogICAgYnl0ZWNfMyAvLyAweDczCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cG4gMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVW5rbm93biBzZXNzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI0NgogICAgLy8gc2Vzc2lvbiA9IHNlbGYuc2Vzc2lvbnNbaWRfaGFzaF0uY29weSgpCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyNDcKICAgIC8vIGFzc2VydCBHbG9iYWwucm91bmQgPj0gc2Vzc2lvbi5zdGFydF9yb3VuZC5uYXRpdmUsICJTZXNzaW9uIG5vdCBvcGVuIHlldCIKICAgIGdsb2JhbCBSb3VuZAogICAgZGlnIDEKICAgIHB1c2hpbnQgNjgKICAgIGV4dHJhY3RfdWludDY0CiAgICA+PQogICAgYXNzZXJ0IC8vIFNlc3Npb24gbm90IG9wZW4geWV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI0OAogICAgLy8gYXNzZXJ0IHNlc3Npb24uZW5kX3JvdW5kLm5hdGl2ZSA9PSAwIG9yIEdsb2JhbC5yb3VuZCA8PSBzZXNzaW9uLmVuZF9yb3VuZC5uYXRpdmUsICJTZXNzaW9uIGNsb3NlZCIKICAgIHB1c2hpbnQgNzYKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGJ6IHJlc2VydmVfY2xhaW1zX2Jvb2xfdHJ1ZUAyCiAgICBnbG9iYWwgUm91bmQKICAgIGZyYW1lX2RpZyAxCiAgICA8PQogICAgYnogcmVzZXJ2ZV9jbGFpbXNfYm9vbF9mYWxzZUAzCgpyZXNlcnZlX2NsYWltc19ib29sX3RydWVAMjoKICAgIGludGNfMSAvLyAxCgpyZXNlcnZlX2NsYWltc19ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI0OAogICAgLy8gYXNzZXJ0IHNlc3Npb24uZW5kX3JvdW5kLm5hdGl2ZSA9PSAwIG9yIEdsb2JhbC5yb3VuZCA8PSBzZXNzaW9uLmVuZF9yb3VuZC5uYXRpdmUsICJTZXNzaW9uIGNsb3NlZCIKICAgIGFzc2VydCAvLyBTZXNzaW9uIGNsb3NlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyNDkKICAgIC8vIGNsYWltX2NvdW50OiBVSW50NjQgPSBzZXNzaW9uLmNsYWltX2NvdW50Lm5hdGl2ZQogICAgZHVwbiAyCiAgICBwdXNoaW50IDkyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyNTAKICAgIC8vIGNsYWltX2NvdW50ICs9IGNvdW50CiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjUyCiAgICAvLyBzZXNzaW9uLm1heF9jbGFpbXMubmF0aXZlID09IDAgb3IgY2xhaW1fY291bnQgPD0gc2Vzc2lvbi5tYXhfY2xhaW1zLm5hdGl2ZQogICAgcHVzaGludCA4NAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBieiByZXNlcnZlX2NsYWltc19ib29sX3RydWVANgogICAgZHVwCiAgICBmcmFtZV9kaWcgMAogICAgPD0KICAgIGJ6IHJlc2VydmVfY2xhaW1zX2Jvb2xfZmFsc2VANwoKcmVzZXJ2ZV9jbGFpbXNfYm9vbF90cnVlQDY6CiAgICBpbnRjXzEgLy8gMQoKcmVzZXJ2ZV9jbGFpbXNfYm9vbF9tZXJnZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyNTEtMjUzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlc3Npb24ubWF4X2NsYWltcy5uYXRpdmUgPT0gMCBvciBjbGFpbV9jb3VudCA8PSBzZXNzaW9uLm1heF9jbGFpbXMubmF0aXZlCiAgICAvLyApLCAiQWxsIGJhZGdlcyBmb3IgdGhpcyBzZXNzaW9uIGhhdmUgYmVlbiBjbGFpbWVkIgogICAgYXNzZXJ0IC8vIEFsbCBiYWRnZXMgZm9yIHRoaXMgc2Vzc2lvbiBoYXZlIGJlZW4gY2xhaW1lZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyNTQKICAgIC8vIHNlc3Npb24uY2xhaW1fY291bnQgPSBhcmM0LlVJbnQ2NChjbGFpbV9jb3VudCkKICAgIGl0b2IKICAgIHN3YXAKICAgIGRpZyAxCiAgICByZXBsYWNlMiA5MgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyNTQtMjU1CiAgICAvLyBzZXNzaW9uLmNsYWltX2NvdW50ID0gYXJjNC5VSW50NjQoY2xhaW1fY291bnQpCiAgICAvLyBzZWxmLnNlc3Npb25zW2lkX2hhc2hdID0gc2Vzc2lvbi5jb3B5KCkKICAgIHVuY292ZXIgMgogICAgcHVzaGludCA5MgogICAgdW5jb3ZlciAzCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyNTYKICAgIC8vIHJldHVybiBzZXNzaW9uCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKcmVzZXJ2ZV9jbGFpbXNfYm9vbF9mYWxzZUA3OgogICAgaW50Y18wIC8vIDAKICAgIGIgcmVzZXJ2ZV9jbGFpbXNfYm9vbF9tZXJnZUA4CgpyZXNlcnZlX2NsYWltc19ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAogICAgYiByZXNlcnZlX2NsYWltc19ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19yZXdhcmRzX2NvbnRyYWN0LmNvbnRyYWN0LkFsZ29SZXdhcmRzQ29udHJhY3QuaXNzdWVfYmFkZ2Uoc2Vzc2lvbl9pZDogYnl0ZXMsIHJlY2lwaWVudF9hZGRyZXNzOiBieXRlcywgbWV0YWRhdGFfY2lkOiBieXRlcykgLT4gdWludDY0LCBieXRlczoKaXNzdWVfYmFkZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI1OC0yNTkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgaXNzdWVfYmFkZ2Uoc2VsZiwgc2Vzc2lvbl9pZDogU3RyaW5nLCByZWNpcGllbnRfYWRkcmVzczogYXJjNC5BZGRyZXNzLCBtZXRhZGF0YV9jaWQ6IENJRCkgLT4gVUludDY0OgogICAgcHJvdG8gMyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjI2MS0yNjIKICAgIC8vICMgRWFjaCAoc2Vzc2lvbiwgcmVjaXBpZW50KSBwYWlyIGNhbiBjbGFpbSBvbmNlCiAgICAvLyBrZXkgPSBjbGFpbV9rZXkoc2Vzc2lvbl9pZCwgcmVjaXBpZW50X2FkZHJlc3MpCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBjbGFpbV9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjYzCiAgICAvLyBhc3NlcnQga2V5IG5vdCBpbiBzZWxmLmNsYWltcywgIkJhZGdlIGFscmVhZHkgY2xhaW1lZCIKICAgIGJ5dGVjXzEgLy8gMHg2MwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIEJhZGdlIGFscmVhZHkgY2xhaW1lZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMTQKICAgIC8vIHVybCA9IFN0cmluZyhBUkMxOV9VUkxfUkFXKSBpZiBvcC5leHRyYWN0KG1ldGFkYXRhX2NpZC5ieXRlcywgMCwgNCkgPT0gQ0lEX1JBVyBlbHNlIFN0cmluZyhBUkMxOV9VUkxfREFHX1BCKQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWMgNCAvLyAweDAxNTUxMjIwCiAgICA9PQogICAgYnogaXNzdWVfYmFkZ2VfdGVybmFyeV9mYWxzZUA1CiAgICBwdXNoYnl0ZXMgInRlbXBsYXRlLWlwZnM6Ly97aXBmc2NpZDoxOnJhdzpyZXNlcnZlOnNoYTItMjU2fSIKCmlzc3VlX2JhZGdlX3Rlcm5hcnlfbWVyZ2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTE1LTEyNwogICAgLy8gcmV0dXJuIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9MSwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIGFzc2V0X25hbWU9QkFER0VfTkFNRSwKICAgIC8vICAgICB1bml0X25hbWU9QkFER0VfVU5JVCwKICAgIC8vICAgICB1cmw9dXJsLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUFjY291bnQob3AuZXh0cmFjdChtZXRhZGF0YV9jaWQuYnl0ZXMsIDQsIDMyKSksCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkuY3JlYXRlZF9hc3NldAogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMjIKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjEyMwogICAgLy8gcmVzZXJ2ZT1BY2NvdW50KG9wLmV4dHJhY3QobWV0YWRhdGFfY2lkLmJ5dGVzLCA0LCAzMikpLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDQgMzIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTI0CiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjEyNQogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RnJlZXplCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVUkwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTIwCiAgICAvLyB1bml0X25hbWU9QkFER0VfVU5JVCwKICAgIHB1c2hieXRlcyAiQVJCQURHRSIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMTkKICAgIC8vIGFzc2V0X25hbWU9QkFER0VfTkFNRSwKICAgIHB1c2hieXRlcyAiQWxnb1Jld2FyZHMgQmFkZ2UiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMTgKICAgIC8vIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWZhdWx0RnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjExNwogICAgLy8gZGVjaW1hbHM9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTE2CiAgICAvLyB0b3RhbD0xLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMTUKICAgIC8vIHJldHVybiBpdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MTI2CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToxMTUtMTI3CiAgICAvLyByZXR1cm4gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xLAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1CQURHRV9OQU1FLAogICAgLy8gICAgIHVuaXRfbmFtZT1CQURHRV9VTklULAogICAgLy8gICAgIHVybD11cmwsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9QWNjb3VudChvcC5leHRyYWN0KG1ldGFkYXRhX2NpZC5ieXRlcywgNCwgMzIpKSwKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKS5jcmVhdGVkX2Fzc2V0CiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29fcmV3YXJkc19jb250cmFjdC9jb250cmFjdC5weToyNjcKICAgIC8vIHNlbGYuY2xhaW1zW2tleV0gPSBiYWRnZS5pZAogICAgZHVwCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MjY4CiAgICAvLyByZXR1cm4gYmFkZ2UuaWQKICAgIGZyYW1lX2RpZyAtMQogICAgcmV0c3ViCgppc3N1ZV9iYWRnZV90ZXJuYXJ5X2ZhbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjExNAogICAgLy8gdXJsID0gU3RyaW5nKEFSQzE5X1VSTF9SQVcpIGlmIG9wLmV4dHJhY3QobWV0YWRhdGFfY2lkLmJ5dGVzLCAwLCA0KSA9PSBDSURfUkFXIGVsc2UgU3RyaW5nKEFSQzE5X1VSTF9EQUdfUEIpCiAgICBwdXNoYnl0ZXMgInRlbXBsYXRlLWlwZnM6Ly97aXBmc2NpZDoxOmRhZy1wYjpyZXNlcnZlOnNoYTItMjU2fSIKICAgIGIgaXNzdWVfYmFkZ2VfdGVybmFyeV9tZXJnZUA2CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29fcmV3YXJkc19jb250cmFjdC5jb250cmFjdC5BbGdvUmV3YXJkc0NvbnRyYWN0LnJlYWRfc2Vzc2lvbihzZXNzaW9uX2lkOiBieXRlcykgLT4gYnl0ZXM6CnJlYWRfc2Vzc2lvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MzAzLTMwNAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWFkX3Nlc3Npb24oc2VsZiwgc2Vzc2lvbl9pZDogU3RyaW5nKSAtPiBTZXNzaW9uUmVjb3JkOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjMwNgogICAgLy8gaWRfaGFzaCA9IG9wLnNoYTI1NihzZXNzaW9uX2lkLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0xCiAgICBzaGEyNTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX3Jld2FyZHNfY29udHJhY3QvY29udHJhY3QucHk6MzA3CiAgICAvLyBhc3NlcnQgaWRfaGFzaCBpbiBzZWxmLnNlc3Npb25zLCAiVW5rbm93biBzZXNzaW9uIgogICAgYnl0ZWNfMyAvLyAweDczCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVW5rbm93biBzZXNzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19yZXdhcmRzX2NvbnRyYWN0L2NvbnRyYWN0LnB5OjMwOAogICAgLy8gcmV0dXJuIHNlbGYuc2Vzc2lvbnNbaWRfaGFzaF0KICAgIGJveF9nZXQKICAgIHBvcAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1404], "errorMessage": "Address length is 32 bytes"}, {"pc": [1287], "errorMessage": "All badges for this session have been claimed"}, {"pc": [1330], "errorMessage": "Badge already claimed"}, {"pc": [851], "errorMessage": "Badge already delivered"}, {"pc": [569], "errorMessage": "Claim must follow a payment to the app"}, {"pc": [604], "errorMessage": "Claim payment does not cover the badge's minimum balance"}, {"pc": [586], "errorMessage": "Claim payment must come from the claimant"}, {"pc": [593], "errorMessage": "Claim payment must go to the app"}, {"pc": [427], "errorMessage": "Metadata CID must be a sha2-256 raw or dag-pb CIDv1"}, {"pc": [835], "errorMessage": "No badge claimed"}, {"pc": [682], "errorMessage": "Only the creator can batch claim"}, {"pc": [386], "errorMessage": "Only the creator can create sessions"}, {"pc": [558], "errorMessage": "Only the recipient or the creator can claim"}, {"pc": [841], "errorMessage": "Recipient has not opted in to the badge"}, {"pc": [440], "errorMessage": "Session already exists"}, {"pc": [1260], "errorMessage": "Session closed"}, {"pc": [399], "errorMessage": "Session ends before it starts"}, {"pc": [1241], "errorMessage": "Session not open yet"}, {"pc": [1229, 1547], "errorMessage": "Unknown session"}, {"pc": [848], "errorMessage": "account opted into asset"}, {"pc": [463], "errorMessage": "check self.session_count exists"}, {"pc": [757, 1026], "errorMessage": "index access is out of bounds"}, {"pc": [1300], "errorMessage": "index out of bounds"}, {"pc": [286, 305, 323, 523, 646, 663, 803, 882, 907, 932, 977, 994, 1078, 1097, 1113, 1129, 1161, 1177, 1193], "errorMessage": "invalid array length header"}, {"pc": [676, 1005], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [293, 314, 329, 530, 653, 810, 889, 914, 939, 984, 1085, 1104, 1120, 1136, 1168, 1184, 1200], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [542, 821, 950, 1146], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [338], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 36>"}, {"pc": [350, 365, 380], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [196, 207, 220, 233], "errorMessage": "overflow"}, {"pc": [579], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,30 +64,81 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class BadgeClaimed:
+    """Struct for BadgeClaimed"""
+    asset_id: int
+    claim_number: int
+
+@dataclasses.dataclass(frozen=True)
+class NftPreparation:
+    """Struct for NftPreparation"""
+    status: int
+    name_length: int
+    unit_length: int
+    url_length: int
+
+@dataclasses.dataclass(frozen=True)
+class SessionCreated:
+    """Struct for SessionCreated"""
+    session_number: int
+    id_hash: bytes
+
+@dataclasses.dataclass(frozen=True)
+class SessionRecord:
+    """Struct for SessionRecord"""
+    id_hash: bytes
+    metadata_cid: bytes
+    start_round: int
+    end_round: int
+    max_claims: int
+    claim_count: int
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateSessionArgs:
     """Dataclass for create_session arguments"""
     session_id: str
     session_name: str
     session_description: str
-    metadata_url: str
+    metadata_cid: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    start_round: int
+    end_round: int
+    max_claims: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "create_session(string,string,string,string)string"
+        return "create_session(string,string,string,byte[36],uint64,uint64,uint64)(uint64,byte[32])"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ClaimBadgeArgs:
     """Dataclass for claim_badge arguments"""
     session_id: str
     recipient_address: str
-    asset_name: str
-    asset_unit: str
-    metadata_url: str
 
     @property
     def abi_method_signature(self) -> str:
-        return "claim_badge(string,string,string,string,string)string"
+        return "claim_badge(string,address)(uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClaimBadgesBatchArgs:
+    """Dataclass for claim_badges_batch arguments"""
+    session_id: str
+    recipient_addresses: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "claim_badges_batch(string,address[])uint64[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DeliverBadgeArgs:
+    """Dataclass for deliver_badge arguments"""
+    session_id: str
+    recipient_address: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "deliver_badge(string,address)uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetSessionInfoArgs:
@@ -96,7 +147,16 @@ class GetSessionInfoArgs:
 
     @property
     def abi_method_signature(self) -> str:
-        return "get_session_info(string)string"
+        return "get_session_info(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetSessionArgs:
+    """Dataclass for get_session arguments"""
+    session_id: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_session(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CheckClaimStatusArgs:
@@ -106,7 +166,17 @@ class CheckClaimStatusArgs:
 
     @property
     def abi_method_signature(self) -> str:
-        return "check_claim_status(string,string)uint64"
+        return "check_claim_status(string,address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CheckClaimStatusesArgs:
+    """Dataclass for check_claim_statuses arguments"""
+    session_id: str
+    recipient_addresses: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "check_claim_statuses(string,address[])uint64[]"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class HelloArgs:
@@ -127,7 +197,7 @@ class MintNftArgs:
 
     @property
     def abi_method_signature(self) -> str:
-        return "mint_nft(string,string,string,string)string"
+        return "mint_nft(string,string,string,address)(uint8,uint16,uint16,uint16)"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class PrepareNftCreationArgs:
@@ -138,7 +208,7 @@ class PrepareNftCreationArgs:
 
     @property
     def abi_method_signature(self) -> str:
-        return "prepare_nft_creation(string,string,string)string"
+        return "prepare_nft_creation(string,string,string)(uint8,uint16,uint16,uint16)"
 
 
 class AlgoRewardsContractParams:
@@ -147,27 +217,53 @@ class AlgoRewardsContractParams:
 
     def create_session(
         self,
-        args: tuple[str, str, str, str] | CreateSessionArgs,
+        args: tuple[str, str, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, int] | CreateSessionArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_session(string,string,string,string)string",
+            "method": "create_session(string,string,string,byte[36],uint64,uint64,uint64)(uint64,byte[32])",
             "args": method_args,
         }))
 
     def claim_badge(
         self,
-        args: tuple[str, str, str, str, str] | ClaimBadgeArgs,
+        args: tuple[str, str] | ClaimBadgeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_badge(string,address)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def claim_badges_batch(
+        self,
+        args: tuple[str, list[str]] | ClaimBadgesBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_badges_batch(string,address[])uint64[]",
+            "args": method_args,
+        }))
+
+    def deliver_badge(
+        self,
+        args: tuple[str, str] | DeliverBadgeArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_badge(string,string,string,string,string)string",
+            "method": "deliver_badge(string,address)uint64",
             "args": method_args,
         }))
 
@@ -180,7 +276,20 @@ class AlgoRewardsContractParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_session_info(string)string",
+            "method": "get_session_info(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_session(
+        self,
+        args: tuple[str] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_session(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)",
             "args": method_args,
         }))
 
@@ -193,7 +302,20 @@ class AlgoRewardsContractParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "check_claim_status(string,string)uint64",
+            "method": "check_claim_status(string,address)uint64",
+            "args": method_args,
+        }))
+
+    def check_claim_statuses(
+        self,
+        args: tuple[str, list[str]] | CheckClaimStatusesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "check_claim_statuses(string,address[])uint64[]",
             "args": method_args,
         }))
 
@@ -219,7 +341,7 @@ class AlgoRewardsContractParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "mint_nft(string,string,string,string)string",
+            "method": "mint_nft(string,string,string,address)(uint8,uint16,uint16,uint16)",
             "args": method_args,
         }))
 
@@ -232,7 +354,7 @@ class AlgoRewardsContractParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "prepare_nft_creation(string,string,string)string",
+            "method": "prepare_nft_creation(string,string,string)(uint8,uint16,uint16,uint16)",
             "args": method_args,
         }))
 
@@ -253,27 +375,53 @@ class AlgoRewardsContractCreateTransactionParams:
 
     def create_session(
         self,
-        args: tuple[str, str, str, str] | CreateSessionArgs,
+        args: tuple[str, str, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, int] | CreateSessionArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_session(string,string,string,string)string",
+            "method": "create_session(string,string,string,byte[36],uint64,uint64,uint64)(uint64,byte[32])",
             "args": method_args,
         }))
 
     def claim_badge(
         self,
-        args: tuple[str, str, str, str, str] | ClaimBadgeArgs,
+        args: tuple[str, str] | ClaimBadgeArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_badge(string,string,string,string,string)string",
+            "method": "claim_badge(string,address)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def claim_badges_batch(
+        self,
+        args: tuple[str, list[str]] | ClaimBadgesBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_badges_batch(string,address[])uint64[]",
+            "args": method_args,
+        }))
+
+    def deliver_badge(
+        self,
+        args: tuple[str, str] | DeliverBadgeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deliver_badge(string,address)uint64",
             "args": method_args,
         }))
 
@@ -286,7 +434,20 @@ class AlgoRewardsContractCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_session_info(string)string",
+            "method": "get_session_info(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_session(
+        self,
+        args: tuple[str] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_session(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)",
             "args": method_args,
         }))
 
@@ -299,7 +460,20 @@ class AlgoRewardsContractCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "check_claim_status(string,string)uint64",
+            "method": "check_claim_status(string,address)uint64",
+            "args": method_args,
+        }))
+
+    def check_claim_statuses(
+        self,
+        args: tuple[str, list[str]] | CheckClaimStatusesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "check_claim_statuses(string,address[])uint64[]",
             "args": method_args,
         }))
 
@@ -325,7 +499,7 @@ class AlgoRewardsContractCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "mint_nft(string,string,string,string)string",
+            "method": "mint_nft(string,string,string,address)(uint8,uint16,uint16,uint16)",
             "args": method_args,
         }))
 
@@ -338,7 +512,7 @@ class AlgoRewardsContractCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "prepare_nft_creation(string,string,string)string",
+            "method": "prepare_nft_creation(string,string,string)(uint8,uint16,uint16,uint16)",
             "args": method_args,
         }))
 
@@ -359,51 +533,99 @@ class AlgoRewardsContractSend:
 
     def create_session(
         self,
-        args: tuple[str, str, str, str] | CreateSessionArgs,
+        args: tuple[str, str, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, int] | CreateSessionArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[SessionCreated]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_session(string,string,string,string)string",
+            "method": "create_session(string,string,string,byte[36],uint64,uint64,uint64)(uint64,byte[32])",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SessionCreated, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[SessionCreated], parsed_response)
 
     def claim_badge(
         self,
-        args: tuple[str, str, str, str, str] | ClaimBadgeArgs,
+        args: tuple[str, str] | ClaimBadgeArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[BadgeClaimed]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_badge(string,string,string,string,string)string",
+            "method": "claim_badge(string,address)(uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(BadgeClaimed, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[BadgeClaimed], parsed_response)
+
+    def claim_badges_batch(
+        self,
+        args: tuple[str, list[str]] | ClaimBadgesBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_badges_batch(string,address[])uint64[]",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def deliver_badge(
+        self,
+        args: tuple[str, str] | DeliverBadgeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deliver_badge(string,address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
     def get_session_info(
         self,
         args: tuple[str] | GetSessionInfoArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[SessionRecord]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_session_info(string)string",
+            "method": "get_session_info(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SessionRecord, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[SessionRecord], parsed_response)
+
+    def get_session(
+        self,
+        args: tuple[str] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[SessionRecord]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_session(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SessionRecord, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[SessionRecord], parsed_response)
 
     def check_claim_status(
         self,
@@ -415,12 +637,28 @@ class AlgoRewardsContractSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "check_claim_status(string,string)uint64",
+            "method": "check_claim_status(string,address)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def check_claim_statuses(
+        self,
+        args: tuple[str, list[str]] | CheckClaimStatusesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "check_claim_statuses(string,address[])uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
     def hello(
         self,
         args: tuple[str] | HelloArgs,
@@ -442,32 +680,32 @@ class AlgoRewardsContractSend:
         args: tuple[str, str, str, str] | MintNftArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[NftPreparation]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "mint_nft(string,string,string,string)string",
+            "method": "mint_nft(string,string,string,address)(uint8,uint16,uint16,uint16)",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(NftPreparation, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[NftPreparation], parsed_response)
 
     def prepare_nft_creation(
         self,
         args: tuple[str, str, str] | PrepareNftCreationArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[NftPreparation]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "prepare_nft_creation(string,string,string)string",
+            "method": "prepare_nft_creation(string,string,string)(uint8,uint16,uint16,uint16)",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(NftPreparation, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[NftPreparation], parsed_response)
 
     def clear_state(
         self,
@@ -480,12 +718,139 @@ class AlgoRewardsContractSend:
         )
 
 
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    session_count: int
+
 class AlgoRewardsContractState:
     """Methods to access state for the current AlgoRewardsContract app"""
 
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def session_count(self) -> int:
+        """Get the current value of the session_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("session_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "SessionRecord": SessionRecord
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def sessions(self) -> "_MapState[bytes, SessionRecord]":
+        """Get values from the sessions map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "sessions",
+            self._struct_classes.get("SessionRecord")
+        )
+
+    @property
+    def claims(self) -> "_MapState[bytes, int]":
+        """Get values from the claims map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "claims",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
 class AlgoRewardsContractClient:
     """Client for interacting with AlgoRewardsContract smart contract"""
 
@@ -632,28 +997,52 @@ class AlgoRewardsContractClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_session(string,string,string,string)string"],
+        method: typing.Literal["create_session(string,string,string,byte[36],uint64,uint64,uint64)(uint64,byte[32])"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> SessionCreated | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["claim_badge(string,string,string,string,string)string"],
+        method: typing.Literal["claim_badge(string,address)(uint64,uint64)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> BadgeClaimed | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_session_info(string)string"],
+        method: typing.Literal["claim_badges_batch(string,address[])uint64[]"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["deliver_badge(string,address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_session_info(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> SessionRecord | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_session(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> SessionRecord | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["check_claim_status(string,string)uint64"],
+        method: typing.Literal["check_claim_status(string,address)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["check_claim_statuses(string,address[])uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["hello(string)string"],
@@ -662,15 +1051,15 @@ class AlgoRewardsContractClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["mint_nft(string,string,string,string)string"],
+        method: typing.Literal["mint_nft(string,string,string,address)(uint8,uint16,uint16,uint16)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> NftPreparation | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["prepare_nft_creation(string,string,string)string"],
+        method: typing.Literal["prepare_nft_creation(string,string,string)(uint8,uint16,uint16,uint16)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> NftPreparation | None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -682,7 +1071,7 @@ class AlgoRewardsContractClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | str:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | BadgeClaimed | NftPreparation | SessionCreated | SessionRecord | int | list[int] | str:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -855,18 +1244,18 @@ class AlgoRewardsContractFactoryCreateParams:
 
     def create_session(
         self,
-        args: tuple[str, str, str, str] | CreateSessionArgs,
+        args: tuple[str, str, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, int] | CreateSessionArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_session(string,string,string,string)string ABI method"""
+        """Creates a new instance using the create_session(string,string,string,byte[36],uint64,uint64,uint64)(uint64,byte[32]) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_session(string,string,string,string)string",
+                "method": "create_session(string,string,string,byte[36],uint64,uint64,uint64)(uint64,byte[32])",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -875,18 +1264,58 @@ class AlgoRewardsContractFactoryCreateParams:
 
     def claim_badge(
         self,
-        args: tuple[str, str, str, str, str] | ClaimBadgeArgs,
+        args: tuple[str, str] | ClaimBadgeArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the claim_badge(string,string,string,string,string)string ABI method"""
+        """Creates a new instance using the claim_badge(string,address)(uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "claim_badge(string,string,string,string,string)string",
+                "method": "claim_badge(string,address)(uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def claim_badges_batch(
+        self,
+        args: tuple[str, list[str]] | ClaimBadgesBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim_badges_batch(string,address[])uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim_badges_batch(string,address[])uint64[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def deliver_badge(
+        self,
+        args: tuple[str, str] | DeliverBadgeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the deliver_badge(string,address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "deliver_badge(string,address)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -900,13 +1329,33 @@ class AlgoRewardsContractFactoryCreateParams:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_session_info(string)string ABI method"""
+        """Creates a new instance using the get_session_info(string)(byte[32],byte[36],uint64,uint64,uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_session_info(string)string",
+                "method": "get_session_info(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_session(
+        self,
+        args: tuple[str] | GetSessionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_session(string)(byte[32],byte[36],uint64,uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_session(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -920,13 +1369,33 @@ class AlgoRewardsContractFactoryCreateParams:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the check_claim_status(string,string)uint64 ABI method"""
+        """Creates a new instance using the check_claim_status(string,address)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "check_claim_status(string,string)uint64",
+                "method": "check_claim_status(string,address)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def check_claim_statuses(
+        self,
+        args: tuple[str, list[str]] | CheckClaimStatusesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the check_claim_statuses(string,address[])uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "check_claim_statuses(string,address[])uint64[]",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -960,13 +1429,13 @@ class AlgoRewardsContractFactoryCreateParams:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the mint_nft(string,string,string,string)string ABI method"""
+        """Creates a new instance using the mint_nft(string,string,string,address)(uint8,uint16,uint16,uint16) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "mint_nft(string,string,string,string)string",
+                "method": "mint_nft(string,string,string,address)(uint8,uint16,uint16,uint16)",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -980,13 +1449,13 @@ class AlgoRewardsContractFactoryCreateParams:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the prepare_nft_creation(string,string,string)string ABI method"""
+        """Creates a new instance using the prepare_nft_creation(string,string,string)(uint8,uint16,uint16,uint16) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "prepare_nft_creation(string,string,string)string",
+                "method": "prepare_nft_creation(string,string,string)(uint8,uint16,uint16,uint16)",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -1096,7 +1565,7 @@ class AlgoRewardsContractComposer:
 
     def create_session(
         self,
-        args: tuple[str, str, str, str] | CreateSessionArgs,
+        args: tuple[str, str, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, int] | CreateSessionArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "AlgoRewardsContractComposer":
         self._composer.add_app_call_method_call(
@@ -1107,14 +1576,14 @@ class AlgoRewardsContractComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_session(string,string,string,string)string", v
+                "create_session(string,string,string,byte[36],uint64,uint64,uint64)(uint64,byte[32])", v
             )
         )
         return self
 
     def claim_badge(
         self,
-        args: tuple[str, str, str, str, str] | ClaimBadgeArgs,
+        args: tuple[str, str] | ClaimBadgeArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "AlgoRewardsContractComposer":
         self._composer.add_app_call_method_call(
@@ -1125,7 +1594,43 @@ class AlgoRewardsContractComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "claim_badge(string,string,string,string,string)string", v
+                "claim_badge(string,address)(uint64,uint64)", v
+            )
+        )
+        return self
+
+    def claim_badges_batch(
+        self,
+        args: tuple[str, list[str]] | ClaimBadgesBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRewardsContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim_badges_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim_badges_batch(string,address[])uint64[]", v
+            )
+        )
+        return self
+
+    def deliver_badge(
+        self,
+        args: tuple[str, str] | DeliverBadgeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRewardsContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.deliver_badge(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "deliver_badge(string,address)uint64", v
             )
         )
         return self
@@ -1143,7 +1648,25 @@ class AlgoRewardsContractComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_session_info(string)string", v
+                "get_session_info(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def get_session(
+        self,
+        args: tuple[str] | GetSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRewardsContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_session(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_session(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)", v
             )
         )
         return self
@@ -1161,7 +1684,25 @@ class AlgoRewardsContractComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "check_claim_status(string,string)uint64", v
+                "check_claim_status(string,address)uint64", v
+            )
+        )
+        return self
+
+    def check_claim_statuses(
+        self,
+        args: tuple[str, list[str]] | CheckClaimStatusesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRewardsContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.check_claim_statuses(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "check_claim_statuses(string,address[])uint64[]", v
             )
         )
         return self
@@ -1197,7 +1738,7 @@ class AlgoRewardsContractComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "mint_nft(string,string,string,string)string", v
+                "mint_nft(string,string,string,address)(uint8,uint16,uint16,uint16)", v
             )
         )
         return self
@@ -1215,7 +1756,7 @@ class AlgoRewardsContractComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "prepare_nft_creation(string,string,string)string", v
+                "prepare_nft_creation(string,string,string)(uint8,uint16,uint16,uint16)", v
             )
         )
         return self
@@ -0,0 +1,223 @@
+# This file was generated from AlgoRewardsContract.arc56.json by abi_encoders.py
+# during `python -m smart_contracts build`. DO NOT MODIFY IT BY HAND.
+"""Precompiled ABI encoders for AlgoRewardsContract: app args per method, no runtime method lookup"""
+
+import functools
+import hashlib
+
+from algosdk.encoding import decode_address, encode_address
+
+# ARC-4 prefix of a method's return value log
+RETURN_PREFIX = b"\x15\x1f\x7c\x75"
+
+# RFC 4648 base32 alphabet -> int(..., 32) digits
+_BASE32_DIGITS = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", "0123456789abcdefghijklmnopqrstuv")
+
+
+def _string(value: str) -> bytes:
+    data = value.encode()
+    return len(data).to_bytes(2, "big") + data
+
+
+def _address(value: str | bytes) -> bytes:
+    if isinstance(value, bytes) and len(value) == 32:
+        return value
+    # 58 base32 characters are 290 bits: public key, 4-byte checksum, 2 zero bits
+    try:
+        if len(value) == 58:
+            decoded = (int(value.translate(_BASE32_DIGITS), 32) >> 2).to_bytes(36, "big")
+            if hashlib.new("sha512_256", decoded[:32]).digest()[-4:] == decoded[32:]:
+                return decoded[:32]
+    except ValueError:
+        pass
+    # Malformed, or no sha512_256 in this OpenSSL: algosdk decodes or raises as usual
+    return decode_address(value)
+
+
+def _fixed(value: bytes, length: int) -> bytes:
+    if len(value) != length:
+        raise ValueError(f"Expected {length} bytes, got {len(value)}")
+    return bytes(value)
+
+
+@functools.cache
+def _abi_type(type_string: str):
+    from algosdk import abi
+
+    return abi.ABIType.from_string(type_string)
+
+
+def _returned(log: bytes) -> bytes:
+    if not log.startswith(RETURN_PREFIX):
+        raise ValueError("Log is not an ARC-4 return value")
+    return log[4:]
+
+
+CREATE_SESSION_SELECTOR = bytes.fromhex('d066ebfe')
+
+
+def encode_create_session(session_id, session_name, session_description, metadata_cid, start_round, end_round, max_claims) -> list[bytes]:
+    """App args for create_session(string,string,string,byte[36],uint64,uint64,uint64)(uint64,byte[32])"""
+    return [CREATE_SESSION_SELECTOR, _string(session_id), _string(session_name), _string(session_description), _fixed(metadata_cid, 36), start_round.to_bytes(8, 'big'), end_round.to_bytes(8, 'big'), max_claims.to_bytes(8, 'big')]
+
+
+def decode_create_session_return(log: bytes):
+    """Return value ((uint64,byte[32])) from the call's last log"""
+    data = _returned(log)
+    return (int.from_bytes(data[0:8], 'big'), bytes(data[8:40]),)
+
+
+CLAIM_BADGE_SELECTOR = bytes.fromhex('f2f770b8')
+
+
+def encode_claim_badge(session_id, recipient_address) -> list[bytes]:
+    """App args for claim_badge(string,address)(uint64,uint64)"""
+    return [CLAIM_BADGE_SELECTOR, _string(session_id), _address(recipient_address)]
+
+
+def decode_claim_badge_return(log: bytes):
+    """Return value ((uint64,uint64)) from the call's last log"""
+    data = _returned(log)
+    return (int.from_bytes(data[0:8], 'big'), int.from_bytes(data[8:16], 'big'),)
+
+
+CLAIM_BADGES_BATCH_SELECTOR = bytes.fromhex('7a55df4f')
+
+
+def encode_claim_badges_batch(session_id, recipient_addresses) -> list[bytes]:
+    """App args for claim_badges_batch(string,address[])uint64[]"""
+    return [CLAIM_BADGES_BATCH_SELECTOR, _string(session_id), len(recipient_addresses).to_bytes(2, 'big') + b"".join(_address(item) for item in recipient_addresses)]
+
+
+def decode_claim_badges_batch_return(log: bytes):
+    """Return value (uint64[]) from the call's last log"""
+    data = _returned(log)
+    return [int.from_bytes(data[2 + 8 * item:2 + 8 * (item + 1)], 'big') for item in range(int.from_bytes(data[:2], 'big'))]
+
+
+DELIVER_BADGE_SELECTOR = bytes.fromhex('fdd395c5')
+
+
+def encode_deliver_badge(session_id, recipient_address) -> list[bytes]:
+    """App args for deliver_badge(string,address)uint64"""
+    return [DELIVER_BADGE_SELECTOR, _string(session_id), _address(recipient_address)]
+
+
+def decode_deliver_badge_return(log: bytes):
+    """Return value (uint64) from the call's last log"""
+    data = _returned(log)
+    return int.from_bytes(data, 'big')
+
+
+GET_SESSION_INFO_SELECTOR = bytes.fromhex('f8c654ca')
+
+
+def encode_get_session_info(session_id) -> list[bytes]:
+    """App args for get_session_info(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)"""
+    return [GET_SESSION_INFO_SELECTOR, _string(session_id)]
+
+
+def decode_get_session_info_return(log: bytes):
+    """Return value ((byte[32],byte[36],uint64,uint64,uint64,uint64)) from the call's last log"""
+    data = _returned(log)
+    return (bytes(data[0:32]), bytes(data[32:68]), int.from_bytes(data[68:76], 'big'), int.from_bytes(data[76:84], 'big'), int.from_bytes(data[84:92], 'big'), int.from_bytes(data[92:100], 'big'),)
+
+
+GET_SESSION_SELECTOR = bytes.fromhex('2dd1645e')
+
+
+def encode_get_session(session_id) -> list[bytes]:
+    """App args for get_session(string)(byte[32],byte[36],uint64,uint64,uint64,uint64)"""
+    return [GET_SESSION_SELECTOR, _string(session_id)]
+
+
+def decode_get_session_return(log: bytes):
+    """Return value ((byte[32],byte[36],uint64,uint64,uint64,uint64)) from the call's last log"""
+    data = _returned(log)
+    return (bytes(data[0:32]), bytes(data[32:68]), int.from_bytes(data[68:76], 'big'), int.from_bytes(data[76:84], 'big'), int.from_bytes(data[84:92], 'big'), int.from_bytes(data[92:100], 'big'),)
+
+
+CHECK_CLAIM_STATUS_SELECTOR = bytes.fromhex('0b4ecdf0')
+
+
+def encode_check_claim_status(session_id, recipient_address) -> list[bytes]:
+    """App args for check_claim_status(string,address)uint64"""
+    return [CHECK_CLAIM_STATUS_SELECTOR, _string(session_id), _address(recipient_address)]
+
+
+def decode_check_claim_status_return(log: bytes):
+    """Return value (uint64) from the call's last log"""
+    data = _returned(log)
+    return int.from_bytes(data, 'big')
+
+
+CHECK_CLAIM_STATUSES_SELECTOR = bytes.fromhex('e8dc2c4d')
+
+
+def encode_check_claim_statuses(session_id, recipient_addresses) -> list[bytes]:
+    """App args for check_claim_statuses(string,address[])uint64[]"""
+    return [CHECK_CLAIM_STATUSES_SELECTOR, _string(session_id), len(recipient_addresses).to_bytes(2, 'big') + b"".join(_address(item) for item in recipient_addresses)]
+
+
+def decode_check_claim_statuses_return(log: bytes):
+    """Return value (uint64[]) from the call's last log"""
+    data = _returned(log)
+    return [int.from_bytes(data[2 + 8 * item:2 + 8 * (item + 1)], 'big') for item in range(int.from_bytes(data[:2], 'big'))]
+
+
+HELLO_SELECTOR = bytes.fromhex('02bece11')
+
+
+def encode_hello(name) -> list[bytes]:
+    """App args for hello(string)string"""
+    return [HELLO_SELECTOR, _string(name)]
+
+
+def decode_hello_return(log: bytes):
+    """Return value (string) from the call's last log"""
+    data = _returned(log)
+    return data[2:].decode()
+
+
+MINT_NFT_SELECTOR = bytes.fromhex('059e7680')
+
+
+def encode_mint_nft(asset_name, asset_unit, metadata_url, recipient_address) -> list[bytes]:
+    """App args for mint_nft(string,string,string,address)(uint8,uint16,uint16,uint16)"""
+    return [MINT_NFT_SELECTOR, _string(asset_name), _string(asset_unit), _string(metadata_url), _address(recipient_address)]
+
+
+def decode_mint_nft_return(log: bytes):
+    """Return value ((uint8,uint16,uint16,uint16)) from the call's last log"""
+    data = _returned(log)
+    return (int.from_bytes(data[0:1], 'big'), int.from_bytes(data[1:3], 'big'), int.from_bytes(data[3:5], 'big'), int.from_bytes(data[5:7], 'big'),)
+
+
+PREPARE_NFT_CREATION_SELECTOR = bytes.fromhex('7c01ba1e')
+
+
+def encode_prepare_nft_creation(asset_name, asset_unit, metadata_url) -> list[bytes]:
+    """App args for prepare_nft_creation(string,string,string)(uint8,uint16,uint16,uint16)"""
+    return [PREPARE_NFT_CREATION_SELECTOR, _string(asset_name), _string(asset_unit), _string(metadata_url)]
+
+
+def decode_prepare_nft_creation_return(log: bytes):
+    """Return value ((uint8,uint16,uint16,uint16)) from the call's last log"""
+    data = _returned(log)
+    return (int.from_bytes(data[0:1], 'big'), int.from_bytes(data[1:3], 'big'), int.from_bytes(data[3:5], 'big'), int.from_bytes(data[5:7], 'big'),)
+
+
+# method name -> (selector, encoder)
+ENCODERS = {
+    'create_session': (CREATE_SESSION_SELECTOR, encode_create_session),
+    'claim_badge': (CLAIM_BADGE_SELECTOR, encode_claim_badge),
+    'claim_badges_batch': (CLAIM_BADGES_BATCH_SELECTOR, encode_claim_badges_batch),
+    'deliver_badge': (DELIVER_BADGE_SELECTOR, encode_deliver_badge),
+    'get_session_info': (GET_SESSION_INFO_SELECTOR, encode_get_session_info),
+    'get_session': (GET_SESSION_SELECTOR, encode_get_session),
+    'check_claim_status': (CHECK_CLAIM_STATUS_SELECTOR, encode_check_claim_status),
+    'check_claim_statuses': (CHECK_CLAIM_STATUSES_SELECTOR, encode_check_claim_statuses),
+    'hello': (HELLO_SELECTOR, encode_hello),
+    'mint_nft': (MINT_NFT_SELECTOR, encode_mint_nft),
+    'prepare_nft_creation': (PREPARE_NFT_CREATION_SELECTOR, encode_prepare_nft_creation),
+}
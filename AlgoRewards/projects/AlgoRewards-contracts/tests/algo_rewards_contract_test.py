@@ -0,0 +1,124 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Bytes, String, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.algo_rewards_contract.contract import (
+    CID, CLAIM_BOX_MIN_BALANCE, AlgoRewardsContract, SessionDescribed,
+)
+
+# What a recipient pays per claim: the badge ASA's and the claims box's minimum balance
+CLAIM_MIN_BALANCE = 100_000 + CLAIM_BOX_MIN_BALANCE
+
+# Binary CIDv1 (raw codec, sha2-256)
+SAMPLE_DIGEST = bytes(range(32))
+SAMPLE_CID = bytes([1, 0x55, 0x12, 0x20]) + SAMPLE_DIGEST
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        # The network's asset minimum balance (the testing default is ten times it)
+        ctx.ledger.patch_global_fields(asset_create_min_balance=UInt64(100_000))
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> AlgoRewardsContract:
+    contract = AlgoRewardsContract()
+    contract.create_session(
+        String("session-1"), String("Session"), String("Description"),
+        CID.from_bytes(SAMPLE_CID), UInt64(0), UInt64(0), UInt64(0),
+    )
+    return contract
+
+
+def claim(contract: AlgoRewardsContract, recipient) -> arc4.Struct:
+    return contract.claim_badge(String("session-1"), arc4.Address(recipient))
+
+
+def paid_claim(context: AlgopyTestContext, contract: AlgoRewardsContract, recipient, amount: int) -> arc4.Struct:
+    """Claim as the recipient, after paying the app amount microAlgos"""
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(sender=recipient, receiver=app.address, amount=UInt64(amount))
+    call = context.any.txn.application_call(sender=recipient, app_id=app)
+    with context.txn.create_group(gtxns=[payment, call], active_txn_index=1):
+        return claim(contract, recipient)
+
+
+def test_recipient_can_claim_own_badge(context: AlgopyTestContext, contract: AlgoRewardsContract) -> None:
+    result = paid_claim(context, contract, context.any.account(), CLAIM_MIN_BALANCE)
+    assert result.claim_number.native == 1
+
+
+def test_unfunded_claim_is_rejected(context: AlgopyTestContext, contract: AlgoRewardsContract) -> None:
+    # A fresh account that is not on any list claims for itself without paying
+    recipient = context.any.account()
+    with context.txn.create_group(active_txn_overrides={"sender": recipient}):
+        with pytest.raises(AssertionError, match="Claim must follow a payment"):
+            claim(contract, recipient)
+
+
+def test_underpaid_claim_is_rejected(context: AlgopyTestContext, contract: AlgoRewardsContract) -> None:
+    with pytest.raises(AssertionError, match="does not cover"):
+        paid_claim(context, contract, context.any.account(), CLAIM_MIN_BALANCE - 1)
+
+
+def test_creator_can_claim_for_recipient(context: AlgopyTestContext, contract: AlgoRewardsContract) -> None:
+    result = claim(contract, context.any.account())
+    assert result.claim_number.native == 1
+
+
+def test_third_party_cannot_claim_for_recipient(context: AlgopyTestContext, contract: AlgoRewardsContract) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": context.any.account()}):
+        with pytest.raises(AssertionError, match="Only the recipient or the creator"):
+            claim(contract, context.any.account())
+
+
+def test_claim_is_once_per_recipient(context: AlgopyTestContext, contract: AlgoRewardsContract) -> None:
+    recipient = context.any.account()
+    claim(contract, recipient)
+    with pytest.raises(AssertionError, match="Badge already claimed"):
+        claim(contract, recipient)
+
+
+def test_badge_fields_come_from_the_session(context: AlgopyTestContext, contract: AlgoRewardsContract) -> None:
+    claim(contract, context.any.account())
+    badge = context.txn.last_group.last_itxn.asset_config
+    assert badge.asset_name == Bytes(b"AlgoRewards Badge")
+    assert badge.unit_name == Bytes(b"ARBADGE")
+    assert badge.url == Bytes(b"template-ipfs://{ipfscid:1:raw:reserve:sha2-256}")
+    assert badge.reserve.bytes == Bytes(SAMPLE_DIGEST)
+
+
+def test_create_session_rejects_malformed_cid(contract: AlgoRewardsContract) -> None:
+    with pytest.raises(AssertionError, match="Metadata CID"):
+        contract.create_session(
+            String("session-2"), String("Session"), String("Description"),
+            CID.from_bytes(bytes(36)), UInt64(0), UInt64(0), UInt64(0),
+        )
+
+
+def test_create_session_logs_name_and_description(context: AlgopyTestContext, contract: AlgoRewardsContract) -> None:
+    contract.create_session(
+        String("session-2"), String("Second Session"), String("A second description"),
+        CID.from_bytes(SAMPLE_CID), UInt64(0), UInt64(0), UInt64(0),
+    )
+    # The ARC-28 event (4-byte selector, then the struct) is logged just before the return value
+    txn = context.txn.last_active
+    event = SessionDescribed.from_bytes(txn.logs(txn.num_logs - 2)[4:])
+    assert event.session_number.native == 2
+    assert event.name.native == "Second Session"
+    assert event.description.native == "A second description"
+
+
+def test_session_info_is_the_session_record(contract: AlgoRewardsContract) -> None:
+    assert contract.get_session_info(String("session-1")).bytes == contract.get_session(String("session-1")).bytes
+
+
+def test_batch_claim_mints_one_badge_per_recipient(context: AlgopyTestContext, contract: AlgoRewardsContract) -> None:
+    recipients = arc4.DynamicArray[arc4.Address](*(arc4.Address(context.any.account()) for _ in range(8)))
+    badge_ids = contract.claim_badges_batch(String("session-1"), recipients)
+    assert len({badge_id.native for badge_id in badge_ids}) == 8
+    assert contract.get_session(String("session-1")).claim_count.native == 8
@@ -0,0 +1,46 @@
+import pytest
+
+from batch_claims import (
+    MAX_BADGES_PER_GROUP,
+    MAX_GROUP_SIZE,
+    MAX_INNER_TXNS_PER_GROUP,
+    MAX_REFERENCES_PER_CALL,
+    op_up_calls,
+    plan_claim_groups,
+)
+
+RECIPIENTS = [f"recipient-{index}" for index in range(300)]
+
+
+def test_groups_fill_every_reference() -> None:
+    groups = list(plan_claim_groups(RECIPIENTS))
+    assert [sum(map(len, calls)) for calls in groups] == [127, 127, 46]
+    first = groups[0]
+    assert len(first) == MAX_GROUP_SIZE
+    assert len(first[0]) == MAX_REFERENCES_PER_CALL - 1
+    assert all(len(call) == MAX_REFERENCES_PER_CALL for call in first[1:])
+
+
+def test_plan_drops_duplicates_and_keeps_order() -> None:
+    calls, = plan_claim_groups(["a", "b", "a", "c"])
+    assert calls == [["a", "b", "c"]]
+
+
+def test_badges_per_group_is_bounded() -> None:
+    with pytest.raises(ValueError):
+        next(plan_claim_groups(RECIPIENTS, MAX_BADGES_PER_GROUP + 1))
+
+
+@pytest.mark.parametrize(
+    ("badges", "measured"),
+    # Fewest op-ups each group needed on the AVM (v10)
+    [(1, 0), (7, 1), (15, 2), (40, 4), (66, 6), (100, 10), (127, 13)],
+)
+def test_op_up_calls_cover_measured_cost(badges: int, measured: int) -> None:
+    calls, = plan_claim_groups(RECIPIENTS[:badges])
+    assert measured <= op_up_calls(calls) <= measured + 1
+
+
+def test_full_group_stays_under_inner_txn_limit() -> None:
+    calls, = plan_claim_groups(RECIPIENTS[:MAX_BADGES_PER_GROUP])
+    assert MAX_BADGES_PER_GROUP + op_up_calls(calls) <= MAX_INNER_TXNS_PER_GROUP
@@ -0,0 +1,62 @@
+import pytest
+from algosdk import account
+
+from ipfs_cid import (
+    bytes_to_cid,
+    cid_from_ipfs_url,
+    cid_to_bytes,
+    cid_to_reserve_address,
+    compute_cid,
+    compute_metadata_cid,
+    decode_cid,
+    reserve_address_to_cid,
+    serialize_for_pinata,
+)
+
+
+def test_compute_cid_matches_ipfs_add() -> None:
+    # `ipfs add` / `ipfs add --cid-version 1 --raw-leaves` of the same bytes
+    assert compute_cid(b"hello world", version=0) == "Qmf412jQZiuVUtdgnB36FXFX7xg5V6KEbSJ4dpQuhkLyfD"
+    assert compute_cid(b"hello world\n", version=0) == "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o"
+    assert compute_cid(b"") == "bafkreihdwdcefgh4dqkjv67uzcmw7ojee6xedzdetojuzjevtenxquvyku"
+
+
+def test_metadata_cid_uses_pinata_serialization() -> None:
+    metadata = {"name": "Badge", "description": "Café"}
+    assert serialize_for_pinata(metadata) == '{"name":"Badge","description":"Café"}'.encode()
+    assert compute_metadata_cid(metadata) == compute_cid(serialize_for_pinata(metadata))
+    assert compute_metadata_cid({"description": "Café", "name": "Badge"}) != compute_metadata_cid(metadata)
+
+
+@pytest.mark.parametrize("version, codec", [(0, "dag-pb"), (1, "raw"), (1, "dag-pb")])
+def test_decode_cid_round_trips(version, codec) -> None:
+    cid = compute_cid(b"badge metadata", version=version, codec=codec)
+    parts = decode_cid(cid)
+    assert (parts["version"], parts["codec"]) == (version, codec)
+    assert reserve_address_to_cid(cid_to_reserve_address(cid), version, codec) == cid
+
+
+def test_binary_cid_is_fixed_width_cidv1() -> None:
+    v0 = compute_cid(b"badge metadata", version=0)
+    v1 = compute_cid(b"badge metadata", version=1, codec="dag-pb")
+    assert len(cid_to_bytes(v0)) == 36
+    assert bytes_to_cid(cid_to_bytes(v0)) == v1
+    with pytest.raises(ValueError):
+        bytes_to_cid(cid_to_bytes(v0)[:35])
+
+
+def test_reserve_address_carries_the_digest() -> None:
+    cid = compute_cid(b"badge metadata")
+    address = cid_to_reserve_address(cid)
+    assert decode_cid(reserve_address_to_cid(address))["digest"] == decode_cid(cid)["digest"]
+    assert reserve_address_to_cid(account.generate_account()[1]).startswith("bafkrei")
+
+
+def test_rejects_unsupported_input() -> None:
+    with pytest.raises(ValueError):
+        compute_cid(b"x" * 262_145)
+    with pytest.raises(ValueError):
+        decode_cid("zb2rhe5P4gXftAwvA4eXQ5HJwsER2owDyS9sKaQRRVQPn93bA")
+    with pytest.raises(ValueError):
+        cid_from_ipfs_url("https://ipfs.io/ipfs/Qm")
+    assert cid_from_ipfs_url("ipfs://bafkrei/metadata.json") == "bafkrei"
@@ -0,0 +1,31 @@
+from ipfs_cid import compute_metadata_cid
+from metadata_cache import MetadataCache, content_cid
+
+
+def test_cache_keys_by_pinned_cid() -> None:
+    cache = MetadataCache(":memory:")
+    metadata = {"name": "Badge", "description": "Attendance"}
+    reordered = {"description": "Attendance", "name": "Badge"}
+
+    cid = cache.put(metadata, f"ipfs://{compute_metadata_cid(metadata)}")
+
+    assert cid == content_cid(metadata) == compute_metadata_cid(metadata)
+    assert cache.get(metadata) == f"ipfs://{cid}"
+    # Pinata keeps insertion order, so a reordered document is a different file
+    assert content_cid(reordered) != cid
+    assert cache.get(reordered) is None
+    cache.close()
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = MetadataCache(":memory:", max_entries=2)
+    documents = [{"name": f"Badge {i}"} for i in range(3)]
+    for document in documents[:2]:
+        cache.put(document, f"ipfs://{content_cid(document)}")
+    cache.get(documents[0])
+    cache.put(documents[2], f"ipfs://{content_cid(documents[2])}")
+
+    assert cache.get(documents[1]) is None
+    assert cache.get(documents[0]) is not None
+    assert cache.stats()["evictions"] == 1
+    cache.close()
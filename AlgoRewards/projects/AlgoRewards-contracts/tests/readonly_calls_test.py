@@ -0,0 +1,78 @@
+import threading
+from types import SimpleNamespace
+
+from readonly_calls import MAX_APP_ARGS_BYTES, ReadonlyCallCache, addresses_per_status_call
+
+
+class CountingCache(ReadonlyCallCache):
+    """Answers every simulate with (app ID, sender, args) at round 100"""
+
+    def __init__(self, app_id: int = 1) -> None:
+        super().__init__(SimpleNamespace(app_id=app_id), round_time=60)
+        self.simulated = 0
+
+    def _simulate(self, method, args, sender):
+        self.simulated += 1
+        return (self.app_client.app_id, sender, args), 100
+
+
+def test_repeat_call_is_cached() -> None:
+    cache = CountingCache()
+    assert cache.call("check_claim_status", ["s", "A"]) == cache.call("check_claim_status", ["s", "A"])
+    assert cache.simulated == 1
+
+
+def test_sender_is_part_of_the_key() -> None:
+    cache = CountingCache()
+    assert cache.call("hello", ["x"], sender="A") != cache.call("hello", ["x"], sender="B")
+    assert cache.simulated == 2
+
+
+def test_app_is_part_of_the_key() -> None:
+    cache = CountingCache(app_id=1)
+    first = cache.call("hello", ["x"])
+    cache.app_client = SimpleNamespace(app_id=2)
+    assert cache.call("hello", ["x"]) != first
+
+
+def test_newer_round_drops_results() -> None:
+    cache = CountingCache()
+    cache.call("hello", ["x"])
+    cache.observe_round(101)
+    cache.call("hello", ["x"])
+    assert cache.simulated == 2
+
+
+def test_observe_round_keeps_the_newest_round() -> None:
+    cache = CountingCache()
+    threads = [threading.Thread(target=cache.observe_round, args=(round_number,)) for round_number in range(200)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.stats()["cached_round"] == 199
+
+
+def test_status_call_fills_the_app_args() -> None:
+    from algosdk import abi
+
+    method = abi.Method.from_signature("check_claim_statuses(string,address[])uint64[]")
+
+    def size(session_id: str, count: int) -> int:
+        values = [session_id, [bytes(32)] * count]
+        return 4 + sum(len(arg.type.encode(value)) for arg, value in zip(method.args, values))
+
+    for session_id in ["", "session-1", "x" * 25, "x" * 100]:
+        per_call = addresses_per_status_call(session_id)
+        assert size(session_id, per_call) <= MAX_APP_ARGS_BYTES < size(session_id, per_call + 1)
+
+
+def test_registry_keeps_one_cache_per_app_client(monkeypatch) -> None:
+    from app_clients import AppClientRegistry
+
+    registry = AppClientRegistry()
+    monkeypatch.setattr(registry, "get", lambda app_id, sender=None, network=None: SimpleNamespace(app_id=app_id))
+    cache = registry.readonly(1, "A", "localnet")
+    assert registry.readonly(1, "A", "localnet") is cache
+    assert registry.readonly(2, "A", "localnet") is not cache
+    assert cache.app_client.app_id == 1
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Async NFT Minting Service for AlgoRewards
+Absorbs claim bursts with a bounded pool of asyncio workers
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+from nft_minter import AlgoRewardsNFTMinter
+
+
+class AsyncAlgoRewardsNFTMinter(AlgoRewardsNFTMinter):
+    """
+    Asyncio variant of AlgoRewardsNFTMinter
+
+    Claims are queued and drained by a fixed number of worker tasks. Waiting
+    for confirmation happens on the shared ConfirmationTracker, so a claim in
+    flight holds no thread while its transactions are pending. When the queue
+    is full, submit_claim() waits for space (backpressure) instead of
+    growing memory without bound.
+    """
+
+    def __init__(
+        self,
+        algod_client=None,
+        private_key: Optional[str] = None,
+        max_workers: int = 16,
+        max_queue: int = 1000
+    ):
+        """
+        Initialize the async minter
+
+        Args:
+            algod_client: Optional algod client (defaults to the environment)
+            private_key: Optional creator key (defaults to DEPLOYER_MNEMONIC)
+            max_workers: Number of claims processed concurrently
+            max_queue: Claims that may wait in the queue before submit blocks
+        """
+        super().__init__(algod_client=algod_client, private_key=private_key)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers = []
+
+    async def __aenter__(self) -> "AsyncAlgoRewardsNFTMinter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Start the worker tasks on the running event loop"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"mint-worker-{i}")
+            for i in range(self.max_workers)
+        ]
+
+    async def close(self):
+        """Wait for queued claims to finish, then stop the workers"""
+        if not self._workers:
+            return
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit_claim(
+        self,
+        session_name: str,
+        session_id: str,
+        recipient_address: str,
+        metadata_url: str,
+        custom_properties: Optional[Dict[str, Any]] = None
+    ) -> "asyncio.Future[int]":
+        """
+        Queue a badge claim
+
+        Waits only while the queue is full; returns as soon as the claim is
+        queued.
+
+        Args:
+            session_name: Name of the learning session
+            session_id: Unique session identifier
+            recipient_address: Address to receive the badge
+            metadata_url: IPFS URL for metadata JSON
+            custom_properties: Optional custom metadata properties
+
+        Returns:
+            Future resolving to the asset ID of the minted badge
+        """
+        if not self._workers:
+            await self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        claim = (session_name, session_id, recipient_address, metadata_url, custom_properties)
+        await self._queue.put((claim, future))
+        return future
+
+    async def mint_badge_nft_async(
+        self,
+        session_name: str,
+        session_id: str,
+        recipient_address: str,
+        metadata_url: str,
+        custom_properties: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Queue a claim and wait for its asset ID"""
+        future = await self.submit_claim(
+            session_name, session_id, recipient_address, metadata_url, custom_properties
+        )
+        return await future
+
+    async def _worker(self):
+        """Drain claims from the queue one at a time"""
+        while True:
+            claim, future = await self._queue.get()
+            try:
+                if not future.cancelled():
+                    asset_id = await self._process_claim(*claim)
+                    if not future.cancelled():
+                        future.set_result(asset_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def _process_claim(
+        self,
+        session_name: str,
+        session_id: str,
+        recipient_address: str,
+        metadata_url: str,
+        custom_properties: Optional[Dict[str, Any]]
+    ) -> int:
+        """Create, confirm and transfer one badge without blocking the loop"""
+        metadata = self.create_badge_metadata(
+            session_name, session_id, recipient_address, custom_properties
+        )
+        metadata_hash = self.compute_metadata_hash(metadata)
+        params = await self.params.aget()
+
+        txn = self._build_badge_create_txn(params, metadata_url, metadata_hash)
+        txid = await asyncio.to_thread(
+            self.algod_client.send_transaction, txn.sign(self.private_key)
+        )
+        result = await self._confirm(txid, params.first, fetch_info=True)
+        asset_id = result['asset-index']
+
+        if recipient_address != self.address:
+            transfer_txn = self._build_transfer_txn(asset_id, recipient_address, params)
+            txid = await asyncio.to_thread(
+                self.algod_client.send_transaction, transfer_txn.sign(self.private_key)
+            )
+            await self._confirm(txid, params.first)
+
+        return asset_id
+
+    async def _confirm(self, txid: str, first_round: int, fetch_info: bool = False) -> Dict[str, Any]:
+        """Wait for a transaction on the shared tracker without blocking the loop"""
+        # track() may query algod for the current round before it returns
+        future = await asyncio.to_thread(
+            self.confirmations.track, txid, fetch_info=fetch_info, first_round=first_round
+        )
+        return await asyncio.wrap_future(future)
+
+
+async def _demo():
+    """Mint a burst of badges against the in-process fake algod"""
+    from algosdk import account
+    from fake_algod import FakeAlgodClient
+
+    private_key, address = account.generate_account()
+    algod_client = FakeAlgodClient(round_time=0.5, latency=0.01)
+
+    async with AsyncAlgoRewardsNFTMinter(algod_client, private_key, max_workers=32) as minter:
+        futures = [
+            await minter.submit_claim(
+                session_name="Algorand Smart Contracts 101",
+                session_id="algo-sc-001",
+                recipient_address=address,
+                metadata_url="ipfs://demo",
+            )
+            for _ in range(200)
+        ]
+        asset_ids = await asyncio.gather(*futures)
+
+    print(f"✅ Minted {len(asset_ids)} badges")
+    print(f"   Algod calls: {algod_client.total_calls}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
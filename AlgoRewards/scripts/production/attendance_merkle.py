@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Attendance Merkle Trees for AlgoRewards
+Builds a session's attendee Merkle root and per-attendee proofs from a roster in one pass
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from typing import Iterable, List, Optional
+from algosdk import encoding
+from roster_metadata import read_roster
+
+
+# Domain separation so a leaf can never be passed off as an inner node
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+
+def leaf_hash(address: str) -> bytes:
+    """Leaf for an attendee: sha256(0x00 || 32-byte public key)"""
+    return hashlib.sha256(LEAF_PREFIX + encoding.decode_address(address)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Inner node over a sorted pair, so proofs need no left/right flags"""
+    if right < left:
+        left, right = right, left
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+def verify_proof(root: bytes, address: str, proof: Iterable[bytes]) -> bool:
+    """Check a proof the way the contract does"""
+    node = leaf_hash(address)
+    for sibling in proof:
+        node = node_hash(node, sibling)
+    return node == root
+
+
+class AttendanceTree:
+    """
+    Merkle tree over attendee addresses, built incrementally
+
+    Nodes are hashed as soon as both children exist, so the roster is read
+    once and only the hashes (32 bytes per node) are kept. A node without
+    a sibling is promoted to the next level unchanged.
+    """
+
+    def __init__(self, addresses: Iterable[str] = ()):
+        self.levels: List[List[bytes]] = [[]]
+        self.index = {}
+        self._root: Optional[bytes] = None
+        for address in addresses:
+            self.add(address)
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def add(self, address: str):
+        """Append an attendee (duplicates are ignored)"""
+        if self._root is not None:
+            raise RuntimeError("Tree is already finalized")
+        if address in self.index:
+            return
+        self.index[address] = len(self.levels[0])
+        self._push(0, leaf_hash(address))
+
+    def _push(self, level: int, node: bytes):
+        """Append a node and hash completed pairs upwards"""
+        self.levels[level].append(node)
+        while len(self.levels[level]) % 2 == 0:
+            pair = self.levels[level][-2:]
+            level += 1
+            if level == len(self.levels):
+                self.levels.append([])
+            self.levels[level].append(node_hash(*pair))
+
+    @property
+    def root(self) -> bytes:
+        """Merkle root; finalizes the tree on first access"""
+        if self._root is None:
+            if not self.levels[0]:
+                raise ValueError("Cannot build a Merkle root without attendees")
+            level = 0
+            while level < len(self.levels) - 1 or len(self.levels[level]) > 1:
+                if len(self.levels[level]) % 2:
+                    # Promote the unpaired last node
+                    if level + 1 == len(self.levels):
+                        self.levels.append([])
+                    self._push(level + 1, self.levels[level][-1])
+                level += 1
+            self._root = self.levels[-1][0]
+        return self._root
+
+    def proof(self, address: str) -> List[bytes]:
+        """Sibling hashes from the attendee's leaf up to the root"""
+        self.root  # finalize
+        position = self.index[address]
+        proof = []
+        for nodes in self.levels[:-1]:
+            sibling = position ^ 1
+            if sibling < len(nodes):
+                proof.append(nodes[sibling])
+            position //= 2
+        return proof
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a session's attendance Merkle root and proofs")
+    parser.add_argument("roster", help="CSV or JSONL roster with an 'address' column")
+    parser.add_argument("--out", help="JSONL file for per-attendee proofs (defaults to stdout)")
+    args = parser.parse_args()
+
+    tree = AttendanceTree(address for address, _ in read_roster(args.roster))
+    root = tree.root
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for address in tree.index:
+            proof = [sibling.hex() for sibling in tree.proof(address)]
+            out.write(json.dumps({"address": address, "proof": proof}) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"✅ {len(tree)} attendees, {len(tree.levels) - 1} proof levels", file=sys.stderr)
+    print(f"🌳 Merkle root: {root.hex()}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
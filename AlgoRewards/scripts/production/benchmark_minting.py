@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+"""
+Minting Benchmarks for AlgoRewards
+Reproducible benchmarks of the minting path against in-process stand-ins
+for algod, indexer and Pinata
+"""
+
+import argparse
+import functools
+import json
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from algosdk import account, transaction
+from delivery_pipeline import DeliveryPipeline
+from fake_algod import FakeAlgodClient, FakeAlgodServer, FakeIndexerClient
+from metadata_template import BadgeMetadataTemplate
+from mint_queue import MintJobQueue, MintQueueWorker
+from nft_minter import AlgoRewardsNFTMinter, ASSET_MIN_BALANCE
+
+# Make the contracts project (ipfs_utils, generated client) importable
+CONTRACTS_ROOT = Path(__file__).resolve().parents[2] / "projects" / "AlgoRewards-contracts"
+sys.path.insert(0, str(CONTRACTS_ROOT))
+
+
+SESSION_NAME = "Algorand Smart Contracts 101"
+SESSION_ID = "algo-sc-001"
+METADATA_URL = "ipfs://bafkreihddthm5xr6n5fhtyg3kv4vd2wwfhewgm4j3qamynwc4f4k7tiwoa"
+
+
+def _opt_in_all(
+    algod_client: FakeAlgodClient,
+    attendees: List[Tuple[str, str]],
+    asset_ids: Dict[str, int]
+) -> int:
+    """
+    Have every attendee opt in to their badge asset (not timed)
+
+    Returns:
+        Number of algod calls spent on the opt-ins, to exclude from totals
+    """
+    calls_before = algod_client.total_calls
+    params = algod_client.suggested_params()
+    for private_key, address in attendees:
+        opt_in = transaction.AssetTransferTxn(address, params, address, 0, asset_ids[address])
+        algod_client.send_transaction(opt_in.sign(private_key))
+    return algod_client.total_calls - calls_before
+
+
+def _mode_report(name, attendees, elapsed, algod_client, setup_calls,
+                 assets_created, creator_txns, delivered):
+    """Summarize one issuance mode"""
+    return {
+        "mode": name,
+        "attendees": attendees,
+        "delivered": delivered,
+        "seconds": elapsed,
+        "badges_per_second": delivered / elapsed if elapsed else 0.0,
+        "algod_calls": algod_client.total_calls - setup_calls,
+        "creator_txns": creator_txns,
+        "creator_fees": creator_txns * algod_client.min_fee,
+        "creator_min_balance": assets_created * ASSET_MIN_BALANCE,
+    }
+
+
+def bench_per_attendee_mode(attendees: int, round_time: float, latency: float) -> Dict[str, Any]:
+    """One ASA per attendee: batch create, then grouped delivery"""
+    algod_client = FakeAlgodClient(round_time=round_time, latency=latency)
+    minter = AlgoRewardsNFTMinter(algod_client, account.generate_account()[0])
+    accounts = [account.generate_account() for _ in range(attendees)]
+    recipients = [address for _, address in accounts]
+
+    start = time.perf_counter()
+    asset_ids = minter.mint_badges_batch(
+        recipients, SESSION_NAME, SESSION_ID, METADATA_URL, transfer=False
+    )
+    minted = time.perf_counter() - start
+
+    setup_calls = _opt_in_all(algod_client, accounts, asset_ids)
+
+    start = time.perf_counter()
+    report = DeliveryPipeline(minter).deliver(asset_ids.items())
+    elapsed = minted + time.perf_counter() - start
+
+    return _mode_report(
+        "per-attendee", attendees, elapsed, algod_client, setup_calls,
+        assets_created=attendees,
+        creator_txns=2 * attendees,
+        delivered=len(report["delivered"]),
+    )
+
+
+def bench_edition_mode(attendees: int, round_time: float, latency: float) -> Dict[str, Any]:
+    """One ASA per session with total = attendees, units delivered in groups"""
+    algod_client = FakeAlgodClient(round_time=round_time, latency=latency)
+    minter = AlgoRewardsNFTMinter(algod_client, account.generate_account()[0])
+    accounts = [account.generate_account() for _ in range(attendees)]
+    recipients = [address for _, address in accounts]
+
+    start = time.perf_counter()
+    asset_id = minter.create_session_edition(SESSION_NAME, SESSION_ID, attendees, METADATA_URL)
+    minter.create_edition_records(recipients, SESSION_NAME, SESSION_ID, asset_id)
+    minted = time.perf_counter() - start
+
+    setup_calls = _opt_in_all(algod_client, accounts, {address: asset_id for address in recipients})
+
+    start = time.perf_counter()
+    report = DeliveryPipeline(minter).deliver((address, asset_id) for address in recipients)
+    elapsed = minted + time.perf_counter() - start
+
+    return _mode_report(
+        "edition", attendees, elapsed, algod_client, setup_calls,
+        assets_created=1,
+        creator_txns=1 + attendees,
+        delivered=len(report["delivered"]),
+    )
+
+
+def compare_badge_modes(attendees: int = 500, round_time: float = 0.5, latency: float = 0.005):
+    """Run both issuance modes and print a comparison table"""
+    results = [
+        bench_per_attendee_mode(attendees, round_time, latency),
+        bench_edition_mode(attendees, round_time, latency),
+    ]
+
+    print(f"📊 Badge issuance modes ({attendees} attendees, "
+          f"{round_time}s rounds, {latency * 1000:.0f}ms latency)")
+    print("=" * 78)
+    print(f"{'mode':<14}{'badges/s':>10}{'seconds':>10}{'txns':>8}"
+          f"{'fees (µA)':>12}{'min bal (µA)':>14}{'algod':>10}")
+    for r in results:
+        print(f"{r['mode']:<14}{r['badges_per_second']:>10.1f}{r['seconds']:>10.2f}"
+              f"{r['creator_txns']:>8}{r['creator_fees']:>12}"
+              f"{r['creator_min_balance']:>14}{r['algod_calls']:>10}")
+    return results
+
+
+def compare_claim_groups(attendees: int = 500, round_time: float = 0.5, latency: float = 0.005):
+    """
+    Badges per atomic group: one claim_badge call per recipient vs claim_badges_batch
+
+    Both methods send real groups through the generated client against
+    FakeAlgodServer and wait for each to confirm. claim_badge groups hold
+    16 calls; claim_badges_batch groups are laid out by
+    batch_claims.claim_badges_batch, op-up fees included. The fake does not
+    run TEAL, so every figure is a planner estimate: groups and fees are
+    what the client laid out, not what the AVM accepted, and opcode cost is
+    not checked here (see batch_claims).
+    """
+    from algokit_utils import AlgoAmount, CommonAppCallParams
+    from batch_claims import MAX_GROUP_SIZE, claim_badges_batch
+    from claim_registry import claim_box_name
+    from session_registry import session_box_name
+
+    recipients = [account.generate_account()[1] for _ in range(attendees)]
+
+    def send_single(app_client, send_params):
+        for start in range(0, attendees, MAX_GROUP_SIZE):
+            group = app_client.algorand.new_group()
+            for recipient in recipients[start:start + MAX_GROUP_SIZE]:
+                group.add_app_call_method_call(app_client.params.claim_badge(
+                    args=(SESSION_ID, recipient),
+                    params=CommonAppCallParams(
+                        static_fee=AlgoAmount(micro_algo=2000),
+                        box_references=[session_box_name(SESSION_ID), claim_box_name(SESSION_ID, recipient)],
+                    ),
+                ))
+            group.send(send_params)
+
+    def send_batch(app_client, send_params):
+        claim_badges_batch(app_client, SESSION_ID, recipients, skip_claimed=False)
+
+    results = []
+    for method, send in (("claim_badge", send_single), ("claim_badges_batch", send_batch)):
+        algod_client = FakeAlgodClient(round_time=round_time, latency=latency)
+        with FakeAlgodServer(algod_client) as server:
+            app_client, _sender, send_params = _contract_app_client(algod_client, server)
+            start = time.perf_counter()
+            send(app_client, send_params)
+            elapsed = time.perf_counter() - start
+        txns = [info["txn"]["txn"] for info in algod_client._txns.values()]
+        groups = algod_client.call_counts.get("send_transactions", 0)
+        results.append({
+            "method": method,
+            "groups": groups,
+            "app_calls": len(txns),
+            "badges_per_group": attendees / groups if groups else 0.0,
+            "fees": sum(txn.get("fee", 0) for txn in txns),
+            "seconds": elapsed,
+        })
+
+    print(f"📊 Claim groups, planner estimates ({attendees} attendees, {round_time}s rounds, "
+          f"{latency * 1000:.0f}ms latency)")
+    print("=" * 72)
+    print(f"{'method':<22}{'groups':>8}{'app calls':>11}{'badges/group':>14}"
+          f"{'fees (µA)':>11}{'seconds':>9}")
+    for r in results:
+        print(f"{r['method']:<22}{r['groups']:>8}{r['app_calls']:>11}{r['badges_per_group']:>14.1f}"
+              f"{r['fees']:>11}{r['seconds']:>9.2f}")
+    print("   FakeAlgod does not run TEAL: groups and fees are as planned, not as executed")
+    return results
+
+
+def _run_timed(operation: Callable[[int], Any], count: int, concurrency: int) -> Dict[str, Any]:
+    """
+    Run `operation(i)` for i in range(count) on a thread pool
+
+    Returns:
+        Dict with wall-clock 'seconds', per-call 'samples' (seconds) and
+        'errors' (the first few exception messages)
+    """
+    samples: List[float] = []
+    errors: List[str] = []
+
+    def timed(i: int):
+        start = time.perf_counter()
+        try:
+            operation(i)
+        except Exception as e:
+            errors.append(str(e))
+            return
+        samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(count)))
+    return {"seconds": time.perf_counter() - start, "samples": samples, "errors": errors[:3]}
+
+
+def _summarize(name: str, run: Dict[str, Any], algod_calls: int = 0, **extra) -> Dict[str, Any]:
+    """Turn a _run_timed result into ops/s and latency percentiles"""
+    samples = sorted(run["samples"])
+    ops = len(samples)
+
+    def percentile(p: float) -> float:
+        if not samples:
+            return 0.0
+        return samples[min(ops - 1, int(round(p * (ops - 1))))] * 1000
+
+    return {
+        "benchmark": name,
+        "ops": ops,
+        "errors": run["errors"],
+        "ops_per_second": ops / run["seconds"] if run["seconds"] else 0.0,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "mean_ms": statistics.fmean(samples) * 1000 if samples else 0.0,
+        "algod_calls_per_op": algod_calls / ops if ops else 0.0,
+        **extra,
+    }
+
+
+def bench_mint_badge_nft(count: int, concurrency: int, round_time: float, latency: float) -> Dict[str, Any]:
+    """AlgoRewardsNFTMinter.mint_badge_nft: create + confirm per badge"""
+    algod_client = FakeAlgodClient(round_time=round_time, latency=latency)
+    minter = AlgoRewardsNFTMinter(algod_client, account.generate_account()[0])
+
+    # Identical metadata would make identical transactions, so each badge gets its own
+    run = _run_timed(
+        lambda i: minter.mint_badge_nft(
+            SESSION_NAME, SESSION_ID, minter.address, METADATA_URL, custom_properties={"serial": i}
+        ),
+        count, concurrency
+    )
+    minter.confirmations.close()
+    return _summarize("mint_badge_nft", run, algod_client.total_calls)
+
+
+def bench_metadata_hash(count: int) -> List[Dict[str, Any]]:
+    """compute_metadata_hash over create_badge_metadata vs a compiled template"""
+    recipients = [account.generate_account()[1] for _ in range(min(count, 1000))]
+    recipients = [recipients[i % len(recipients)] for i in range(count)]
+
+    def timed(name: str, hash_one: Callable[[str], bytes]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        for recipient in recipients:
+            hash_one(recipient)
+        elapsed = time.perf_counter() - start
+        run = {"samples": [elapsed / count] * count, "errors": [], "seconds": elapsed}
+        return _summarize(name, run)
+
+    template = BadgeMetadataTemplate(SESSION_NAME, SESSION_ID)
+    return [
+        timed("compute_metadata_hash", lambda recipient: AlgoRewardsNFTMinter.compute_metadata_hash(
+            AlgoRewardsNFTMinter.create_badge_metadata(SESSION_NAME, SESSION_ID, recipient)
+        )),
+        timed("BadgeMetadataTemplate.metadata_hash", template.metadata_hash),
+    ]
+
+
+def bench_metadata_upload(count: int, concurrency: int, latency: float) -> Dict[str, Any]:
+    """IPFSMetadataManager.create_and_upload_badge_metadata against fake Pinata"""
+    from fake_pinata import FakePinataServer
+    from ipfs_utils import IPFSMetadataManager
+
+    with FakePinataServer(latency=latency) as pinata:
+        manager = IPFSMetadataManager("bench-key", "bench-secret", pinata_url=pinata.url)
+        run = _run_timed(
+            lambda i: manager.create_and_upload_badge_metadata(
+                session_name=SESSION_NAME,
+                session_description="Benchmark session",
+                session_id=SESSION_ID,
+                attributes={"Attendee": i},
+            ),
+            count, concurrency
+        )
+        connections = len(pinata.connections)
+    return _summarize("create_and_upload_badge_metadata", run, connections=connections)
+
+
+def bench_metadata_upload_batch(count: int, concurrency: int, latency: float) -> Dict[str, Any]:
+    """IPFSMetadataManager.create_and_upload_badge_metadata_batch for one session"""
+    from fake_pinata import FakePinataServer
+    from ipfs_utils import IPFSMetadataManager
+
+    with FakePinataServer(latency=latency) as pinata:
+        manager = IPFSMetadataManager(
+            "bench-key", "bench-secret", pinata_url=pinata.url, max_workers=concurrency
+        )
+        start = time.perf_counter()
+        urls = manager.create_and_upload_badge_metadata_batch(
+            session_name=SESSION_NAME,
+            session_description="Benchmark session",
+            session_id=SESSION_ID,
+            attendee_attributes=[{"Attendee": i} for i in range(count)],
+        )
+        elapsed = time.perf_counter() - start
+        connections = len(pinata.connections)
+
+    # Per-document latency is not observable inside the batch; report the mean
+    run = {"samples": [elapsed / count] * len(urls), "errors": [], "seconds": elapsed}
+    return _summarize("create_and_upload_badge_metadata_batch", run, connections=connections)
+
+
+def bench_queue_recovery(count: int, round_time: float, latency: float, page_size: int = 100) -> Dict[str, Any]:
+    """
+    MintQueueWorker recovery of SUBMITTED jobs whose txids algod has forgotten
+
+    The creator's assets are paged through the indexer once for the whole
+    pass, so indexer calls grow with count / page_size, not with count.
+    """
+    algod_client = FakeAlgodClient(round_time=round_time, latency=latency)
+    minter = AlgoRewardsNFTMinter(algod_client, account.generate_account()[0])
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = MintJobQueue(str(Path(tmp) / "jobs.db"))
+        worker = MintQueueWorker(queue, minter, indexer_client=FakeIndexerClient(algod_client),
+                                 page_size=page_size)
+        queue.enqueue(SESSION_NAME, SESSION_ID, [account.generate_account()[1] for _ in range(count)],
+                      METADATA_URL)
+        params = minter.params.get()
+        futures = [worker._submit_create(job, params) for job in queue.claim(worker.worker_id, limit=count)]
+        for future in futures:
+            future.result()
+
+        # A restarted worker finds every job SUBMITTED and algod has forgotten the txids
+        jobs = queue.conn.execute("SELECT * FROM mint_jobs").fetchall()
+        for job in jobs:
+            algod_client._txns.pop(job["create_txid"])
+        round_now = algod_client.status()["last-round"]
+        created_assets = functools.lru_cache(maxsize=None)(worker._created_assets)
+        algod_client.reset_counts()
+
+        run = _run_timed(lambda i: worker._resume_create(jobs[i], round_now, created_assets), count, 1)
+        queue.close()
+    minter.confirmations.close()
+    return _summarize("mint queue recovery (indexer)", run, algod_client.total_calls,
+                      indexer_calls=algod_client.call_counts.get("indexer_created_assets", 0))
+
+
+def _zero_value(abi_type):
+    """Default value for an ABI type, used for canned app call returns"""
+    from algosdk import abi
+
+    if isinstance(abi_type, abi.StringType):
+        return ""
+    if isinstance(abi_type, abi.BoolType):
+        return False
+    if isinstance(abi_type, abi.AddressType):
+        return bytes(32)
+    if isinstance(abi_type, abi.ArrayDynamicType):
+        return []
+    if isinstance(abi_type, abi.ArrayStaticType):
+        return [_zero_value(abi_type.child_type)] * abi_type.static_length
+    if isinstance(abi_type, abi.TupleType):
+        return [_zero_value(child) for child in abi_type.child_types]
+    return 0
+
+
+def _register_app_returns(algod_client: FakeAlgodClient, app_spec: Dict[str, Any]):
+    """Have the fake algod answer every ABI method with a zero return value"""
+    from algosdk import abi
+
+    for spec in app_spec["methods"]:
+        arg_types = ",".join(arg["type"] for arg in spec["args"])
+        method = abi.Method.from_signature(f"{spec['name']}({arg_types}){spec['returns']['type']}")
+        log = bytes.fromhex("151f7c75")
+        if method.returns.type != abi.Returns.VOID:
+            log += method.returns.type.encode(_zero_value(method.returns.type))
+        algod_client.app_returns[method.get_selector()] = log
+
+
+def _contract_app_client(algod_client: FakeAlgodClient, server: FakeAlgodServer):
+    """
+    Generated AlgoRewardsContractClient talking to `server`
+
+    Returns:
+        (app client, sender account, send params)
+    """
+    import algokit_utils
+    from algosdk.v2client.algod import AlgodClient
+    from smart_contracts.artifacts.algo_rewards_contract import algo_rewards_contract_client as client_module
+
+    _register_app_returns(algod_client, json.loads(client_module._APP_SPEC_JSON))
+    algorand = algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("", server.url))
+    # Fake rounds are short enough for cached params to age out of the validity window
+    algorand.set_suggested_params_cache_timeout(0)
+    sender = algorand.account.random()
+    factory = client_module.AlgoRewardsContractFactory(
+        algorand=algorand, default_sender=sender.address
+    )
+    app_client = factory.get_app_client_by_id(app_id=algod_client._next_app_id)
+
+    # The fake does not execute TEAL, so skip simulate-based resource population
+    send_params = {
+        "populate_app_call_resources": False,
+        "cover_app_call_inner_transaction_fees": False,
+    }
+    return app_client, sender, send_params
+
+
+def bench_contract_client(count: int, concurrency: int, round_time: float, latency: float) -> List[Dict[str, Any]]:
+    """AlgoRewardsContractClient.send.* through algokit-utils over HTTP"""
+    from algokit_utils import AlgoAmount, CommonAppCallParams
+    from claim_registry import claim_box_name, send_claim
+    from session_registry import metadata_url_to_cid_bytes, session_box_name
+
+    algod_client = FakeAlgodClient(round_time=round_time, latency=latency)
+
+    results = []
+    with FakeAlgodServer(algod_client) as server:
+        app_client, sender, send_params = _contract_app_client(algod_client, server)
+        metadata_cid = metadata_url_to_cid_bytes(METADATA_URL)
+        # The creator claims for a new recipient each time (one claim per recipient)
+        recipients = [account.generate_account()[1] for _ in range(2 * count)]
+
+        def claim_params(recipient: str) -> CommonAppCallParams:
+            return CommonAppCallParams(
+                # Covers the inner badge mint
+                static_fee=AlgoAmount(micro_algo=2000),
+                box_references=[session_box_name(SESSION_ID), claim_box_name(SESSION_ID, recipient)],
+            )
+
+        calls = {
+            "send.create_session": lambda i: app_client.send.create_session(
+                args=(f"bench-{i}", SESSION_NAME, "Benchmark session", metadata_cid, 0, 0, 0),
+                send_params=send_params,
+            ),
+            "send.claim_badge": lambda i: app_client.send.claim_badge(
+                args=(SESSION_ID, recipients[i]),
+                params=claim_params(recipients[i]),
+                send_params=send_params,
+            ),
+            # The same claim through the build's precompiled encoders
+            "claim_registry.send_claim": lambda i: send_claim(app_client, SESSION_ID, recipients[count + i]),
+            # Readonly: simulated, not sent
+            "send.check_claim_status": lambda i: app_client.send.check_claim_status(
+                args=(SESSION_ID, sender.address),
+                send_params=send_params,
+            ),
+        }
+        for name, call in calls.items():
+            calls_before = algod_client.total_calls
+            run = _run_timed(call, count, concurrency)
+            results.append(_summarize(name, run, algod_client.total_calls - calls_before))
+    return results
+
+
+def run_suite(count: int = 200, concurrency: int = 16, round_time: float = 0.5, latency: float = 0.005):
+    """Run every benchmark and print a summary table"""
+    results = [
+        bench_mint_badge_nft(count, concurrency, round_time, latency),
+        *bench_metadata_hash(count * 100),
+        bench_metadata_upload(count, concurrency, latency),
+        bench_metadata_upload_batch(count, concurrency, latency),
+        bench_queue_recovery(count, round_time, latency),
+    ]
+    try:
+        results.extend(bench_contract_client(count, concurrency, round_time, latency))
+    except ImportError as e:
+        print(f"⚠️  Skipping contract client benchmarks: {e}")
+
+    print(f"📊 AlgoRewards minting benchmarks ({count} ops, {concurrency} concurrent, "
+          f"{round_time}s rounds, {latency * 1000:.0f}ms latency)")
+    print("=" * 92)
+    print(f"{'benchmark':<42}{'ops':>6}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'algod/op':>10}")
+    for r in results:
+        print(f"{r['benchmark']:<42}{r['ops']:>6}{r['ops_per_second']:>10.1f}"
+              f"{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['algod_calls_per_op']:>10.2f}")
+        for error in r["errors"]:
+            print(f"   ❌ {error}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AlgoRewards minting benchmarks")
+    parser.add_argument("suite", nargs="?", choices=["all", "modes", "groups"], default="all",
+                        help="'all' runs the minting path suite, 'modes' compares issuance modes, "
+                             "'groups' compares badges per claim group")
+    parser.add_argument("--count", type=int, default=200, help="operations per benchmark")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--attendees", type=int, default=500)
+    parser.add_argument("--round-time", type=float, default=0.5)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    if args.suite == "modes":
+        compare_badge_modes(args.attendees, args.round_time, args.latency)
+    elif args.suite == "groups":
+        compare_claim_groups(args.attendees, args.round_time, args.latency)
+    else:
+        run_suite(args.count, args.concurrency, args.round_time, args.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Pipelined Confirmation Tracker for AlgoRewards
+Resolves many pending transactions with one algod poll per round
+"""
+
+import base64
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+from algosdk.error import ConfirmationTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingTxn:
+    """Bookkeeping for a single tracked transaction"""
+
+    __slots__ = ("future", "expires_round", "fetch_info")
+
+    def __init__(self, future: Future, expires_round: int, fetch_info: bool):
+        self.future = future
+        self.expires_round = expires_round
+        self.fetch_info = fetch_info
+
+
+class ConfirmationTracker:
+    """
+    Shared confirmation tracker for submitted transactions
+
+    Instead of every caller running its own wait_for_confirmation loop, a
+    single background thread waits on status_after_block once per round,
+    fetches the txids of each new block and resolves every tracked
+    transaction found in it in one pass. Transactions that need their
+    confirmation details (e.g. a created asset ID) are read from the same
+    round's block, so the cost stays per round rather than per transaction.
+
+    A transaction may confirm before it is tracked, in a block the tracker
+    has already scanned. Callers pass the transaction's first valid round
+    and the tracker rescans the blocks from there.
+
+    algod errors are retried with exponential backoff from the last
+    scanned round, and tracked transactions stay pending meanwhile.
+    Only after `max_errors` consecutive failures is every pending future
+    failed.
+    """
+
+    def __init__(
+        self,
+        algod_client,
+        wait_rounds: int = 5,
+        on_round: Optional[Callable[[int], None]] = None,
+        max_errors: int = 8,
+        retry_backoff: float = 0.5,
+        max_retry_backoff: float = 10.0
+    ):
+        """
+        Initialize the tracker
+
+        Args:
+            algod_client: Algod client used for polling
+            wait_rounds: Rounds to wait before a transaction times out
+            on_round: Optional callable notified of each new round observed
+            max_errors: Consecutive algod failures before pending futures fail
+            retry_backoff: Delay before the first retry, doubled per failure
+            max_retry_backoff: Upper bound on the retry delay
+        """
+        self.algod_client = algod_client
+        self.wait_rounds = wait_rounds
+        self.on_round = on_round
+        self.max_errors = max_errors
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+
+        self._pending: Dict[str, _PendingTxn] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._last_round: Optional[int] = None
+        # Earliest already-scanned round a newly tracked transaction may be in
+        self._rescan_from: Optional[int] = None
+
+    def track(
+        self,
+        txid: str,
+        callback: Optional[Callable[[Future], None]] = None,
+        fetch_info: bool = False,
+        first_round: Optional[int] = None
+    ) -> Future:
+        """
+        Start tracking a submitted transaction
+
+        Args:
+            txid: Transaction ID returned by send_transaction
+            callback: Optional callable invoked with the future once resolved
+            fetch_info: Resolve with the confirmation details from the block
+                (e.g. 'asset-index') instead of just the round
+            first_round: The transaction's first valid round; blocks from
+                there on are scanned even if the tracker has passed them.
+                Without it, only blocks after the tracker's cursor are scanned
+
+        Returns:
+            Future resolving to a dict containing at least 'txid' and 'confirmed-round'
+        """
+        # Never hold the lock across an algod request
+        round_now = self._last_round
+        if round_now is None:
+            round_now = self.algod_client.status()['last-round']
+
+        with self._lock:
+            if self._last_round is None:
+                self._last_round = round_now
+            entry = self._pending.get(txid)
+            if entry is None:
+                entry = _PendingTxn(Future(), self._last_round + self.wait_rounds, fetch_info)
+                self._pending[txid] = entry
+            else:
+                entry.fetch_info = entry.fetch_info or fetch_info
+            if first_round is not None and first_round <= self._last_round:
+                self._rescan_from = min(first_round, self._rescan_from or first_round)
+            self._ensure_running()
+
+        if callback is not None:
+            entry.future.add_done_callback(callback)
+        self._wakeup.set()
+        return entry.future
+
+    def track_many(
+        self,
+        txids: List[str],
+        fetch_info: bool = False,
+        first_round: Optional[int] = None
+    ) -> List[Future]:
+        """Track several transactions at once, returning futures in order"""
+        return [self.track(txid, fetch_info=fetch_info, first_round=first_round) for txid in txids]
+
+    def wait(self, txid: str, fetch_info: bool = True, first_round: Optional[int] = None) -> Dict[str, Any]:
+        """Blocking drop-in replacement for transaction.wait_for_confirmation"""
+        return self.track(txid, fetch_info=fetch_info, first_round=first_round).result()
+
+    def close(self):
+        """Stop the background thread and fail anything still pending"""
+        with self._lock:
+            self._stopped = True
+            pending = list(self._pending.items())
+            self._pending.clear()
+            self._rescan_from = None
+        self._closed.set()
+        self._wakeup.set()
+
+        for txid, entry in pending:
+            if not entry.future.done():
+                entry.future.set_exception(
+                    RuntimeError(f"Confirmation tracker closed before {txid} confirmed")
+                )
+
+    @property
+    def pending_count(self) -> int:
+        """Number of transactions still awaiting confirmation"""
+        with self._lock:
+            return len(self._pending)
+
+    def _ensure_running(self):
+        """Start the polling thread if it is not already running"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._closed.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="confirmation-tracker", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        """Polling loop: one status_after_block call per round"""
+        errors = 0
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                if self._stopped:
+                    return
+                if not self._pending:
+                    # Idle: forget the cursor so we do not replay old blocks
+                    self._wakeup.clear()
+                    self._last_round = None
+                    self._rescan_from = None
+                    continue
+                last_round = self._last_round
+                rescan_from, self._rescan_from = self._rescan_from, None
+
+            try:
+                if last_round is None:
+                    last_round = self.algod_client.status()['last-round']
+                    with self._lock:
+                        self._last_round = last_round
+                if rescan_from is not None:
+                    # Catch up on blocks scanned before these transactions were tracked
+                    self._scan(rescan_from, last_round)
+                    rescan_from = None
+                status = self.algod_client.status_after_block(last_round)
+                new_round = status['last-round']
+                self._scan(last_round + 1, new_round, advance=True)
+                if self.on_round is not None:
+                    self.on_round(new_round)
+                self._expire(new_round)
+                errors = 0
+            except Exception as e:
+                if rescan_from is not None:
+                    with self._lock:
+                        self._rescan_from = min(rescan_from, self._rescan_from or rescan_from)
+                errors += 1
+                if errors >= self.max_errors:
+                    logger.error("Confirmation tracker giving up after %d algod errors: %s", errors, e)
+                    self._fail_all(e)
+                    errors = 0
+                    continue
+                delay = min(self.max_retry_backoff, self.retry_backoff * 2 ** (errors - 1))
+                logger.warning("Confirmation tracker algod error (retrying in %.1fs): %s", delay, e)
+                self._closed.wait(delay)
+
+    def _scan(self, first_round: int, last_round: int, advance: bool = False):
+        """Resolve tracked transactions in a range of blocks, one request per block"""
+        for round_number in range(first_round, last_round + 1):
+            block = self.algod_client.get_block_txids(round_number)
+            self._resolve_block(round_number, block.get('blockTxids') or [])
+            if advance:
+                # Advance per block so a retry resumes after the last one scanned
+                with self._lock:
+                    self._last_round = round_number
+
+    def _resolve_block(self, round_number: int, block_txids: List[str]):
+        """Resolve every tracked transaction included in a block"""
+        with self._lock:
+            found = [
+                (position, txid) for position, txid in enumerate(block_txids)
+                if txid in self._pending
+            ]
+            fetch_info = any(self._pending[txid].fetch_info for _, txid in found)
+        if not found:
+            return
+
+        # One block read covers the details of every transaction in it; block
+        # txids are listed in the same order as the block's transactions
+        block_txns = self.algod_client.block_info(round_number)['block'].get('txns', []) if fetch_info else []
+
+        with self._lock:
+            confirmed = [
+                (position, txid, self._pending.pop(txid))
+                for position, txid in found
+                if txid in self._pending
+            ]
+
+        for position, txid, entry in confirmed:
+            result = {'txid': txid, 'confirmed-round': round_number}
+            if entry.fetch_info:
+                result.update(_apply_data(block_txns[position]))
+            entry.future.set_result(result)
+
+    def _expire(self, current_round: int):
+        """Fail transactions whose wait window has passed"""
+        with self._lock:
+            expired = [
+                (txid, entry)
+                for txid, entry in self._pending.items()
+                if current_round > entry.expires_round
+            ]
+            for txid, _ in expired:
+                del self._pending[txid]
+
+        for txid, entry in expired:
+            # Last chance check in case the transaction landed in a block the
+            # tracker did not scan (e.g. confirmed before tracking started)
+            try:
+                info = self.algod_client.pending_transaction_info(txid)
+            except Exception as e:
+                entry.future.set_exception(e)
+                continue
+
+            if info.get('confirmed-round', 0) > 0:
+                entry.future.set_result(info if entry.fetch_info else {
+                    'txid': txid, 'confirmed-round': info['confirmed-round']
+                })
+            elif info.get('pool-error'):
+                entry.future.set_exception(
+                    Exception(f"Transaction {txid} rejected: {info['pool-error']}")
+                )
+            else:
+                entry.future.set_exception(ConfirmationTimeoutError(
+                    f"Transaction {txid} not confirmed after {self.wait_rounds} rounds"
+                ))
+
+    def _fail_all(self, error: Exception):
+        """Propagate a persistent algod failure to every pending future"""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._last_round = None
+            self._rescan_from = None
+
+        for entry in pending:
+            if not entry.future.done():
+                entry.future.set_exception(error)
+
+
+def _apply_data(block_txn: Dict[str, Any]) -> Dict[str, Any]:
+    """Confirmation details of a block transaction, under pending_transaction_info's names"""
+    info: Dict[str, Any] = {}
+    if block_txn.get('caid'):
+        info['asset-index'] = block_txn['caid']
+    if block_txn.get('apid'):
+        info['application-index'] = block_txn['apid']
+    logs = (block_txn.get('dt') or {}).get('lg')
+    if logs:
+        info['logs'] = [
+            log if isinstance(log, str) else base64.b64encode(log).decode() for log in logs
+        ]
+    return info
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Badge Delivery Pipeline for AlgoRewards
+Opt-in aware delivery of minted badges using grouped transfer + freeze/config
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from algosdk import transaction
+from algosdk.error import AlgodHTTPError
+from nft_minter import AlgoRewardsNFTMinter, MAX_GROUP_SIZE
+
+
+Delivery = Tuple[str, int]  # (recipient address, asset ID)
+
+
+class DeliveryPipeline:
+    """
+    Deliver minted badges to recipients in as few submissions as possible
+
+    Opt-in status for every recipient is checked up front with concurrent
+    lookups. Each opted-in recipient gets a bundle of transactions (the
+    creator's transfer plus optional freeze and clawback reconfiguration)
+    and bundles are packed into atomic groups of up to MAX_GROUP_SIZE.
+    Recipients who have not opted in yet are deferred to a retry queue
+    instead of failing. A failed lookup is retried and, if it keeps
+    failing, the recipient is deferred with the error rather than treated
+    as not opted in. Recipients already holding the badge are reported as
+    delivered and never sent it again. When a group is rejected, only the
+    bundles that cannot go through are dropped and the rest are repacked.
+    """
+
+    def __init__(
+        self,
+        minter: AlgoRewardsNFTMinter,
+        freeze_after_transfer: bool = False,
+        clear_clawback: bool = False,
+        max_workers: int = 16,
+        retry_delay: float = 30.0,
+        max_retries: int = 20,
+        lookup_retries: int = 3,
+        lookup_backoff: float = 0.5
+    ):
+        """
+        Initialize the pipeline
+
+        Args:
+            minter: Minter holding the creator account and shared clients
+            freeze_after_transfer: Freeze the badge in the recipient's
+                account so it cannot be transferred (soulbound)
+            clear_clawback: Remove the clawback address once delivered
+            max_workers: Concurrent opt-in lookups and group submissions
+            retry_delay: Seconds to wait before retrying a deferred recipient
+            max_retries: Deferrals allowed before a delivery is failed
+            lookup_retries: Retries of an opt-in lookup that fails with
+                anything other than a 404
+            lookup_backoff: Delay before the first lookup retry, doubled
+                on each further retry
+        """
+        self.minter = minter
+        self.freeze_after_transfer = freeze_after_transfer
+        self.clear_clawback = clear_clawback
+        self.max_workers = max_workers
+        self.retry_delay = retry_delay
+        self.max_retries = max_retries
+        self.lookup_retries = lookup_retries
+        self.lookup_backoff = lookup_backoff
+
+        # (recipient, asset_id) -> {"attempts": int, "next_attempt": float}
+        self.deferred: Dict[Delivery, Dict[str, Any]] = {}
+
+        # asset_id -> reserve address, kept when reconfiguring the asset
+        self._reserves: Dict[int, str] = {}
+
+    @property
+    def bundle_size(self) -> int:
+        """Transactions needed to deliver one badge"""
+        return 1 + int(self.freeze_after_transfer) + int(self.clear_clawback)
+
+    def check_opt_ins(self, deliveries: Iterable[Delivery]) -> Dict[Delivery, bool]:
+        """
+        Check whether each recipient has opted in to its badge asset
+
+        Args:
+            deliveries: (recipient, asset_id) pairs
+
+        Returns:
+            Mapping of each pair to True if the recipient can receive it
+
+        Raises:
+            The lookup error for any pair algod could not answer
+        """
+        holdings = self._lookup_holdings(deliveries)
+        for holding in holdings.values():
+            if isinstance(holding, Exception):
+                raise holding
+        return {delivery: holding is not None for delivery, holding in holdings.items()}
+
+    def _lookup_holdings(self, deliveries: Iterable[Delivery]) -> Dict[Delivery, Any]:
+        """Holding of each pair (see _holding), or the error its lookup failed with"""
+        def lookup(delivery: Delivery):
+            try:
+                return self._holding(*delivery)
+            except Exception as e:
+                return e
+
+        deliveries = list(dict.fromkeys(deliveries))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(deliveries, executor.map(lookup, deliveries)))
+
+    def deliver(self, deliveries: Iterable[Delivery]) -> Dict[str, Any]:
+        """
+        Deliver badges, deferring recipients that have not opted in
+
+        Args:
+            deliveries: (recipient, asset_id) pairs
+
+        Returns:
+            Report with 'delivered' and 'deferred' lists of pairs and a
+            'failed' mapping of pair to exception
+        """
+        report: Dict[str, Any] = {"delivered": [], "deferred": [], "failed": {}}
+        holdings = self._lookup_holdings(deliveries)
+
+        ready = []
+        for delivery, holding in holdings.items():
+            if isinstance(holding, Exception):
+                self._defer(delivery, report, error=holding)
+            elif holding is None:
+                self._defer(delivery, report)
+            elif holding > 0 or delivery[0] == self.minter.address:
+                # Already delivered, e.g. by a group whose confirmation timed out
+                self._delivered(delivery, report)
+            else:
+                ready.append(delivery)
+
+        if ready:
+            self._submit_bundles(ready, report)
+        return report
+
+    def retry_deferred(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Retry deferred deliveries whose retry time has come
+
+        Args:
+            force: Retry everything deferred regardless of its schedule
+        """
+        now = time.monotonic()
+        due = [
+            delivery for delivery, entry in self.deferred.items()
+            if force or entry["next_attempt"] <= now
+        ]
+        return self.deliver(due)
+
+    def _holding(self, recipient: str, asset_id: int) -> Optional[int]:
+        """
+        Amount of the asset the recipient holds, or None if not opted in
+
+        Only a 404 or a response without a holding means "not opted in".
+        Other errors are retried with backoff and then raised.
+        """
+        if recipient == self.minter.address:
+            return 0
+        for attempt in range(self.lookup_retries + 1):
+            try:
+                info = self.minter.algod_client.account_asset_info(recipient, asset_id)
+                holding = info.get("asset-holding")
+                return holding["amount"] if holding else None
+            except AlgodHTTPError as e:
+                if e.code == 404:
+                    return None
+                if attempt == self.lookup_retries:
+                    raise
+            except Exception:
+                if attempt == self.lookup_retries:
+                    raise
+            time.sleep(self.lookup_backoff * 2 ** attempt)
+
+    def _bundle(self, recipient: str, asset_id: int, params) -> List[transaction.Transaction]:
+        """Transactions delivering one badge: transfer, then optional config"""
+        txns = [self.minter._build_transfer_txn(asset_id, recipient, params)]
+        if self.freeze_after_transfer:
+            txns.append(transaction.AssetFreezeTxn(
+                sender=self.minter.address,
+                sp=params,
+                index=asset_id,
+                target=recipient,
+                new_freeze_state=True,
+            ))
+        if self.clear_clawback:
+            txns.append(transaction.AssetConfigTxn(
+                sender=self.minter.address,
+                sp=params,
+                index=asset_id,
+                manager=self.minter.address,
+                reserve=self._reserve(asset_id),
+                freeze=self.minter.address,
+                clawback="",
+                strict_empty_address_check=False,
+            ))
+        return txns
+
+    def _reserve(self, asset_id: int) -> str:
+        """Current reserve address of an asset (ARC-19 badges store their CID there)"""
+        if asset_id not in self._reserves:
+            params = self.minter.algod_client.asset_info(asset_id)["params"]
+            self._reserves[asset_id] = params.get("reserve") or self.minter.address
+        return self._reserves[asset_id]
+
+    def _submit_bundles(self, ready: List[Delivery], report: Dict[str, Any]):
+        """
+        Pack delivery bundles into atomic groups and submit them concurrently
+
+        A rejected group fails as a whole, so its recipients are looked up
+        again: those who opted out are deferred, those who got the badge
+        anyway are delivered, and the remaining bundles are repacked. A
+        group whose failure the lookups do not explain is split in half
+        until the failing bundle is alone and can be deferred.
+        """
+        per_group = max(1, MAX_GROUP_SIZE // self.bundle_size)
+
+        def pack(deliveries: List[Delivery]) -> List[List[Delivery]]:
+            return [deliveries[i:i + per_group] for i in range(0, len(deliveries), per_group)]
+
+        def submit(group: List[Delivery], params):
+            txns = [txn for recipient, asset_id in group
+                    for txn in self._bundle(recipient, asset_id, params)]
+            if len(txns) > 1:
+                transaction.assign_group_id(txns)
+            signed_txns = [txn.sign(self.minter.private_key) for txn in txns]
+            self.minter.algod_client.send_transactions(signed_txns)
+            return self.minter.confirmations.track(signed_txns[0].get_txid(), first_round=params.first)
+
+        groups = pack(ready)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while groups:
+                params = self.minter.params.get()
+                submissions = [(group, executor.submit(submit, group, params)) for group in groups]
+                groups, repack = [], []
+                for group, submission in submissions:
+                    try:
+                        submission.result().result()
+                    except Exception as e:
+                        survivors = self._triage(group, e, report)
+                        if len(survivors) < len(group):
+                            repack.extend(survivors)
+                        elif len(group) == 1:
+                            self._defer(group[0], report, error=e)
+                        else:
+                            half = len(group) // 2
+                            groups.extend([group[:half], group[half:]])
+                        continue
+                    for delivery in group:
+                        self._delivered(delivery, report)
+                groups.extend(pack(repack))
+
+    def _triage(self, group: List[Delivery], error: Exception, report: Dict[str, Any]) -> List[Delivery]:
+        """
+        Settle the deliveries of a rejected group that a fresh lookup explains
+
+        Returns:
+            The deliveries that are still ready to send
+        """
+        survivors = []
+        for delivery, holding in self._lookup_holdings(group).items():
+            if isinstance(holding, Exception):
+                self._defer(delivery, report, error=holding)
+            elif holding is None:
+                # Opted out between the check and the send
+                self._defer(delivery, report, error=error)
+            elif holding > 0:
+                self._delivered(delivery, report)
+            else:
+                survivors.append(delivery)
+        return survivors
+
+    def _delivered(self, delivery: Delivery, report: Dict[str, Any]):
+        """Record a delivery as done"""
+        self.deferred.pop(delivery, None)
+        report["delivered"].append(delivery)
+
+    def _defer(self, delivery: Delivery, report: Dict[str, Any], error: Optional[Exception] = None):
+        """Schedule a delivery for retry, or fail it after max_retries"""
+        entry = self.deferred.setdefault(delivery, {"attempts": 0, "next_attempt": 0.0})
+        entry["attempts"] += 1
+        if entry["attempts"] > self.max_retries:
+            del self.deferred[delivery]
+            report["failed"][delivery] = error or Exception(
+                f"{delivery[0]} did not opt in to asset {delivery[1]}"
+            )
+            return
+        entry["next_attempt"] = time.monotonic() + self.retry_delay * entry["attempts"]
+        report["deferred"].append(delivery)
@@ -13,6 +13,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from smart_contracts.algo_rewards_contract.production_contract import AlgoRewardsContract
+from attendance_merkle import AttendanceTree
 from algokit_utils import (
     ApplicationClient,
     ApplicationSpecification,
@@ -73,11 +74,13 @@ def deploy_session3_contract():
     )
     print(f"✅ Eligibility test: {result.return_value}")
     
-    # Test attendance verification
+    # Test attendance verification against a one-attendee roster
+    tree = AttendanceTree([account.address])
+    app_client.call(AlgoRewardsContract.set_attendance_root, root=tree.root)
     result = app_client.call(
         AlgoRewardsContract.verify_session3_attendance,
         attendee_address=account.address,
-        verification_code="SESSION3"
+        proof=tree.proof(account.address)
     )
     print(f"✅ Attendance verification: {result.return_value}")
     
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""
+In-process Fake Algod for AlgoRewards
+Local stand-in for algod used to exercise the minting paths without a network
+"""
+
+import base64
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+import msgpack
+from algosdk import transaction
+from algosdk.error import AlgodHTTPError
+
+
+class FakeAlgodClient:
+    """
+    Minimal in-memory algod implementing the calls used by the minters
+
+    Rounds advance on a wall-clock timer (`round_time`). Submitted
+    transactions are applied to the in-memory ledger immediately and show
+    up as confirmed in the next round. Every call sleeps for `latency`
+    seconds to model network round trips, and calls are counted per method
+    so callers can report algod requests per badge.
+    """
+
+    def __init__(
+        self,
+        round_time: float = 0.1,
+        latency: float = 0.0,
+        start_round: int = 1000,
+        min_fee: int = 1000
+    ):
+        """
+        Initialize the fake node
+
+        Args:
+            round_time: Seconds between blocks
+            latency: Seconds slept on every call to model a round trip
+            start_round: Round number the chain starts at
+            min_fee: Minimum fee reported by suggested_params()
+        """
+        self.algod_address = f"fake-algod://{id(self)}"
+        self.round_time = round_time
+        self.latency = latency
+        self.start_round = start_round
+        self.min_fee = min_fee
+        self.genesis_hash = "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI="
+        self.genesis_id = "fakenet-v1"
+
+        self.call_counts: Dict[str, int] = {}
+
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._next_asset_id = 1000000
+        self._blocks: Dict[int, List[str]] = {}
+        self._pool: List[str] = []
+        self._pool_round: Optional[int] = None
+        self._txns: Dict[str, Dict[str, Any]] = {}
+        self._assets: Dict[int, Dict[str, Any]] = {}
+        # address -> asset id -> {"amount": int, "is-frozen": bool}
+        self._holdings: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._next_app_id = 5000000
+
+        # ABI method selector -> log emitted by app calls to that method, so
+        # typed app clients can decode a return value without a real AVM
+        self.app_returns: Dict[bytes, bytes] = {}
+
+    # ------------------------------------------------------------------ #
+    # algod API
+    # ------------------------------------------------------------------ #
+
+    def status(self) -> Dict[str, Any]:
+        self._call("status")
+        return {"last-round": self._current_round()}
+
+    def status_after_block(self, block_num: int) -> Dict[str, Any]:
+        self._call("status_after_block")
+        target = block_num + 1
+        while self._current_round() < target:
+            time.sleep(self.round_time / 10)
+        return {"last-round": self._current_round()}
+
+    def suggested_params(self) -> transaction.SuggestedParams:
+        self._call("suggested_params")
+        first = self._current_round()
+        return transaction.SuggestedParams(
+            fee=0,
+            first=first,
+            last=first + 1000,
+            gh=self.genesis_hash,
+            gen=self.genesis_id,
+            flat_fee=False,
+            min_fee=self.min_fee,
+        )
+
+    def send_transaction(self, signed_txn) -> str:
+        self._call("send_transaction")
+        return self._submit([signed_txn])
+
+    def send_transactions(self, signed_txns) -> str:
+        self._call("send_transactions")
+        return self._submit(list(signed_txns))
+
+    def simulate_raw_transactions(self, signed_txns) -> Dict[str, Any]:
+        """Simulate a group without applying it: app calls log their registered return"""
+        self._call("simulate_raw_transactions")
+        results = []
+        for signed in signed_txns:
+            txn = signed.transaction
+            result: Dict[str, Any] = {"txn": {"txn": txn.dictify()}, "pool-error": ""}
+            if isinstance(txn, transaction.ApplicationCallTxn) and txn.app_args:
+                if txn.app_args[0] in self.app_returns:
+                    result["logs"] = [self.app_returns[txn.app_args[0]]]
+            results.append({"txn-result": result, "app-budget-consumed": 0})
+        return {
+            "version": 2,
+            "last-round": self._current_round(),
+            "txn-groups": [{"txn-results": results}],
+        }
+
+    def get_block_txids(self, block_num: int) -> Dict[str, Any]:
+        self._call("get_block_txids")
+        with self._lock:
+            self._seal_blocks()
+            if block_num > self._current_round():
+                raise AlgodHTTPError("failed to retrieve information from the ledger", 404)
+            return {"blockTxids": list(self._blocks.get(block_num, []))}
+
+    def block_info(self, block: Optional[int] = None, round_num: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+        """Block with each transaction's apply data (created IDs, logs), in block order"""
+        self._call("block_info")
+        block_num = block if block is not None else round_num
+        with self._lock:
+            self._seal_blocks()
+            if block_num > self._current_round():
+                raise AlgodHTTPError("failed to retrieve information from the ledger", 404)
+            txns = []
+            for txid in self._blocks.get(block_num, []):
+                info = self._txns[txid]
+                txn: Dict[str, Any] = {"txn": info["txn"]["txn"]}
+                if info.get("asset-index"):
+                    txn["caid"] = info["asset-index"]
+                if info.get("application-index"):
+                    txn["apid"] = info["application-index"]
+                if info.get("logs"):
+                    txn["dt"] = {"lg": list(info["logs"])}
+                txns.append(txn)
+            return {"block": {"rnd": block_num, "txns": txns}}
+
+    def pending_transaction_info(self, txid: str) -> Dict[str, Any]:
+        self._call("pending_transaction_info")
+        with self._lock:
+            self._seal_blocks()
+            info = self._txns.get(txid)
+            if info is None:
+                raise AlgodHTTPError("txn does not exist", 404)
+            return dict(info)
+
+    def account_info(self, address: str) -> Dict[str, Any]:
+        self._call("account_info")
+        with self._lock:
+            holdings = self._holdings.get(address, {})
+            return {
+                "address": address,
+                "assets": [
+                    {"asset-id": asset_id, **holding}
+                    for asset_id, holding in holdings.items()
+                ],
+                "created-assets": [
+                    {"index": asset_id, "params": dict(asset)}
+                    for asset_id, asset in self._assets.items()
+                    if asset["creator"] == address
+                ],
+            }
+
+    # algosdk exposes both names
+    account_information = account_info
+
+    def account_asset_info(self, address: str, asset_id: int) -> Dict[str, Any]:
+        self._call("account_asset_info")
+        with self._lock:
+            holding = self._holdings.get(address, {}).get(asset_id)
+            if holding is None:
+                raise AlgodHTTPError("account asset info not found", 404)
+            return {"asset-holding": {"asset-id": asset_id, **holding}, "round": self._current_round()}
+
+    def asset_info(self, asset_id: int) -> Dict[str, Any]:
+        self._call("asset_info")
+        with self._lock:
+            asset = self._assets.get(asset_id)
+            if asset is None:
+                raise AlgodHTTPError("asset does not exist", 404)
+            return {"index": asset_id, "params": dict(asset)}
+
+    # ------------------------------------------------------------------ #
+    # Helpers
+    # ------------------------------------------------------------------ #
+
+    @property
+    def total_calls(self) -> int:
+        """Total number of algod calls made so far"""
+        return sum(self.call_counts.values())
+
+    def reset_counts(self):
+        """Clear the per-method call counters"""
+        with self._lock:
+            self.call_counts.clear()
+
+    def _call(self, name: str):
+        """Count a call and sleep for the configured latency"""
+        with self._lock:
+            self.call_counts[name] = self.call_counts.get(name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _current_round(self) -> int:
+        elapsed = time.monotonic() - self._started_at
+        return self.start_round + int(elapsed / self.round_time)
+
+    def _seal_blocks(self):
+        """Move pooled transactions into the block after they were submitted"""
+        if self._pool and self._current_round() > self._pool_round:
+            confirmed_round = self._pool_round + 1
+            self._blocks.setdefault(confirmed_round, []).extend(self._pool)
+            for txid in self._pool:
+                self._txns[txid]["confirmed-round"] = confirmed_round
+            self._pool = []
+            self._pool_round = None
+
+    def _submit(self, signed_txns) -> str:
+        """Validate and apply a transaction group atomically"""
+        with self._lock:
+            self._seal_blocks()
+            round_now = self._current_round()
+            for signed in signed_txns:
+                txn = signed.transaction
+                if signed.get_txid() in self._txns:
+                    raise AlgodHTTPError(
+                        f"transaction already in ledger: {signed.get_txid()}", 400
+                    )
+                if not txn.first_valid_round <= round_now <= txn.last_valid_round:
+                    raise AlgodHTTPError(
+                        f"txn dead: round {round_now} outside of "
+                        f"{txn.first_valid_round}--{txn.last_valid_round}", 400
+                    )
+
+            # Stage touched entries so a failing transaction rejects the group
+            staged_holdings: Dict[tuple, Optional[Dict[str, Any]]] = {}
+            staged_assets: Dict[int, Dict[str, Any]] = {}
+            next_asset_id = self._next_asset_id
+
+            def holding(address, asset_id):
+                key = (address, asset_id)
+                if key not in staged_holdings:
+                    current = self._holdings.get(address, {}).get(asset_id)
+                    staged_holdings[key] = dict(current) if current else None
+                return staged_holdings[key]
+
+            def asset(asset_id):
+                return staged_assets.get(asset_id) or self._assets.get(asset_id)
+
+            results = []
+            for signed in signed_txns:
+                txn = signed.transaction
+                info: Dict[str, Any] = {"confirmed-round": 0, "pool-error": ""}
+                if isinstance(txn, transaction.AssetConfigTxn) and not txn.index:
+                    asset_id = next_asset_id
+                    next_asset_id += 1
+                    staged_assets[asset_id] = {
+                        "creator": txn.sender,
+                        "total": txn.total,
+                        "decimals": txn.decimals,
+                        "default-frozen": txn.default_frozen,
+                        "unit-name": txn.unit_name,
+                        "name": txn.asset_name,
+                        "url": txn.url,
+                        "metadata-hash": txn.metadata_hash,
+                        "manager": txn.manager,
+                        "reserve": txn.reserve,
+                        "freeze": txn.freeze,
+                        "clawback": txn.clawback,
+                    }
+                    staged_holdings[(txn.sender, asset_id)] = {
+                        "amount": txn.total, "is-frozen": False
+                    }
+                    info["asset-index"] = asset_id
+                elif isinstance(txn, transaction.AssetConfigTxn):
+                    params = asset(txn.index)
+                    if params is None or params["manager"] != txn.sender:
+                        raise AlgodHTTPError("this transaction should be issued by the manager", 400)
+                    staged_assets[txn.index] = dict(params, **{
+                        "manager": txn.manager,
+                        "reserve": txn.reserve,
+                        "freeze": txn.freeze,
+                        "clawback": txn.clawback,
+                    })
+                elif isinstance(txn, transaction.AssetTransferTxn):
+                    self._apply_transfer(txn, holding, asset, staged_holdings)
+                elif isinstance(txn, transaction.AssetFreezeTxn):
+                    target = holding(txn.target, txn.index)
+                    if target is None:
+                        raise AlgodHTTPError(
+                            f"asset {txn.index} missing from {txn.target}", 400
+                        )
+                    target["is-frozen"] = txn.new_freeze_state
+                elif isinstance(txn, transaction.ApplicationCallTxn):
+                    if not txn.index:
+                        info["application-index"] = self._next_app_id
+                        self._next_app_id += 1
+                    selector = txn.app_args[0] if txn.app_args else None
+                    if selector in self.app_returns:
+                        info["logs"] = [self.app_returns[selector]]
+                info["txn"] = {"txn": txn.dictify()}
+                results.append((signed.get_txid(), info))
+
+            # Commit the staged state
+            self._assets.update(staged_assets)
+            for (address, asset_id), staged in staged_holdings.items():
+                if staged is not None:
+                    self._holdings.setdefault(address, {})[asset_id] = staged
+            self._next_asset_id = next_asset_id
+            for txid, info in results:
+                self._txns[txid] = info
+                self._pool.append(txid)
+            self._pool_round = round_now
+            return results[0][0]
+
+    @staticmethod
+    def _apply_transfer(txn, holding, asset, staged_holdings):
+        """Apply an asset transfer (opt-in, send or clawback) to staged state"""
+        params = asset(txn.index)
+        if params is None:
+            raise AlgodHTTPError(f"asset {txn.index} does not exist", 400)
+
+        # Opt-in: zero amount transfer to self
+        if txn.receiver == txn.sender and txn.amount == 0 and not txn.revocation_target:
+            if holding(txn.sender, txn.index) is None:
+                staged_holdings[(txn.sender, txn.index)] = {
+                    "amount": 0, "is-frozen": params["default-frozen"]
+                }
+            return
+
+        source = txn.revocation_target or txn.sender
+        sender_holding = holding(source, txn.index)
+        receiver_holding = holding(txn.receiver, txn.index)
+        if sender_holding is None:
+            raise AlgodHTTPError(f"asset {txn.index} missing from {source}", 400)
+        if receiver_holding is None:
+            raise AlgodHTTPError(f"asset {txn.index} missing from {txn.receiver}", 400)
+        if sender_holding["amount"] < txn.amount:
+            raise AlgodHTTPError(
+                f"underflow on subtracting {txn.amount} from sender amount "
+                f"{sender_holding['amount']}", 400
+            )
+        if not txn.revocation_target and (
+            sender_holding["is-frozen"] or receiver_holding["is-frozen"]
+        ):
+            raise AlgodHTTPError(f"asset {txn.index} frozen", 400)
+
+        sender_holding["amount"] -= txn.amount
+        receiver_holding["amount"] += txn.amount
+
+
+class FakeIndexerClient:
+    """Read-only indexer view over a FakeAlgodClient ledger"""
+
+    def __init__(self, algod_client: FakeAlgodClient):
+        self.algod_client = algod_client
+
+    def lookup_account_asset_by_creator(
+        self,
+        creator: str,
+        limit: Optional[int] = None,
+        next_page: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Assets created by an account, paged by asset ID like the indexer"""
+        self.algod_client._call("indexer_created_assets")
+        after = int(next_page) if next_page else 0
+        with self.algod_client._lock:
+            assets = sorted(
+                (asset_id, params) for asset_id, params in self.algod_client._assets.items()
+                if params["creator"] == creator and asset_id > after
+            )
+        page = [{"index": asset_id, "params": dict(params)} for asset_id, params in assets[:limit]]
+        result = {"assets": page, "current-round": self.algod_client._current_round()}
+        if limit and len(assets) > limit:
+            result["next-token"] = str(page[-1]["index"])
+        return result
+
+
+def _jsonable(value):
+    """Convert bytes (recursively) to base64 strings, as algod's JSON API does"""
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Benchmarks open many connections at once; the default backlog of 5
+    # drops SYNs and shows up as one-second retransmit stalls
+    request_queue_size = 128
+
+
+class FakeAlgodServer:
+    """
+    HTTP front end for FakeAlgodClient
+
+    Serves the subset of the algod REST API used by algosdk and algokit-utils
+    (status, params, raw transaction submission, simulate, pending info) so
+    SDK clients such as the generated AlgoRewardsContractClient can run
+    against the fake ledger. App calls are not executed; sent or simulated,
+    they return whatever log is registered in `algod_client.app_returns` for
+    the called method selector.
+    """
+
+    def __init__(self, algod_client: FakeAlgodClient, host: str = "127.0.0.1", port: int = 0):
+        self.algod_client = algod_client
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+        self._httpd = _Server((host, port), Handler)
+        self._routes = [
+            ("GET", re.compile(r"^/v2/status$"), self._status),
+            ("GET", re.compile(r"^/v2/status/wait-for-block-after/(\d+)$"), self._wait_for_block),
+            ("GET", re.compile(r"^/v2/transactions/params$"), self._params),
+            ("GET", re.compile(r"^/v2/transactions/pending/(\w+)$"), self._pending),
+            ("POST", re.compile(r"^/v2/transactions$"), self._send_raw),
+            ("POST", re.compile(r"^/v2/transactions/simulate$"), self._simulate),
+        ]
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeAlgodServer":
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeAlgodServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _handle(self, request: BaseHTTPRequestHandler, method: str):
+        path = request.path.split("?", 1)[0]
+        length = int(request.headers.get("Content-Length", 0))
+        body = request.rfile.read(length) if length else b""
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                try:
+                    self._respond(request, 200, handler(body, *match.groups()))
+                except AlgodHTTPError as e:
+                    self._respond(request, e.code or 400, {"message": str(e)})
+                return
+        self._respond(request, 404, {"message": f"unknown route {path}"})
+
+    @staticmethod
+    def _respond(request: BaseHTTPRequestHandler, status: int, payload: Dict[str, Any]):
+        data = json.dumps(_jsonable(payload)).encode()
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
+
+    def _status(self, body: bytes) -> Dict[str, Any]:
+        return dict(self.algod_client.status(), **{"time-since-last-round": 0})
+
+    def _wait_for_block(self, body: bytes, round_number: str) -> Dict[str, Any]:
+        status = self.algod_client.status_after_block(int(round_number))
+        return dict(status, **{"time-since-last-round": 0})
+
+    def _params(self, body: bytes) -> Dict[str, Any]:
+        params = self.algod_client.suggested_params()
+        return {
+            "consensus-version": "future",
+            "fee": params.fee,
+            "genesis-hash": params.gh,
+            "genesis-id": params.gen,
+            "last-round": params.first,
+            "min-fee": params.min_fee,
+        }
+
+    def _pending(self, body: bytes, txid: str) -> Dict[str, Any]:
+        return self.algod_client.pending_transaction_info(txid)
+
+    def _send_raw(self, body: bytes) -> Dict[str, Any]:
+        unpacker = msgpack.Unpacker(raw=False)
+        unpacker.feed(body)
+        signed_txns = [transaction.SignedTransaction.undictify(obj) for obj in unpacker]
+        return {"txId": self.algod_client.send_transactions(signed_txns)}
+
+    def _simulate(self, body: bytes) -> Dict[str, Any]:
+        request = msgpack.unpackb(body, raw=False)
+        group = request["txn-groups"][0]
+        signed_txns = [transaction.SignedTransaction.undictify(obj) for obj in group["txns"]]
+        return self.algod_client.simulate_raw_transactions(signed_txns)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Precompiled Badge Metadata Templates for AlgoRewards
+Serializes a session's shared metadata once and splices in per-attendee fields
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from nft_minter import AlgoRewardsNFTMinter
+
+
+def _encode(value: Any) -> bytes:
+    """Encode one value exactly as compute_metadata_hash would inside the document"""
+    # Addresses and other plain ASCII words need no escaping; skip json.dumps
+    if isinstance(value, str) and value.isascii() and value.isalnum():
+        return b'"' + value.encode() + b'"'
+    return json.dumps(value, separators=(',', ':'), sort_keys=True).encode()
+
+
+class BadgeMetadataTemplate:
+    """
+    Canonical badge metadata for one session with the variable fields left open
+
+    Everything in AlgoRewardsNFTMinter.create_badge_metadata except the
+    recipient (and any per-attendee properties named in variable_properties)
+    is identical across a session. The template serializes the document once
+    with placeholders, keeps the bytes between them, and renders an attendee
+    by joining those segments with the encoded values. Key order under
+    sort_keys does not depend on values, so the output is byte-identical to
+    the slow path. Hashing resumes from a sha256 state over the shared prefix.
+    """
+
+    RECIPIENT = "recipient"
+
+    def __init__(
+        self,
+        session_name: str,
+        session_id: str,
+        custom_properties: Optional[Dict[str, Any]] = None,
+        variable_properties: Sequence[str] = (),
+        date_issued: Optional[str] = None
+    ):
+        """
+        Compile the template
+
+        Args:
+            session_name: Name of the learning session
+            session_id: Unique session identifier
+            custom_properties: Custom properties shared by every attendee
+            variable_properties: Custom property names that differ per
+                attendee (e.g. "badge_number")
+            date_issued: Issue date as YYYY-MM-DD (defaults to today)
+        """
+        self.session_name = session_name
+        self.session_id = session_id
+        self.custom_properties = dict(custom_properties or {})
+        self.variable_properties = tuple(variable_properties)
+        self.date_issued = date_issued or time.strftime("%Y-%m-%d")
+
+        placeholders = {
+            field: f"\x00{field}\x00"
+            for field in (self.RECIPIENT, *self.variable_properties)
+        }
+        metadata = AlgoRewardsNFTMinter.create_badge_metadata(
+            session_name,
+            session_id,
+            placeholders[self.RECIPIENT],
+            {**self.custom_properties, **{
+                field: placeholders[field] for field in self.variable_properties
+            }},
+            date_issued=self.date_issued,
+        )
+        self.segments, self.fields = self._split(_encode(metadata), placeholders)
+
+        self._prefix_hash = hashlib.sha256(self.segments[0])
+
+    @staticmethod
+    def _split(document: bytes, placeholders: Dict[str, str]) -> Tuple[List[bytes], List[str]]:
+        """Cut the serialized document at each placeholder, in document order"""
+        positions = []
+        for field, placeholder in placeholders.items():
+            encoded = _encode(placeholder)
+            start = document.find(encoded)
+            if start < 0 or document.find(encoded, start + 1) >= 0:
+                raise ValueError(f"Field '{field}' must appear exactly once in the metadata")
+            positions.append((start, start + len(encoded), field))
+        positions.sort()
+
+        segments, fields, offset = [], [], 0
+        for start, end, field in positions:
+            segments.append(document[offset:start])
+            fields.append(field)
+            offset = end
+        segments.append(document[offset:])
+        return segments, fields
+
+    def _values(self, recipient_address: str, properties: Optional[Dict[str, Any]]) -> List[bytes]:
+        values = {**(properties or {}), self.RECIPIENT: recipient_address}
+        try:
+            return [_encode(values[field]) for field in self.fields]
+        except KeyError as e:
+            raise ValueError(f"Missing variable property {e}") from None
+
+    def render(self, recipient_address: str, properties: Optional[Dict[str, Any]] = None) -> bytes:
+        """Canonical metadata JSON for one attendee"""
+        values = self._values(recipient_address, properties)
+        parts = [self.segments[0]]
+        for value, segment in zip(values, self.segments[1:]):
+            parts.append(value)
+            parts.append(segment)
+        return b"".join(parts)
+
+    def metadata_hash(self, recipient_address: str, properties: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        SHA-256 of the attendee's metadata, equal to compute_metadata_hash
+        of the create_badge_metadata document
+        """
+        digest = self._prefix_hash.copy()
+        if not properties and len(self.fields) == 1:
+            # Recipient-only template: prefix, address, suffix
+            digest.update(_encode(recipient_address))
+            digest.update(self.segments[1])
+            return digest.digest()
+        for value, segment in zip(self._values(recipient_address, properties), self.segments[1:]):
+            digest.update(value)
+            digest.update(segment)
+        return digest.digest()
+
+    def metadata(self, recipient_address: str, properties: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """The attendee's metadata as a dictionary (slow path, for uploads)"""
+        return json.loads(self.render(recipient_address, properties))
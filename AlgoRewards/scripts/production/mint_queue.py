@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+Persistent Mint Job Queue for AlgoRewards
+SQLite-backed, crash-safe queue of badge mint jobs that many workers can drain
+"""
+
+import base64
+import functools
+import json
+import os
+import sqlite3
+import sys
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+from algosdk import encoding
+from nft_minter import AlgoRewardsNFTMinter
+
+
+# Job states, in lifecycle order
+QUEUED = "queued"
+SUBMITTED = "submitted"
+CONFIRMED = "confirmed"
+TRANSFERRED = "transferred"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mint_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    session_name TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    metadata_url TEXT NOT NULL,
+    custom_properties TEXT,
+    state TEXT NOT NULL DEFAULT 'queued',
+    create_txn TEXT,
+    create_txid TEXT,
+    metadata_hash TEXT,
+    last_valid INTEGER,
+    asset_id INTEGER,
+    transfer_txn TEXT,
+    transfer_txid TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    available_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (session_id, recipient)
+);
+CREATE INDEX IF NOT EXISTS mint_jobs_claimable ON mint_jobs (state, lease_expires);
+"""
+
+
+class MintJobQueue:
+    """
+    Durable queue of badge mint jobs stored in SQLite (WAL mode)
+
+    Each signed transaction is written to the job row before it is sent, so
+    after a crash a worker can resend the exact same transaction (same txid)
+    or detect that it already confirmed, instead of minting twice or losing
+    track of which recipient owns which asset.
+    """
+
+    def __init__(self, path: str = "mint_jobs.db", lease_seconds: float = 60.0):
+        """
+        Open (and create if needed) the job database
+
+        Args:
+            path: SQLite database file shared by all workers
+            lease_seconds: How long a claimed job is reserved for one worker
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def enqueue(
+        self,
+        session_name: str,
+        session_id: str,
+        recipients: List[str],
+        metadata_url: str,
+        custom_properties: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Add mint jobs for a session (recipients already queued are skipped)
+
+        Returns:
+            Number of new jobs added
+        """
+        now = time.time()
+        properties = json.dumps(custom_properties) if custom_properties else None
+        with self._transaction():
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO mint_jobs "
+                "(session_id, session_name, recipient, metadata_url, custom_properties, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (session_id, session_name, recipient, metadata_url, properties, now, now)
+                    for recipient in recipients
+                ],
+            )
+            return self.conn.total_changes - before
+
+    def claim(self, worker_id: str, limit: int = 16) -> List[sqlite3.Row]:
+        """
+        Reserve up to `limit` unfinished jobs for a worker
+
+        Jobs whose lease has expired (their worker died) are claimable again.
+        Jobs released with a retry delay are skipped until it has passed.
+        """
+        now = time.time()
+        with self._transaction():
+            rows = self.conn.execute(
+                "SELECT id FROM mint_jobs WHERE state IN (?, ?, ?) "
+                "AND (lease_expires IS NULL OR lease_expires < ?) "
+                "AND (available_at IS NULL OR available_at <= ?) "
+                "ORDER BY id LIMIT ?",
+                (QUEUED, SUBMITTED, CONFIRMED, now, now, limit),
+            ).fetchall()
+            ids = [row["id"] for row in rows]
+            if not ids:
+                return []
+            placeholders = ",".join("?" * len(ids))
+            self.conn.execute(
+                f"UPDATE mint_jobs SET worker = ?, lease_expires = ?, "
+                f"attempts = attempts + 1 WHERE id IN ({placeholders})",
+                [worker_id, now + self.lease_seconds, *ids],
+            )
+            return self.conn.execute(
+                f"SELECT * FROM mint_jobs WHERE id IN ({placeholders}) ORDER BY id", ids
+            ).fetchall()
+
+    def update(self, job_id: int, **fields):
+        """Persist new field values for a job"""
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self.conn.execute(
+            f"UPDATE mint_jobs SET {assignments} WHERE id = ?",
+            [*fields.values(), job_id],
+        )
+
+    def release(self, job_id: int, delay: float = 0.0):
+        """
+        Give up the lease on a job so another worker can pick it up
+
+        Args:
+            job_id: Job to release
+            delay: Seconds before the job may be claimed again (retry backoff)
+        """
+        available_at = time.time() + delay if delay else None
+        self.update(job_id, worker=None, lease_expires=None, available_at=available_at)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs in each state"""
+        rows = self.conn.execute(
+            "SELECT state, COUNT(*) AS n FROM mint_jobs GROUP BY state"
+        ).fetchall()
+        return {row["state"]: row["n"] for row in rows}
+
+    def results(self, session_id: str) -> Dict[str, Any]:
+        """Mapping of recipient to asset ID (or error) for a session"""
+        rows = self.conn.execute(
+            "SELECT recipient, state, asset_id, error FROM mint_jobs WHERE session_id = ?",
+            (session_id,),
+        ).fetchall()
+        return {
+            row["recipient"]: row["asset_id"] if row["state"] == TRANSFERRED else row["error"]
+            for row in rows
+        }
+
+    def _transaction(self):
+        """BEGIN IMMEDIATE so concurrent claimers serialize on the write lock"""
+        return _ImmediateTransaction(self.conn)
+
+
+class _ImmediateTransaction:
+    """Context manager wrapping BEGIN IMMEDIATE / COMMIT / ROLLBACK"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+class MintQueueWorker:
+    """
+    Drains a MintJobQueue using an AlgoRewardsNFTMinter
+
+    Several worker processes can point at the same database file; each
+    claims a batch of jobs under a lease, submits all of them, and then
+    waits for the confirmations together through the minter's tracker.
+    """
+
+    def __init__(
+        self,
+        queue: MintJobQueue,
+        minter: AlgoRewardsNFTMinter,
+        worker_id: Optional[str] = None,
+        max_attempts: int = 5,
+        retry_backoff: float = 2.0,
+        max_retry_backoff: float = 300.0,
+        indexer_client=None,
+        page_size: int = 1000
+    ):
+        """
+        Args:
+            queue: Job queue to drain
+            minter: Minter that signs and sends the transactions
+            worker_id: Lease owner name (defaults to pid + random suffix)
+            max_attempts: Claims of one job before it is marked failed
+            retry_backoff: Delay before a failed job's first retry, doubled per attempt
+            max_retry_backoff: Upper bound on the retry delay
+            indexer_client: Optional indexer to page through the creator's
+                assets during recovery (algod's account response is capped)
+            page_size: Assets per indexer page
+        """
+        self.queue = queue
+        self.minter = minter
+        self.worker_id = worker_id or f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self.indexer_client = indexer_client
+        self.page_size = page_size
+
+    def run(self, batch_size: int = 16, stop_when_empty: bool = True, idle_sleep: float = 1.0):
+        """
+        Process jobs until the queue is empty (or forever)
+
+        Returns:
+            Number of jobs completed by this worker
+        """
+        completed = 0
+        while True:
+            jobs = self.queue.claim(self.worker_id, batch_size)
+            if not jobs:
+                if stop_when_empty:
+                    return completed
+                time.sleep(idle_sleep)
+                continue
+            completed += self.process_batch(jobs)
+
+    def process_batch(self, jobs: List[sqlite3.Row]) -> int:
+        """Advance a batch of claimed jobs as far as possible"""
+        params = self.minter.params.get()
+        # Validity is judged against the node's round; cached params can lag it
+        if any(job["state"] == SUBMITTED for job in jobs):
+            round_now = self.minter.algod_client.status()['last-round']
+        jobs_by_id = {job["id"]: job for job in jobs}
+        # Read the creator's assets at most once per pass, and only if a job needs them
+        created_assets = functools.lru_cache(maxsize=None)(self._created_assets)
+
+        # Phase 1: make sure every job has a confirmed asset
+        create_futures = {}
+        for job in jobs:
+            if job["attempts"] > self.max_attempts:
+                self.queue.update(job["id"], state=FAILED, error=job["error"] or "too many attempts")
+                continue
+            try:
+                if job["state"] == QUEUED:
+                    create_futures[job["id"]] = self._submit_create(job, params)
+                elif job["state"] == SUBMITTED:
+                    future = self._resume_create(job, round_now, created_assets)
+                    if future is not None:
+                        create_futures[job["id"]] = future
+            except Exception as e:
+                self._record_error(job, e)
+
+        asset_ids = {job["id"]: job["asset_id"] for job in jobs if job["state"] == CONFIRMED}
+        for job_id, future in create_futures.items():
+            try:
+                asset_id = future if isinstance(future, int) else future.result()['asset-index']
+                self.queue.update(job_id, state=CONFIRMED, asset_id=asset_id)
+                asset_ids[job_id] = asset_id
+            except Exception as e:
+                self.queue.update(job_id, state=SUBMITTED, error=str(e))
+                self.queue.release(job_id, self._retry_delay(jobs_by_id[job_id]))
+
+        # Phase 2: deliver confirmed assets to their recipients
+        transfer_futures = {}
+        for job_id, asset_id in asset_ids.items():
+            job = jobs_by_id[job_id]
+            try:
+                if job["recipient"] == self.minter.address:
+                    transfer_futures[job_id] = None
+                else:
+                    transfer_futures[job_id] = self._submit_transfer(job, asset_id, params)
+            except Exception as e:
+                self._record_error(job, e)
+
+        completed = 0
+        for job_id, future in transfer_futures.items():
+            try:
+                if future is not None:
+                    future.result()
+                self.queue.update(job_id, state=TRANSFERRED, error=None, lease_expires=None)
+                completed += 1
+            except Exception as e:
+                self.queue.update(job_id, transfer_txn=None, transfer_txid=None, error=str(e))
+                self.queue.release(job_id, self._retry_delay(jobs_by_id[job_id]))
+        return completed
+
+    def _submit_create(self, job: sqlite3.Row, params):
+        """Sign the asset creation, persist it, then send it"""
+        properties = json.loads(job["custom_properties"]) if job["custom_properties"] else None
+        metadata = self.minter.create_badge_metadata(
+            job["session_name"], job["session_id"], job["recipient"], properties
+        )
+        metadata_hash = self.minter.compute_metadata_hash(metadata)
+        txn = self.minter._build_badge_create_txn(params, job["metadata_url"], metadata_hash)
+        signed = txn.sign(self.minter.private_key)
+        txid = signed.get_txid()
+
+        # Persist before sending so a crash can always find this transaction
+        self.queue.update(
+            job["id"],
+            state=SUBMITTED,
+            create_txn=encoding.msgpack_encode(signed),
+            create_txid=txid,
+            metadata_hash=metadata_hash.hex(),
+            last_valid=params.last,
+        )
+        self.minter.algod_client.send_transaction(signed)
+        return self.minter.confirmations.track(txid, fetch_info=True, first_round=params.first)
+
+    def _resume_create(self, job: sqlite3.Row, round_now: int, created_assets):
+        """
+        Recover a job whose creation was sent before a crash
+
+        algod forgets confirmed transactions after a while, so a missing
+        txid does not mean the asset was never created. The creator's
+        assets are searched by metadata hash before anything is resent.
+
+        Args:
+            job: The SUBMITTED job
+            round_now: The node's last round
+            created_assets: Callable returning the creator's assets as
+                {metadata hash hex: asset ID}, shared by the recovery pass
+
+        Returns:
+            The asset ID if already confirmed, a future if the original
+            transaction was resent, or None if the job was requeued
+        """
+        info = self._pending_info(job["create_txid"])
+        if info and info.get('confirmed-round', 0) > 0:
+            return info['asset-index']
+
+        asset_id = created_assets().get(job["metadata_hash"])
+        if asset_id is not None:
+            return asset_id
+
+        if round_now <= job["last_valid"]:
+            # Still valid: resending the stored transaction is idempotent. If it
+            # confirmed after the lookup, the tracker finds it by rescanning
+            # the blocks from its first valid round
+            self._resend(job["create_txn"])
+            return self.minter.confirmations.track(
+                job["create_txid"], fetch_info=True, first_round=_first_valid(job["create_txn"])
+            )
+
+        # The transaction expired without confirming: start over
+        self.queue.update(job["id"], state=QUEUED, create_txn=None, create_txid=None)
+        self.queue.release(job["id"])
+        return None
+
+    def _submit_transfer(self, job: sqlite3.Row, asset_id: int, params):
+        """Send (or resend) the transfer of a confirmed badge"""
+        if job["transfer_txn"]:
+            info = self._pending_info(job["transfer_txid"])
+            if info and info.get('confirmed-round', 0) > 0:
+                return None
+            if self._recipient_holds(job["recipient"], asset_id):
+                return None
+            self._resend(job["transfer_txn"])
+            return self.minter.confirmations.track(
+                job["transfer_txid"], first_round=_first_valid(job["transfer_txn"])
+            )
+
+        txn = self.minter._build_transfer_txn(asset_id, job["recipient"], params)
+        signed = txn.sign(self.minter.private_key)
+        txid = signed.get_txid()
+        self.queue.update(
+            job["id"], transfer_txn=encoding.msgpack_encode(signed), transfer_txid=txid
+        )
+        self.minter.algod_client.send_transaction(signed)
+        return self.minter.confirmations.track(txid, first_round=params.first)
+
+    def _resend(self, encoded_txn: str):
+        """Resend a stored signed transaction, ignoring duplicate errors"""
+        try:
+            self.minter.algod_client.send_transaction(encoding.msgpack_decode(encoded_txn))
+        except Exception as e:
+            if "already in ledger" not in str(e):
+                raise
+
+    def _pending_info(self, txid: Optional[str]) -> Optional[Dict[str, Any]]:
+        """pending_transaction_info, or None if algod no longer knows the txid"""
+        if not txid:
+            return None
+        try:
+            return self.minter.algod_client.pending_transaction_info(txid)
+        except Exception:
+            return None
+
+    def _created_assets(self) -> Dict[str, int]:
+        """
+        The creator's assets keyed by metadata hash (hex)
+
+        Paged through the indexer when one is configured, otherwise read
+        from algod's account response in one request.
+        """
+        if self.indexer_client is None:
+            assets = self.minter.algod_client.account_info(self.minter.address).get('created-assets', [])
+        else:
+            assets, next_page = [], None
+            while True:
+                page = self.indexer_client.lookup_account_asset_by_creator(
+                    self.minter.address, limit=self.page_size, next_page=next_page
+                )
+                assets.extend(page.get('assets', []))
+                next_page = page.get('next-token')
+                if not next_page or not page.get('assets'):
+                    break
+
+        by_hash = {}
+        for asset in assets:
+            asset_hash = asset['params'].get('metadata-hash')
+            if isinstance(asset_hash, bytes):
+                asset_hash = asset_hash.hex()
+            elif isinstance(asset_hash, str):
+                asset_hash = base64.b64decode(asset_hash).hex()
+            if asset_hash:
+                by_hash[asset_hash] = asset['index']
+        return by_hash
+
+    def _recipient_holds(self, recipient: str, asset_id: int) -> bool:
+        """Whether the recipient already holds the badge"""
+        account_info = self.minter.algod_client.account_info(recipient)
+        return any(
+            asset['asset-id'] == asset_id and asset['amount'] > 0
+            for asset in account_info.get('assets', [])
+        )
+
+    def _retry_delay(self, job: sqlite3.Row) -> float:
+        """Exponential backoff by the number of times the job has been claimed"""
+        return min(self.max_retry_backoff, self.retry_backoff * 2 ** max(0, job["attempts"] - 1))
+
+    def _record_error(self, job: sqlite3.Row, error: Exception):
+        """Store an error and let the job be retried after a backoff"""
+        self.queue.update(job["id"], error=str(error))
+        self.queue.release(job["id"], self._retry_delay(job))
+
+
+def _first_valid(encoded_txn: str) -> int:
+    """First valid round of a stored signed transaction"""
+    return encoding.msgpack_decode(encoded_txn).transaction.first_valid_round
+
+
+def main():
+    """Drain the queue: python mint_queue.py [db_path]"""
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "mint_jobs.db"
+    queue = MintJobQueue(db_path)
+    try:
+        minter = AlgoRewardsNFTMinter()
+        worker = MintQueueWorker(queue, minter)
+        completed = worker.run()
+        print(f"✅ Worker {worker.worker_id} completed {completed} jobs")
+        print(f"   Queue state: {queue.counts()}")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,33 +8,63 @@ import os
 import json
 import hashlib
 import time
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Union
 from algosdk import transaction, account, mnemonic
 from algokit_utils import AlgorandClient
+from confirmation_tracker import ConfirmationTracker
+from params_cache import get_params_provider
+
+
+# Maximum number of transactions allowed in a single atomic group
+MAX_GROUP_SIZE = 16
+
+# Minimum balance (microAlgos) an account locks for every asset it holds
+ASSET_MIN_BALANCE = 100_000
 
 
 class AlgoRewardsNFTMinter:
     """Production-ready NFT minter for AlgoRewards badges"""
     
-    def __init__(self):
-        """Initialize the NFT minter with Algorand client"""
-        self.algorand = AlgorandClient.from_environment()
-        self.algod_client = self.algorand.algod_client
+    def __init__(self, algod_client=None, private_key: Optional[str] = None):
+        """
+        Initialize the NFT minter with Algorand client
+        
+        Args:
+            algod_client: Optional algod client (defaults to the environment)
+            private_key: Optional creator key (defaults to DEPLOYER_MNEMONIC)
+        """
+        if algod_client is None:
+            self.algorand = AlgorandClient.from_environment()
+            algod_client = self.algorand.algod_client
+        else:
+            self.algorand = None
+        self.algod_client = algod_client
         
         # Load deployer account
-        deployer_mnemonic = os.getenv('DEPLOYER_MNEMONIC')
-        if not deployer_mnemonic:
-            raise ValueError("DEPLOYER_MNEMONIC not set in environment")
+        if private_key is None:
+            deployer_mnemonic = os.getenv('DEPLOYER_MNEMONIC')
+            if not deployer_mnemonic:
+                raise ValueError("DEPLOYER_MNEMONIC not set in environment")
+            private_key = mnemonic.to_private_key(deployer_mnemonic)
         
-        self.private_key = mnemonic.to_private_key(deployer_mnemonic)
+        self.private_key = private_key
         self.address = account.address_from_private_key(self.private_key)
+        
+        # Shared params cache and tracker so concurrent mints poll algod
+        # once per round instead of once per transaction
+        self.params = get_params_provider(self.algod_client)
+        self.confirmations = ConfirmationTracker(
+            self.algod_client, wait_rounds=5, on_round=self.params.observe_round
+        )
     
+    @staticmethod
     def create_badge_metadata(
-        self, 
         session_name: str, 
         session_id: str,
         recipient_address: str,
-        custom_properties: Optional[Dict[str, Any]] = None
+        custom_properties: Optional[Dict[str, Any]] = None,
+        date_issued: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Create ARC-3 compliant metadata for badge NFT
@@ -44,10 +74,12 @@ class AlgoRewardsNFTMinter:
             session_id: Unique session identifier
             recipient_address: Badge recipient's address
             custom_properties: Optional custom properties
+            date_issued: Issue date as YYYY-MM-DD (defaults to today)
             
         Returns:
             ARC-3 compliant metadata dictionary
         """
+        date_issued = date_issued or time.strftime("%Y-%m-%d")
         base_metadata = {
             "name": f"AlgoRewards Badge - {session_name}",
             "description": f"Proof of attendance for '{session_name}' learning session. This badge certifies successful completion of educational milestones in the Algorand ecosystem.",
@@ -62,7 +94,7 @@ class AlgoRewardsNFTMinter:
                 "session": session_name,
                 "session_id": session_id,
                 "recipient": recipient_address,
-                "date_issued": time.strftime("%Y-%m-%d"),
+                "date_issued": date_issued,
                 "network": "Algorand",
                 "standard": "ARC-3",
                 "traits": [
@@ -76,7 +108,7 @@ class AlgoRewardsNFTMinter:
                     },
                     {
                         "trait_type": "Date",
-                        "value": time.strftime("%Y-%m-%d")
+                        "value": date_issued
                     },
                     {
                         "trait_type": "Platform",
@@ -92,7 +124,8 @@ class AlgoRewardsNFTMinter:
         
         return base_metadata
     
-    def compute_metadata_hash(self, metadata: Dict[str, Any]) -> bytes:
+    @staticmethod
+    def compute_metadata_hash(metadata: Dict[str, Any]) -> bytes:
         """
         Compute ARC-19 compliant metadata hash
         
@@ -111,7 +144,8 @@ class AlgoRewardsNFTMinter:
         session_id: str, 
         recipient_address: str,
         metadata_url: str,
-        custom_properties: Optional[Dict[str, Any]] = None
+        custom_properties: Optional[Dict[str, Any]] = None,
+        reserve: Optional[str] = None
     ) -> int:
         """
         Mint a badge NFT for session completion
@@ -120,8 +154,10 @@ class AlgoRewardsNFTMinter:
             session_name: Name of the learning session
             session_id: Unique session identifier
             recipient_address: Address to receive the badge
-            metadata_url: IPFS URL for metadata JSON
+            metadata_url: IPFS URL for metadata JSON, or an ARC-19
+                template-ipfs:// URL when reserve encodes the CID
             custom_properties: Optional custom metadata properties
+            reserve: Optional ARC-19 reserve address (defaults to creator)
             
         Returns:
             Asset ID of the created NFT
@@ -132,39 +168,18 @@ class AlgoRewardsNFTMinter:
         )
         metadata_hash = self.compute_metadata_hash(metadata)
         
-        # NFT parameters
-        asset_name = f"AlgoRewards Badge"  # Keep it simple for wallet display
-        unit_name = "ARBADGE"
-        total = 1
-        decimals = 0
-        default_frozen = False  # Allow transfers
-        
         # Get transaction parameters
-        params = self.algod_client.suggested_params()
+        params = self.params.get()
         
         # Create asset creation transaction
-        txn = transaction.AssetCreateTxn(
-            sender=self.address,
-            sp=params,
-            total=total,
-            decimals=decimals,
-            default_frozen=default_frozen,
-            manager=self.address,
-            reserve=self.address,
-            freeze=self.address,
-            clawback=self.address,
-            unit_name=unit_name,
-            asset_name=asset_name,
-            url=metadata_url,
-            metadata_hash=metadata_hash
-        )
+        txn = self._build_badge_create_txn(params, metadata_url, metadata_hash, reserve=reserve)
         
         # Sign and send transaction
         signed_txn = txn.sign(self.private_key)
         txid = self.algod_client.send_transaction(signed_txn)
         
         # Wait for confirmation
-        result = transaction.wait_for_confirmation(self.algod_client, txid, 5)
+        result = self.confirmations.wait(txid, first_round=params.first)
         asset_id = result['asset-index']
         
         # Transfer to recipient if different from creator
@@ -173,33 +188,330 @@ class AlgoRewardsNFTMinter:
         
         return asset_id
     
-    def _transfer_nft_to_recipient(self, asset_id: int, recipient_address: str):
+    def mint_badges_batch(
+        self,
+        recipients: List[str],
+        session_name: str,
+        session_id: str,
+        metadata_url: str,
+        custom_properties: Optional[Dict[str, Any]] = None,
+        max_workers: int = 8,
+        transfer: bool = True
+    ) -> Dict[str, Union[int, Exception]]:
+        """
+        Mint badge NFTs for many recipients using atomic groups
+        
+        Asset creations are packed into groups of up to MAX_GROUP_SIZE
+        transactions and the groups are submitted concurrently. One set of
+        suggested params is shared by every transaction in the batch.
+        
+        Args:
+            recipients: Addresses to receive a badge (duplicates are ignored)
+            session_name: Name of the learning session
+            session_id: Unique session identifier
+            metadata_url: IPFS URL for metadata JSON
+            custom_properties: Optional custom metadata properties
+            max_workers: Maximum number of groups in flight at once
+            transfer: Send each badge to its recipient after creation; pass
+                False to hand delivery to a DeliveryPipeline instead
+            
+        Returns:
+            Mapping of recipient address to asset ID, or to the exception
+            raised while minting or transferring that recipient's badge
+        """
+        from metadata_template import BadgeMetadataTemplate
+        
+        recipients = list(dict.fromkeys(recipients))
+        results: Dict[str, Union[int, Exception]] = {}
+        if not recipients:
+            return results
+        
+        params = self.params.get()
+        template = BadgeMetadataTemplate(session_name, session_id, custom_properties)
+        
+        # Build one asset creation transaction per recipient
+        pending = []
+        for recipient in recipients:
+            metadata_hash = template.metadata_hash(recipient)
+            txn = self._build_badge_create_txn(params, metadata_url, metadata_hash)
+            pending.append((recipient, txn))
+        
+        groups = [
+            pending[i:i + MAX_GROUP_SIZE]
+            for i in range(0, len(pending), MAX_GROUP_SIZE)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Create all assets, one atomic group per chunk
+            for group_result in executor.map(self._submit_create_group, groups):
+                results.update(group_result)
+            if not transfer:
+                return results
+            
+            # Transfer each badge individually so one recipient that has not
+            # opted in does not reject the rest of the group
+            transfers = [
+                (asset_id, recipient)
+                for recipient, asset_id in results.items()
+                if isinstance(asset_id, int) and recipient != self.address
+            ]
+            transfer_errors = executor.map(
+                lambda item: self._try_transfer(item[0], item[1], params),
+                transfers
+            )
+            for (_, recipient), error in zip(transfers, transfer_errors):
+                if error is not None:
+                    results[recipient] = error
+        
+        return results
+    
+    def _build_badge_create_txn(
+        self,
+        params: transaction.SuggestedParams,
+        metadata_url: str,
+        metadata_hash: bytes,
+        total: int = 1,
+        reserve: Optional[str] = None
+    ) -> transaction.AssetCreateTxn:
+        """
+        Build the asset creation transaction for a badge NFT
+        
+        Args:
+            params: Suggested transaction parameters
+            metadata_url: IPFS URL for metadata JSON
+            metadata_hash: ARC-19 metadata hash
+            total: Number of units (1 per badge, or the edition size)
+            reserve: ARC-19 reserve address encoding the metadata CID
+                (defaults to the creator)
+            
+        Returns:
+            Unsigned asset creation transaction
+        """
+        return transaction.AssetCreateTxn(
+            sender=self.address,
+            sp=params,
+            total=total,
+            decimals=0,
+            default_frozen=False,  # Allow transfers
+            manager=self.address,
+            reserve=reserve or self.address,
+            freeze=self.address,
+            clawback=self.address,
+            unit_name="ARBADGE",
+            asset_name="AlgoRewards Badge",  # Keep it simple for wallet display
+            url=metadata_url,
+            metadata_hash=metadata_hash
+        )
+    
+    def create_session_edition(
+        self,
+        session_name: str,
+        session_id: str,
+        expected_attendees: int,
+        metadata_url: str,
+        custom_properties: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Create a single multi-edition badge ASA for a whole session
+        
+        Args:
+            session_name: Name of the learning session
+            session_id: Unique session identifier
+            expected_attendees: Number of units to create (edition size)
+            metadata_url: IPFS URL for the session-level metadata JSON
+            custom_properties: Optional custom metadata properties
+            
+        Returns:
+            Asset ID of the edition ASA
+        """
+        metadata = self.create_badge_metadata(
+            session_name, session_id, self.address, custom_properties
+        )
+        del metadata["properties"]["recipient"]
+        metadata["properties"]["edition_size"] = expected_attendees
+        metadata_hash = self.compute_metadata_hash(metadata)
+        
+        params = self.params.get()
+        txn = self._build_badge_create_txn(
+            params, metadata_url, metadata_hash, total=expected_attendees
+        )
+        txid = self.algod_client.send_transaction(txn.sign(self.private_key))
+        return self.confirmations.wait(txid, first_round=params.first)['asset-index']
+    
+    def create_edition_records(
+        self,
+        recipients: List[str],
+        session_name: str,
+        session_id: str,
+        asset_id: int,
+        custom_properties: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Build the off-chain per-recipient metadata for an edition badge
+        
+        Args:
+            recipients: Badge recipients, in edition order
+            session_name: Name of the learning session
+            session_id: Unique session identifier
+            asset_id: Asset ID of the edition ASA
+            custom_properties: Optional custom metadata properties
+            
+        Returns:
+            Mapping of recipient address to their metadata record
+        """
+        records = {}
+        for edition, recipient in enumerate(dict.fromkeys(recipients), start=1):
+            metadata = self.create_badge_metadata(
+                session_name, session_id, recipient, custom_properties
+            )
+            metadata["properties"]["asset_id"] = asset_id
+            metadata["properties"]["edition"] = edition
+            records[recipient] = metadata
+        return records
+    
+    def mint_badges_edition(
+        self,
+        recipients: List[str],
+        session_name: str,
+        session_id: str,
+        metadata_url: str,
+        custom_properties: Optional[Dict[str, Any]] = None,
+        expected_attendees: Optional[int] = None,
+        pipeline=None
+    ) -> Dict[str, Any]:
+        """
+        Issue badges in edition mode: one ASA per session, one unit per attendee
+        
+        Costs one asset creation and one asset's min-balance for the whole
+        session instead of one of each per attendee. Units are handed out
+        through a DeliveryPipeline (grouped transfers, deferring recipients
+        who have not opted in yet).
+        
+        Args:
+            recipients: Addresses to receive a badge
+            session_name: Name of the learning session
+            session_id: Unique session identifier
+            metadata_url: IPFS URL for the session-level metadata JSON
+            custom_properties: Optional custom metadata properties
+            expected_attendees: Edition size (defaults to len(recipients))
+            pipeline: Optional DeliveryPipeline to deliver units with
+            
+        Returns:
+            Dict with 'asset_id', per-recipient 'editions' metadata records
+            (to be stored off-chain) and the 'delivery' report
+        """
+        from delivery_pipeline import DeliveryPipeline
+        
+        recipients = list(dict.fromkeys(recipients))
+        asset_id = self.create_session_edition(
+            session_name,
+            session_id,
+            expected_attendees or len(recipients),
+            metadata_url,
+            custom_properties
+        )
+        editions = self.create_edition_records(
+            recipients, session_name, session_id, asset_id, custom_properties
+        )
+        
+        pipeline = pipeline or DeliveryPipeline(self)
+        delivery = pipeline.deliver((recipient, asset_id) for recipient in recipients)
+        
+        return {
+            "asset_id": asset_id,
+            "editions": editions,
+            "delivery": delivery,
+        }
+    
+    def _submit_create_group(self, group) -> Dict[str, Union[int, Exception]]:
+        """
+        Sign, send and confirm one atomic group of asset creations
+        
+        Args:
+            group: List of (recipient, unsigned AssetCreateTxn) pairs
+            
+        Returns:
+            Mapping of recipient address to asset ID or exception
+        """
+        recipients = [recipient for recipient, _ in group]
+        txns = [txn for _, txn in group]
+        try:
+            if len(txns) > 1:
+                transaction.assign_group_id(txns)
+            signed_txns = [txn.sign(self.private_key) for txn in txns]
+            self.algod_client.send_transactions(signed_txns)
+            
+            # The whole group confirms in one round, so the tracker reads
+            # every created asset ID from a single block
+            futures = self.confirmations.track_many(
+                [signed.get_txid() for signed in signed_txns],
+                fetch_info=True,
+                first_round=txns[0].first_valid_round
+            )
+            
+            return {
+                recipient: future.result()['asset-index']
+                for recipient, future in zip(recipients, futures)
+            }
+        except Exception as e:
+            return {recipient: e for recipient in recipients}
+    
+    def _try_transfer(
+        self,
+        asset_id: int,
+        recipient_address: str,
+        params: transaction.SuggestedParams
+    ) -> Optional[Exception]:
+        """Transfer a badge, returning the exception instead of raising it"""
+        try:
+            self._transfer_nft_to_recipient(asset_id, recipient_address, params)
+        except Exception as e:
+            return e
+        return None
+    
+    def _transfer_nft_to_recipient(
+        self,
+        asset_id: int,
+        recipient_address: str,
+        params: Optional[transaction.SuggestedParams] = None
+    ):
         """
         Transfer NFT to recipient (requires recipient to opt-in first)
         
         Args:
             asset_id: Asset ID of the NFT
             recipient_address: Recipient's address
+            params: Optional suggested params to reuse (fetched if omitted)
         """
         # Note: In production, recipient should opt-in first
         # This is a simplified version
-        params = self.algod_client.suggested_params()
+        if params is None:
+            params = self.params.get()
         
         # Create transfer transaction
-        transfer_txn = transaction.AssetTransferTxn(
-            sender=self.address,
-            sp=params,
-            receiver=recipient_address,
-            amt=1,
-            index=asset_id
-        )
+        transfer_txn = self._build_transfer_txn(asset_id, recipient_address, params)
         
         # Sign and send
         signed_txn = transfer_txn.sign(self.private_key)
         txid = self.algod_client.send_transaction(signed_txn)
         
         # Wait for confirmation
-        transaction.wait_for_confirmation(self.algod_client, txid, 5)
+        self.confirmations.track(txid, first_round=params.first).result()
+    
+    def _build_transfer_txn(
+        self,
+        asset_id: int,
+        recipient_address: str,
+        params: transaction.SuggestedParams
+    ) -> transaction.AssetTransferTxn:
+        """Build the transfer of a single badge unit from the creator"""
+        return transaction.AssetTransferTxn(
+            sender=self.address,
+            sp=params,
+            receiver=recipient_address,
+            amt=1,
+            index=asset_id
+        )
 
 
 def main():
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Suggested Params Cache for AlgoRewards
+Shares one suggested_params() result across minters and session tools
+"""
+
+import asyncio
+import copy
+import threading
+import time
+from typing import Any, Dict, Optional
+from algosdk import transaction
+
+
+# Average Algorand block time, used to estimate round progress between polls
+DEFAULT_ROUND_TIME = 2.8
+
+
+class SuggestedParamsProvider:
+    """
+    Thread-safe cache for algod suggested transaction parameters
+
+    The cached params are reused until the chain has advanced more than
+    `window_rounds` past the round they were fetched at. Round progress is
+    taken from observe_round() when a caller knows the latest round (for
+    example the confirmation tracker), and estimated from wall-clock time
+    otherwise.
+    """
+
+    def __init__(
+        self,
+        algod_client,
+        window_rounds: int = 10,
+        round_time: float = DEFAULT_ROUND_TIME
+    ):
+        """
+        Initialize the provider
+
+        Args:
+            algod_client: Algod client used to fetch fresh params
+            window_rounds: Rounds a cached result stays valid for
+            round_time: Seconds per round used for time-based estimates
+        """
+        self.algod_client = algod_client
+        self.window_rounds = window_rounds
+        self.round_time = round_time
+
+        self._lock = threading.Lock()
+        self._params: Optional[transaction.SuggestedParams] = None
+        self._fetched_round = 0
+        self._fetched_at = 0.0
+        self._observed_round = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.fee_changes = 0
+
+    def get(self) -> transaction.SuggestedParams:
+        """
+        Return suggested params, refreshing them from algod only if stale
+
+        Returns:
+            A copy of the cached SuggestedParams (safe for callers to mutate)
+        """
+        with self._lock:
+            if self._is_fresh():
+                self.hits += 1
+                return copy.copy(self._params)
+
+            self.misses += 1
+            self._refresh()
+            return copy.copy(self._params)
+
+    async def aget(self) -> transaction.SuggestedParams:
+        """Asyncio variant of get(); algod is only called off-loop on a miss"""
+        with self._lock:
+            if self._is_fresh():
+                self.hits += 1
+                return copy.copy(self._params)
+        return await asyncio.to_thread(self.get)
+
+    def observe_round(self, round_number: int):
+        """Record the latest known round so staleness does not rely on timing"""
+        with self._lock:
+            if round_number > self._observed_round:
+                self._observed_round = round_number
+
+    def invalidate(self):
+        """Drop the cached params, e.g. after a 'fee too small' rejection"""
+        with self._lock:
+            self._params = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current hit rate"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "fee_changes": self.fee_changes,
+                "hit_rate": self.hits / total if total else 0.0,
+                "cached_round": self._fetched_round,
+            }
+
+    def _estimated_round(self) -> int:
+        """Best estimate of the current round without calling algod"""
+        elapsed_rounds = int((time.monotonic() - self._fetched_at) / self.round_time)
+        return max(self._observed_round, self._fetched_round + elapsed_rounds)
+
+    def _is_fresh(self) -> bool:
+        """Whether the cached params are still within the round window"""
+        if self._params is None:
+            return False
+        return self._estimated_round() - self._fetched_round < self.window_rounds
+
+    def _refresh(self):
+        """Fetch new params from algod (caller must hold the lock)"""
+        params = self.algod_client.suggested_params()
+        if self._params is not None and (
+            params.fee != self._params.fee or params.min_fee != self._params.min_fee
+        ):
+            self.fee_changes += 1
+
+        self._params = params
+        self._fetched_round = params.first
+        self._fetched_at = time.monotonic()
+        self._observed_round = max(self._observed_round, params.first)
+
+
+_providers: Dict[str, SuggestedParamsProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_params_provider(algod_client, **kwargs) -> SuggestedParamsProvider:
+    """
+    Get the process-wide params provider for an algod endpoint
+
+    Args:
+        algod_client: Algod client for the target network
+        **kwargs: Options passed to SuggestedParamsProvider on first creation
+
+    Returns:
+        Shared SuggestedParamsProvider for the client's algod address
+    """
+    key = getattr(algod_client, "algod_address", None) or str(id(algod_client))
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            provider = SuggestedParamsProvider(algod_client, **kwargs)
+            _providers[key] = provider
+        return provider
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Roster Metadata Streaming for AlgoRewards
+Streams an attendee roster (CSV or JSONL) into canonical badge metadata and hashes
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from metadata_template import BadgeMetadataTemplate
+
+
+# Roster columns with a fixed meaning; every other column becomes a custom property
+ADDRESS_FIELD = "address"
+NAME_FIELD = "name"
+
+Attendee = Tuple[str, Dict[str, Any]]  # (address, custom properties)
+
+
+class BadgeDocument(NamedTuple):
+    """One attendee's badge metadata, serialized exactly as it is hashed"""
+    recipient: str
+    document: bytes
+    metadata_hash: bytes
+
+
+def read_roster(path: str) -> Iterator[Attendee]:
+    """
+    Stream attendees from a CSV (with a header row) or JSONL roster
+
+    Each row needs an 'address'. A 'name' is stored as the attendee_name
+    property; any other columns are added as custom properties, as is an
+    'attributes' object (a JSON object string in a CSV column).
+
+    Yields:
+        (address, custom properties) per attendee, in file order
+    """
+    is_jsonl = path.endswith((".jsonl", ".ndjson"))
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = (json.loads(line) for line in f if line.strip()) if is_jsonl else csv.DictReader(f)
+        for line_number, row in enumerate(rows, start=1):
+            row = dict(row)
+            address = (row.pop(ADDRESS_FIELD, None) or "").strip()
+            if not address:
+                raise ValueError(f"{path}: row {line_number} has no {ADDRESS_FIELD}")
+
+            properties = row.pop("attributes", None) or {}
+            if isinstance(properties, str):
+                try:
+                    properties = json.loads(properties)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}: row {line_number} attributes are not valid JSON: {e}") from None
+            if not isinstance(properties, dict):
+                raise ValueError(f"{path}: row {line_number} attributes must be a JSON object")
+            name = row.pop(NAME_FIELD, None)
+            if name:
+                properties["attendee_name"] = name
+            properties.update({key: value for key, value in row.items() if value not in (None, "")})
+            yield address, properties
+
+
+def build_badge_documents(
+    session_name: str,
+    session_id: str,
+    attendees: List[Attendee]
+) -> List[BadgeDocument]:
+    """
+    Build, serialize and hash metadata for a chunk of attendees
+
+    The serialization is the one compute_metadata_hash uses, so
+    metadata_hash matches what the minter puts on chain. Attendees with
+    the same property names share one compiled template.
+    """
+    templates: Dict[Tuple[str, ...], BadgeMetadataTemplate] = {}
+    documents = []
+    for address, properties in attendees:
+        names = tuple(sorted(properties))
+        template = templates.get(names)
+        if template is None:
+            template = templates[names] = BadgeMetadataTemplate(
+                session_name, session_id, variable_properties=names
+            )
+        document = template.render(address, properties)
+        documents.append(BadgeDocument(address, document, hashlib.sha256(document).digest()))
+    return documents
+
+
+def stream_session_metadata(
+    roster_path: str,
+    session_name: str,
+    session_id: str,
+    processes: Optional[int] = None,
+    chunk_size: int = 500
+) -> Iterator[BadgeDocument]:
+    """
+    Stream badge documents for every attendee in a roster, in roster order
+
+    The roster is read lazily in chunks and at most two chunks per worker
+    are in flight, so memory stays constant however large the roster is.
+
+    Args:
+        roster_path: CSV or JSONL roster file
+        session_name: Name of the learning session
+        session_id: Unique session identifier
+        processes: Worker processes for serialization and hashing
+            (defaults to the CPU count; 0 builds documents in this process)
+        chunk_size: Attendees handed to a worker at a time
+
+    Yields:
+        BadgeDocument per attendee
+    """
+    attendees = read_roster(roster_path)
+    chunks = iter(lambda: list(islice(attendees, chunk_size)), [])
+
+    if processes == 0:
+        for chunk in chunks:
+            yield from build_badge_documents(session_name, session_id, chunk)
+        return
+
+    processes = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(executor.submit(build_badge_documents, session_name, session_id, chunk))
+            if len(in_flight) >= 2 * processes:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate badge metadata for a session roster")
+    parser.add_argument("roster", help="CSV or JSONL roster with an 'address' column")
+    parser.add_argument("--session-name", required=True)
+    parser.add_argument("--session-id", required=True)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--out", help="JSONL output file (defaults to stdout)")
+    args = parser.parse_args()
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    count = 0
+    try:
+        for badge in stream_session_metadata(
+            args.roster, args.session_name, args.session_id, processes=args.processes
+        ):
+            # Splice the document in as-is rather than re-encoding it
+            out.write(
+                f'{{"recipient": {json.dumps(badge.recipient)}, '
+                f'"metadata_hash": "{badge.metadata_hash.hex()}", '
+                f'"metadata": {badge.document.decode()}}}\n'
+            )
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"✅ Generated metadata for {count} attendees", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import asyncio
+import threading
+
+from algosdk import account
+
+from async_minter import AsyncAlgoRewardsNFTMinter
+from fake_algod import FakeAlgodClient
+
+METADATA_URL = "ipfs://bafkreihddthm5xr6n5fhtyg3kv4vd2wwfhewgm4j3qamynwc4f4k7tiwoa"
+
+
+class ThreadRecordingAlgodClient(FakeAlgodClient):
+    """Records the thread of every status() call"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.status_threads = []
+
+    def status(self):
+        self.status_threads.append(threading.current_thread())
+        return super().status()
+
+
+def test_claims_never_query_algod_on_the_event_loop() -> None:
+    algod_client = ThreadRecordingAlgodClient(round_time=0.02, latency=0.005)
+    private_key, address = account.generate_account()
+
+    async def mint():
+        async with AsyncAlgoRewardsNFTMinter(algod_client, private_key, max_workers=4) as minter:
+            futures = [
+                await minter.submit_claim("Session", f"s{i}", address, METADATA_URL)
+                for i in range(8)
+            ]
+            asset_ids = await asyncio.gather(*futures)
+        minter.confirmations.close()
+        return asset_ids
+
+    loop_thread = threading.current_thread()
+    asset_ids = asyncio.run(mint())
+
+    assert len(set(asset_ids)) == 8
+    assert algod_client.status_threads
+    assert loop_thread not in algod_client.status_threads
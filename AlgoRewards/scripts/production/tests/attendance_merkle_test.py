@@ -0,0 +1,43 @@
+import pytest
+from algosdk import account
+
+from attendance_merkle import AttendanceTree, leaf_hash, verify_proof
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13])
+def test_every_attendee_proof_verifies(size) -> None:
+    addresses = [account.generate_account()[1] for _ in range(size)]
+    tree = AttendanceTree(addresses)
+
+    assert len(tree) == size
+    for address in addresses:
+        assert verify_proof(tree.root, address, tree.proof(address))
+
+
+def test_single_attendee_root_is_its_leaf() -> None:
+    address = account.generate_account()[1]
+    assert AttendanceTree([address]).root == leaf_hash(address)
+
+
+def test_proof_rejects_other_addresses() -> None:
+    addresses = [account.generate_account()[1] for _ in range(6)]
+    tree = AttendanceTree(addresses)
+    outsider = account.generate_account()[1]
+
+    assert not verify_proof(tree.root, outsider, tree.proof(addresses[0]))
+    assert not verify_proof(tree.root, addresses[1], tree.proof(addresses[0]))
+
+
+def test_duplicates_are_ignored_and_tree_finalizes() -> None:
+    addresses = [account.generate_account()[1] for _ in range(3)]
+    tree = AttendanceTree(addresses + addresses[:1])
+
+    assert len(tree) == 3
+    assert tree.root == AttendanceTree(addresses).root
+    with pytest.raises(RuntimeError):
+        tree.add(account.generate_account()[1])
+
+
+def test_empty_tree_has_no_root() -> None:
+    with pytest.raises(ValueError):
+        AttendanceTree().root
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+from algosdk import account, transaction
+from algosdk.error import AlgodHTTPError
+
+from confirmation_tracker import ConfirmationTracker
+from fake_algod import FakeAlgodClient
+
+
+class FlakyAlgodClient(FakeAlgodClient):
+    """Fails the next `failures` status_after_block calls"""
+
+    failures = 0
+
+    def status_after_block(self, block_num: int):
+        if self.failures:
+            self.failures -= 1
+            raise AlgodHTTPError("connection reset", 503)
+        return super().status_after_block(block_num)
+
+
+@pytest.fixture()
+def algod_client():
+    return FlakyAlgodClient(round_time=0.05)
+
+
+def submit_asset(algod_client):
+    """Send an asset creation, returning (txid, first valid round)"""
+    private_key, address = account.generate_account()
+    txn = transaction.AssetConfigTxn(
+        sender=address,
+        sp=algod_client.suggested_params(),
+        total=1,
+        decimals=0,
+        default_frozen=False,
+        unit_name="BADGE",
+        asset_name="Badge",
+        strict_empty_address_check=False,
+    )
+    return algod_client.send_transaction(txn.sign(private_key)), txn.first_valid_round
+
+
+def test_transient_errors_keep_transactions_pending(algod_client) -> None:
+    tracker = ConfirmationTracker(algod_client, retry_backoff=0.01)
+    algod_client.failures = 3
+    try:
+        txid, _ = submit_asset(algod_client)
+        info = tracker.track(txid, fetch_info=True).result(timeout=2)
+    finally:
+        tracker.close()
+
+    assert algod_client.failures == 0
+    assert info["confirmed-round"] > 0
+    assert info["asset-index"] > 0
+
+
+def test_persistent_errors_fail_pending_futures(algod_client) -> None:
+    tracker = ConfirmationTracker(algod_client, max_errors=3, retry_backoff=0.01)
+    algod_client.failures = 3
+    try:
+        future = tracker.track(submit_asset(algod_client)[0])
+        with pytest.raises(AlgodHTTPError):
+            future.result(timeout=2)
+    finally:
+        tracker.close()
+
+
+def test_transaction_confirmed_before_tracking(algod_client) -> None:
+    tracker = ConfirmationTracker(algod_client, wait_rounds=1000)
+    try:
+        # Start the cursor, then let a transaction confirm in blocks it has already passed
+        tracker.track(submit_asset(algod_client)[0]).result(timeout=1)
+        txid, first_round = submit_asset(algod_client)
+        time.sleep(algod_client.round_time * 3)
+        algod_client.reset_counts()
+        result = tracker.track(txid, fetch_info=True, first_round=first_round).result(timeout=1)
+    finally:
+        tracker.close()
+
+    assert result["confirmed-round"] == algod_client.pending_transaction_info(txid)["confirmed-round"]
+    assert result["asset-index"] > 0
+    assert algod_client.call_counts.get("pending_transaction_info", 0) == 1  # the assertion above
+
+
+def test_fetch_info_costs_one_block_read_per_round(algod_client) -> None:
+    tracker = ConfirmationTracker(algod_client)
+    try:
+        submitted = [submit_asset(algod_client) for _ in range(6)]
+        algod_client.reset_counts()
+        results = [future.result(timeout=2) for future in tracker.track_many(
+            [txid for txid, _ in submitted], fetch_info=True, first_round=submitted[0][1]
+        )]
+    finally:
+        tracker.close()
+
+    assert len({result["asset-index"] for result in results}) == 6
+    assert "pending_transaction_info" not in algod_client.call_counts
+    assert algod_client.call_counts["block_info"] <= algod_client.call_counts["get_block_txids"]
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The production scripts are run from their own directory, not installed
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
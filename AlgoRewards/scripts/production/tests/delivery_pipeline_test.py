@@ -0,0 +1,96 @@
+import pytest
+from algosdk import account, transaction
+from algosdk.error import AlgodHTTPError
+
+from delivery_pipeline import DeliveryPipeline
+from fake_algod import FakeAlgodClient
+from nft_minter import AlgoRewardsNFTMinter
+
+METADATA_URL = "ipfs://bafkreihddthm5xr6n5fhtyg3kv4vd2wwfhewgm4j3qamynwc4f4k7tiwoa"
+
+
+class FlakyAlgodClient(FakeAlgodClient):
+    """Fails the next `failures` account_asset_info calls with a 503"""
+
+    failures = 0
+
+    def account_asset_info(self, address, asset_id):
+        if self.failures:
+            self.failures -= 1
+            raise AlgodHTTPError("service unavailable", 503)
+        return super().account_asset_info(address, asset_id)
+
+
+@pytest.fixture()
+def minter():
+    minter = AlgoRewardsNFTMinter(FlakyAlgodClient(round_time=0.02), account.generate_account()[0])
+    yield minter
+    minter.confirmations.close()
+
+
+def opted_in_recipient(minter, asset_id) -> str:
+    private_key, address = account.generate_account()
+    txn = transaction.AssetOptInTxn(address, minter.params.get(), asset_id)
+    minter.confirmations.wait(minter.algod_client.send_transaction(txn.sign(private_key)))
+    return address
+
+
+def test_lookup_errors_are_retried(minter) -> None:
+    asset_id = minter.create_session_edition("Session", "s", 2, METADATA_URL)
+    recipient = opted_in_recipient(minter, asset_id)
+    pipeline = DeliveryPipeline(minter, lookup_backoff=0)
+
+    minter.algod_client.failures = 2
+    assert pipeline.check_opt_ins([(recipient, asset_id)]) == {(recipient, asset_id): True}
+
+    # A 404 is a definite "not opted in"
+    stranger = account.generate_account()[1]
+    assert pipeline.check_opt_ins([(stranger, asset_id)]) == {(stranger, asset_id): False}
+
+
+def test_persistent_lookup_error_is_not_read_as_opted_out(minter) -> None:
+    asset_id = minter.create_session_edition("Session", "s", 2, METADATA_URL)
+    recipient = opted_in_recipient(minter, asset_id)
+    pipeline = DeliveryPipeline(minter, lookup_retries=1, lookup_backoff=0)
+
+    minter.algod_client.failures = 2
+    with pytest.raises(AlgodHTTPError):
+        pipeline.check_opt_ins([(recipient, asset_id)])
+
+    minter.algod_client.failures = 2
+    report = pipeline.deliver([(recipient, asset_id)])
+    assert report["deferred"] == [(recipient, asset_id)]
+
+    # Once algod answers again the badge goes out
+    report = pipeline.retry_deferred(force=True)
+    assert report["delivered"] == [(recipient, asset_id)]
+
+
+def test_recipient_holding_the_badge_is_not_sent_another(minter) -> None:
+    asset_id = minter.create_session_edition("Session", "s", 2, METADATA_URL)
+    recipient = opted_in_recipient(minter, asset_id)
+    # A previous group confirmed although its confirmation timed out
+    minter._transfer_nft_to_recipient(asset_id, recipient)
+    pipeline = DeliveryPipeline(minter)
+
+    report = pipeline.deliver([(recipient, asset_id)])
+    assert report["delivered"] == [(recipient, asset_id)]
+    holding = minter.algod_client.account_asset_info(recipient, asset_id)["asset-holding"]
+    assert holding["amount"] == 1
+
+
+def test_one_rejected_bundle_does_not_hold_back_its_group(minter) -> None:
+    asset_id = minter.create_session_edition("Session", "s", 8, METADATA_URL)
+    recipients = [opted_in_recipient(minter, asset_id) for _ in range(8)]
+    # Freezing one recipient's holding makes its transfer, and so its group, fail
+    freeze = transaction.AssetFreezeTxn(
+        minter.address, minter.params.get(), asset_id, recipients[3], True
+    )
+    minter.confirmations.wait(minter.algod_client.send_transaction(freeze.sign(minter.private_key)))
+    pipeline = DeliveryPipeline(minter)
+
+    report = pipeline.deliver([(recipient, asset_id) for recipient in recipients])
+    assert report["deferred"] == [(recipients[3], asset_id)]
+    assert sorted(report["delivered"]) == sorted(
+        (recipient, asset_id) for recipient in recipients if recipient != recipients[3]
+    )
@@ -0,0 +1,43 @@
+import pytest
+from algosdk import account
+
+from metadata_template import BadgeMetadataTemplate
+from nft_minter import AlgoRewardsNFTMinter
+
+
+def slow_hash(session_name, session_id, recipient, properties=None) -> bytes:
+    metadata = AlgoRewardsNFTMinter.create_badge_metadata(
+        session_name, session_id, recipient, properties, date_issued="2024-05-01"
+    )
+    return AlgoRewardsNFTMinter.compute_metadata_hash(metadata)
+
+
+def test_template_hash_matches_compute_metadata_hash() -> None:
+    template = BadgeMetadataTemplate("Algorand 101", "algo-101", date_issued="2024-05-01")
+    for _ in range(3):
+        recipient = account.generate_account()[1]
+        assert template.metadata_hash(recipient) == slow_hash("Algorand 101", "algo-101", recipient)
+        assert template.metadata(recipient) == AlgoRewardsNFTMinter.create_badge_metadata(
+            "Algorand 101", "algo-101", recipient, date_issued="2024-05-01"
+        )
+
+
+def test_template_hash_with_shared_and_variable_properties() -> None:
+    template = BadgeMetadataTemplate(
+        "Café \"Smart\" Contracts",
+        "sc-1",
+        custom_properties={"level": "advanced"},
+        variable_properties=("badge_number", "attendee_name"),
+        date_issued="2024-05-01",
+    )
+    recipient = account.generate_account()[1]
+    attendee = {"badge_number": 7, "attendee_name": "Zoë"}
+
+    expected = slow_hash("Café \"Smart\" Contracts", "sc-1", recipient, {"level": "advanced", **attendee})
+    assert template.metadata_hash(recipient, attendee) == expected
+
+
+def test_template_requires_every_variable_property() -> None:
+    template = BadgeMetadataTemplate("Session", "s", variable_properties=("badge_number",))
+    with pytest.raises(ValueError):
+        template.metadata_hash(account.generate_account()[1])
@@ -0,0 +1,94 @@
+import time
+
+import pytest
+from algosdk import account
+
+from fake_algod import FakeAlgodClient, FakeIndexerClient
+from mint_queue import CONFIRMED, SUBMITTED, MintJobQueue, MintQueueWorker
+from nft_minter import AlgoRewardsNFTMinter
+
+METADATA_URL = "ipfs://bafkreihddthm5xr6n5fhtyg3kv4vd2wwfhewgm4j3qamynwc4f4k7tiwoa"
+
+
+@pytest.fixture()
+def queue(tmp_path):
+    queue = MintJobQueue(str(tmp_path / "jobs.db"))
+    yield queue
+    queue.close()
+
+
+@pytest.fixture()
+def worker(queue):
+    algod_client = FakeAlgodClient(round_time=0.02)
+    minter = AlgoRewardsNFTMinter(algod_client, account.generate_account()[0])
+    yield MintQueueWorker(queue, minter)
+    minter.confirmations.close()
+
+
+def created_assets(worker) -> int:
+    return len(worker.minter.algod_client.account_info(worker.minter.address)["created-assets"])
+
+
+def test_released_job_waits_out_its_delay(queue) -> None:
+    queue.enqueue("Session", "s", ["recipient"], METADATA_URL)
+    job, = queue.claim("w1")
+    queue.release(job["id"], delay=0.2)
+    assert queue.claim("w2") == []
+    time.sleep(0.25)
+    assert [row["id"] for row in queue.claim("w2")] == [job["id"]]
+
+
+def test_resume_finds_asset_algod_has_forgotten(queue, worker) -> None:
+    queue.enqueue("Session", "s", [account.generate_account()[1]], METADATA_URL)
+    job, = queue.claim(worker.worker_id)
+    asset_id = worker._submit_create(job, worker.minter.params.get()).result()["asset-index"]
+
+    # A restarted worker finds the job SUBMITTED, and algod no longer knows the txid
+    job, = queue.conn.execute("SELECT * FROM mint_jobs").fetchall()
+    assert job["state"] == SUBMITTED
+    worker.minter.algod_client._txns.pop(job["create_txid"])
+
+    round_now = worker.minter.algod_client.status()["last-round"]
+    assert worker._resume_create(job, round_now, worker._created_assets) == asset_id
+    assert created_assets(worker) == 1
+
+
+def test_recovery_pages_created_assets_once_per_pass(queue, worker) -> None:
+    algod_client = worker.minter.algod_client
+    worker.indexer_client = FakeIndexerClient(algod_client)
+    worker.page_size = 2
+    queue.enqueue("Session", "s", [account.generate_account()[1] for _ in range(5)], METADATA_URL)
+    jobs = queue.claim(worker.worker_id, limit=5)
+    params = worker.minter.params.get()
+    asset_ids = {job["id"]: worker._submit_create(job, params).result()["asset-index"] for job in jobs}
+
+    # After a restart algod has forgotten every creation
+    jobs = queue.conn.execute("SELECT * FROM mint_jobs").fetchall()
+    for job in jobs:
+        algod_client._txns.pop(job["create_txid"])
+    created = worker._created_assets()
+    round_now = algod_client.status()["last-round"]
+    assert {job["id"]: worker._resume_create(job, round_now, lambda: created) for job in jobs} == asset_ids
+    assert algod_client.call_counts["indexer_created_assets"] == 3
+    assert "account_info" not in algod_client.call_counts
+
+
+def test_process_batch_resumes_with_the_node_round(queue, worker) -> None:
+    queue.enqueue("Session", "s", [worker.minter.address], METADATA_URL)
+    job, = queue.claim(worker.worker_id)
+    worker._submit_create(job, worker.minter.params.get()).result()
+    queue.release(job["id"])
+
+    assert worker.process_batch(queue.claim(worker.worker_id)) == 1
+    assert created_assets(worker) == 1
+    assert queue.counts() == {"transferred": 1}
+
+
+def test_failed_transfer_backs_off(queue, worker) -> None:
+    # The recipient never opted in, so the transfer is rejected
+    queue.enqueue("Session", "s", [account.generate_account()[1]], METADATA_URL)
+    assert worker.process_batch(queue.claim(worker.worker_id)) == 0
+    job, = queue.conn.execute("SELECT * FROM mint_jobs").fetchall()
+    assert job["state"] == CONFIRMED
+    assert job["available_at"] > time.time()
+    assert queue.claim(worker.worker_id) == []
@@ -0,0 +1,28 @@
+from algosdk import account
+
+from fake_algod import FakeAlgodClient
+from metadata_template import BadgeMetadataTemplate
+from nft_minter import MAX_GROUP_SIZE, AlgoRewardsNFTMinter
+
+METADATA_URL = "ipfs://bafkreihddthm5xr6n5fhtyg3kv4vd2wwfhewgm4j3qamynwc4f4k7tiwoa"
+
+
+def test_batch_maps_each_recipient_to_its_own_asset() -> None:
+    algod_client = FakeAlgodClient(round_time=0.02)
+    minter = AlgoRewardsNFTMinter(algod_client, account.generate_account()[0])
+    recipients = [account.generate_account()[1] for _ in range(MAX_GROUP_SIZE + 5)]
+    try:
+        algod_client.reset_counts()
+        results = minter.mint_badges_batch(recipients, "Session", "s", METADATA_URL, transfer=False)
+    finally:
+        minter.confirmations.close()
+
+    # Asset IDs come from block reads, not one lookup per badge
+    assert "pending_transaction_info" not in algod_client.call_counts
+    assert algod_client.call_counts["block_info"] <= 2
+    assert len(set(results.values())) == len(recipients)
+
+    template = BadgeMetadataTemplate("Session", "s")
+    for recipient, asset_id in results.items():
+        params = algod_client.asset_info(asset_id)["params"]
+        assert params["metadata-hash"] == template.metadata_hash(recipient)
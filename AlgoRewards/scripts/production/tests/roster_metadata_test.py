@@ -0,0 +1,25 @@
+import pytest
+
+from roster_metadata import read_roster
+
+
+def test_csv_attributes_column_is_parsed_as_json(tmp_path) -> None:
+    roster = tmp_path / "roster.csv"
+    roster.write_text(
+        'address,name,attributes,track\n'
+        'ADDR1,Ada,"{""level"": 3}",defi\n'
+        'ADDR2,,,\n',
+        encoding="utf-8",
+    )
+    assert list(read_roster(str(roster))) == [
+        ("ADDR1", {"level": 3, "attendee_name": "Ada", "track": "defi"}),
+        ("ADDR2", {}),
+    ]
+
+
+@pytest.mark.parametrize("attributes", ['"{not json}"', '"[1, 2]"'])
+def test_csv_attributes_must_be_a_json_object(tmp_path, attributes) -> None:
+    roster = tmp_path / "roster.csv"
+    roster.write_text(f"address,attributes\nADDR1,{attributes}\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="row 1 attributes"):
+        list(read_roster(str(roster)))
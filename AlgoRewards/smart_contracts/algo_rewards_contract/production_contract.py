@@ -1,7 +1,36 @@
-from algopy import ARC4Contract, String, UInt64
+import typing
+
+from algopy import (
+    ARC4Contract,
+    BigUInt,
+    Bytes,
+    Global,
+    OpUpFeeSource,
+    String,
+    Txn,
+    UInt64,
+    arc4,
+    ensure_budget,
+    op,
+    subroutine,
+)
 from algopy.arc4 import abimethod
 
 
+Bytes32: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
+# Approximate opcode cost of one proof level (sha256 is 35 of it)
+PROOF_LEVEL_COST = 60
+
+
+@subroutine
+def merkle_parent(a: Bytes, b: Bytes) -> Bytes:
+    """Hash a sorted pair of nodes: sha256(0x01 || min || max)"""
+    if BigUInt.from_bytes(a) < BigUInt.from_bytes(b):
+        return op.sha256(b"\x01" + a + b)
+    return op.sha256(b"\x01" + b + a)
+
+
 class AlgoRewardsContract(ARC4Contract):
     """
     AlgoRewards - Session 3 MVP Contract
@@ -9,27 +38,50 @@ class AlgoRewardsContract(ARC4Contract):
     
     This contract handles Session 3 validation and authorization.
     Actual NFT minting is handled off-chain for better performance and flexibility.
+    Attendance is proven against a Merkle root of the attendee list.
     """
     
+    def __init__(self) -> None:
+        # Merkle root of the Session 3 attendee list (empty until set)
+        self.attendance_root = Bytes()
+    
+    @abimethod()
+    def set_attendance_root(self, root: Bytes32) -> None:
+        """
+        Publish the Merkle root of the Session 3 attendee list
+        
+        Args:
+            root: Root built by scripts/production/attendance_merkle.py
+        """
+        assert Txn.sender == Global.creator_address, "Only the creator can set the attendance root"
+        self.attendance_root = root.bytes
+    
     @abimethod()
     def verify_session3_attendance(
         self, 
-        attendee_address: String,
-        verification_code: String
+        attendee_address: arc4.Address,
+        proof: arc4.DynamicArray[Bytes32]
     ) -> UInt64:
         """
         Verify attendance for Session 3
         
         Args:
             attendee_address: Address of the attendee
-            verification_code: Verification code provided by organizer
+            proof: Sibling hashes from the attendee's leaf up to the root
             
         Returns:
             1 if verified, 0 if not verified
         """
-        # For MVP, accept any valid address and verification code
-        # In production, this would check actual session data and verification codes
-        if len(attendee_address) > 0 and len(verification_code) > 0:
+        if self.attendance_root.length == 0:
+            return UInt64(0)
+        
+        # Large rosters need more than one call's budget; op-ups are paid from the group's fees
+        ensure_budget(proof.length * PROOF_LEVEL_COST + 100, OpUpFeeSource.GroupCredit)
+        node = op.sha256(b"\x00" + attendee_address.bytes)
+        for sibling in proof:
+            node = merkle_parent(node, sibling.bytes)
+        
+        if node == self.attendance_root:
             return UInt64(1)
         return UInt64(0)
     